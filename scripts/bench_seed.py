@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Benchmark `notion-synth seed`-style loads: rows/sec with and without the bulk-load fast path,
+and for the columnar engine (`--engine columnar`: `iter_fixture_batches` -> `import_fixture_batches`).
+
+Usage:
+  python scripts/bench_seed.py --rows 100000 --rows 1000000 [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from notion_synth.db import connect
+from notion_synth.fixtures import import_fixture, import_fixture_batches
+from notion_synth.generator import SyntheticWorkspaceConfig, generate_fixture, iter_fixture_batches
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, action="append", help="Approximate fixture size (repeatable).")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Generation runs per engine; the fastest is reported."
+    )
+    args = parser.parse_args()
+
+    for rows in args.rows or [100_000, 1_000_000]:
+        # Half users, half database rows (split across the three generated databases).
+        config = SyntheticWorkspaceConfig(
+            company_name="Bench Co",
+            seed=args.seed,
+            user_count=rows // 2,
+            project_count=rows // 4,
+            incident_count=rows // 8,
+            candidate_count=rows // 8,
+        )
+        generate_s = float("inf")
+        for _ in range(max(args.repeat, 1)):
+            started = time.perf_counter()
+            fixture = generate_fixture(config)
+            generate_s = min(generate_s, time.perf_counter() - started)
+        total = sum(
+            len(items)
+            for items in (
+                fixture.workspaces,
+                fixture.users,
+                fixture.pages,
+                fixture.databases,
+                fixture.database_rows,
+                fixture.comments,
+            )
+        )
+
+        for bulk in (False, True):
+            with tempfile.TemporaryDirectory() as tmp:
+                db = connect(str(Path(tmp) / "bench.db"))
+                try:
+                    started = time.perf_counter()
+                    import_fixture(db, fixture, mode="replace", bulk=bulk)
+                    import_s = time.perf_counter() - started
+                finally:
+                    db.close()
+            print(
+                json.dumps(
+                    {
+                        "rows": total,
+                        "engine": "standard",
+                        "bulk": bulk,
+                        "generate_s": round(generate_s, 3),
+                        "import_s": round(import_s, 3),
+                        "import_rows_per_s": round(total / import_s),
+                        "seed_rows_per_s": round(total / (generate_s + import_s)),
+                    }
+                ),
+                flush=True,
+            )
+
+        columnar_generate_s = float("inf")
+        for _ in range(max(args.repeat, 1)):
+            started = time.perf_counter()
+            for _ in iter_fixture_batches(config):
+                pass
+            columnar_generate_s = min(columnar_generate_s, time.perf_counter() - started)
+        with tempfile.TemporaryDirectory() as tmp:
+            db = connect(str(Path(tmp) / "bench.db"))
+            try:
+                started = time.perf_counter()
+                import_fixture_batches(db, iter_fixture_batches(config), mode="replace")
+                seed_s = time.perf_counter() - started
+            finally:
+                db.close()
+        print(
+            json.dumps(
+                {
+                    "rows": total,
+                    "engine": "columnar",
+                    "generate_s": round(columnar_generate_s, 3),
+                    "generate_rows_per_s": round(total / columnar_generate_s),
+                    "generate_speedup": round(generate_s / columnar_generate_s, 1),
+                    "seed_rows_per_s": round(total / seed_s),
+                }
+            ),
+            flush=True,
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from pydantic import BaseModel
+
+from notion_synth.blueprint_models import PLACEHOLDER_PATTERN, Blueprint, NotionPlan
+
+
+@dataclass
+class BlueprintDiff:
+    """Spec-level change set between two blueprints' Notion plans (synth ids, in plan order)."""
+
+    creates: list[str] = field(default_factory=list)
+    updates: list[str] = field(default_factory=list)
+    archives: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def changed(self) -> set[str]:
+        return {*self.creates, *self.updates}
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "creates": len(self.creates),
+            "updates": len(self.updates),
+            "archives": len(self.archives),
+            "unchanged": self.unchanged,
+        }
+
+
+def diff_blueprints(old: Blueprint, new: Blueprint) -> BlueprintDiff:
+    """
+    Compare the Notion plans of `old` and `new` spec by spec, keyed by synth id.
+
+    Specs are compared as models, so nothing is serialized or hashed. An unchanged page that
+    mentions a newly created page still counts as an update, since the mention can only resolve
+    once its target exists. Objects only present in `old` are archives.
+    """
+    previous = _specs(old.notion_plan)
+    current = _specs(new.notion_plan)
+    created = {synth_id for synth_id in current if synth_id not in previous}
+    diff = BlueprintDiff(archives=[synth_id for synth_id in previous if synth_id not in current])
+    for synth_id, spec in current.items():
+        if synth_id in created:
+            diff.creates.append(synth_id)
+        elif previous[synth_id] != spec or (created and _mentions_any(spec, created)):
+            diff.updates.append(synth_id)
+        else:
+            diff.unchanged += 1
+    return diff
+
+
+def plan_synth_ids(plan: NotionPlan) -> list[str]:
+    return list(_specs(plan))
+
+
+def _specs(plan: NotionPlan) -> dict[str, BaseModel]:
+    specs: list[Any] = [*plan.roots, *plan.databases, *plan.pages, *plan.rows, *plan.comments]
+    return {spec.synth_id: spec for spec in specs}
+
+
+def _mentions_any(spec: BaseModel, synth_ids: set[str]) -> bool:
+    for block in getattr(spec, "blocks", ()):
+        for match in PLACEHOLDER_PATTERN.finditer(block.text or ""):
+            if match.group("kind") == "page" and match.group("id") in synth_ids:
+                return True
+    return False
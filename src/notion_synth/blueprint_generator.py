@@ -20,7 +20,7 @@ from notion_synth.blueprint_models import (
     RowPropertySpec,
     RowSpec,
 )
-from notion_synth.util import stable_uuid, utc_now
+from notion_synth.util import ordered_map, stable_uuid, utc_now
 
 
 @dataclass(frozen=True)
@@ -47,7 +47,16 @@ SCALE_PRESETS = {
 def generate_blueprint(
     config: BlueprintConfig,
     roster: list[IdentityUser],
+    *,
+    workers: int = 1,
 ) -> Blueprint:
+    """
+    Build the identity + Notion plan for `roster`, deterministic by seed.
+
+    Database rows are built in `BLUEPRINT_SHARD_SIZE` shards, each seeded by
+    `(seed, kind, shard start)`, across `workers` processes (1 = inline) and merged in shard
+    order, so the output is the same for any worker count.
+    """
     # Deterministic synthetic fixture generation by seed.
     rng = random.Random(config.seed)  # nosec B311
     preset = SCALE_PRESETS.get(config.scale, SCALE_PRESETS["small"])
@@ -309,7 +318,7 @@ def generate_blueprint(
         ),
     ]
 
-    rows = _build_rows(config, roster, teams, preset, rng)
+    rows = _build_rows(config, roster, teams, preset, workers)
     comments = _build_comments(config, pages, roster, rng)
     activity_stream = _build_activity_stream(config, pages, rows, rng)
 
@@ -336,79 +345,107 @@ def _paragraph_blocks(lines: list[str]) -> list[BlockSpec]:
     return blocks
 
 
+# Rows per `generate_blueprint` shard.
+BLUEPRINT_SHARD_SIZE = 500
+
+_ROW_BASE_DATE = datetime(2026, 1, 10, tzinfo=UTC)
+
+
+@dataclass(frozen=True)
+class _RowContext:
+    company: str
+    seed: int
+    owners: list[str]
+    teams: list[str]
+
+
 def _build_rows(
     config: BlueprintConfig,
     roster: list[IdentityUser],
     teams: list[str],
     preset: dict[str, int],
-    rng: random.Random,
+    workers: int = 1,
 ) -> list[RowSpec]:
-    rows: list[RowSpec] = []
-    base_date = datetime(2026, 1, 10, tzinfo=UTC)
+    context = _RowContext(
+        company=config.company,
+        seed=config.seed,
+        owners=[user.synth_user_id for user in roster],
+        teams=teams,
+    )
+    counts = {"project": preset["projects"], "task": preset["tasks"], "incident": preset["incidents"]}
+    shards = [
+        (kind, start, min(BLUEPRINT_SHARD_SIZE, total - start))
+        for kind, total in counts.items()
+        for start in range(0, total, BLUEPRINT_SHARD_SIZE)
+    ]
+    return [row for batch in ordered_map(_build_row_shard, context, shards, workers=workers) for row in batch]
+
+
+def _build_row_shard(context: _RowContext, shard: tuple[str, int, int]) -> list[RowSpec]:
+    kind, start, count = shard
+    rng = random.Random(f"{context.seed}:{kind}:{start}")  # nosec B311
+    build = _ROW_BUILDERS[kind]
+    return [build(context, index, rng) for index in range(start, start + count)]
+
+
+def _project_row(context: _RowContext, index: int, rng: random.Random) -> RowSpec:
+    owner = rng.choice(context.owners) if context.owners else ""
+    team = context.teams[index % len(context.teams)]
+    return RowSpec(
+        synth_id=f"row_{stable_uuid(f'{context.company}:project:{index}')}",
+        database_synth_id=f"db_{stable_uuid(f'{context.company}:projects')}",
+        properties=[
+            RowPropertySpec(name="Name", type="title", value=f"Project {index + 1}: {rng.choice(_PROJECT_NAMES)}"),
+            RowPropertySpec(name="Owner", type="people", value=[owner] if owner else []),
+            RowPropertySpec(name="Team", type="select", value=team),
+            RowPropertySpec(name="Status", type="select", value=rng.choice(["Planned", "In Progress", "On Hold", "Done"])),
+            RowPropertySpec(name="Target", type="date", value=(_ROW_BASE_DATE + timedelta(days=index * 7)).date().isoformat()),
+        ],
+    )
 
-    projects_db_id = f"db_{stable_uuid(f'{config.company}:projects')}"
-    for index in range(preset["projects"]):
-        owner = rng.choice(roster).synth_user_id if roster else ""
-        team = teams[index % len(teams)]
-        rows.append(
-            RowSpec(
-                synth_id=f"row_{stable_uuid(f'{config.company}:project:{index}')}",
-                database_synth_id=projects_db_id,
-                properties=[
-                    RowPropertySpec(name="Name", type="title", value=f"Project {index + 1}: {rng.choice(_PROJECT_NAMES)}"),
-                    RowPropertySpec(name="Owner", type="people", value=[owner] if owner else []),
-                    RowPropertySpec(name="Team", type="select", value=team),
-                    RowPropertySpec(name="Status", type="select", value=rng.choice(["Planned", "In Progress", "On Hold", "Done"])),
-                    RowPropertySpec(name="Target", type="date", value=(base_date + timedelta(days=index * 7)).date().isoformat()),
-                ],
-            )
-        )
 
-    tasks_db_id = f"db_{stable_uuid(f'{config.company}:tasks')}"
-    for index in range(preset["tasks"]):
-        owner = rng.choice(roster).synth_user_id if roster else ""
-        team = teams[index % len(teams)]
-        rows.append(
-            RowSpec(
-                synth_id=f"row_{stable_uuid(f'{config.company}:task:{index}')}",
-                database_synth_id=tasks_db_id,
-                properties=[
-                    RowPropertySpec(name="Task", type="title", value=f"{rng.choice(_TASK_VERBS)} {rng.choice(_TASK_OBJECTS)}"),
-                    RowPropertySpec(name="Owner", type="people", value=[owner] if owner else []),
-                    RowPropertySpec(name="Team", type="select", value=team),
-                    RowPropertySpec(name="Status", type="select", value=rng.choice(["Todo", "In Progress", "Blocked", "Done"])),
-                    RowPropertySpec(name="Due", type="date", value=(base_date + timedelta(days=index % 30)).date().isoformat()),
-                    RowPropertySpec(name="Priority", type="select", value=rng.choice(["P0", "P1", "P2"])),
-                ],
-            )
-        )
+def _task_row(context: _RowContext, index: int, rng: random.Random) -> RowSpec:
+    owner = rng.choice(context.owners) if context.owners else ""
+    team = context.teams[index % len(context.teams)]
+    return RowSpec(
+        synth_id=f"row_{stable_uuid(f'{context.company}:task:{index}')}",
+        database_synth_id=f"db_{stable_uuid(f'{context.company}:tasks')}",
+        properties=[
+            RowPropertySpec(name="Task", type="title", value=f"{rng.choice(_TASK_VERBS)} {rng.choice(_TASK_OBJECTS)}"),
+            RowPropertySpec(name="Owner", type="people", value=[owner] if owner else []),
+            RowPropertySpec(name="Team", type="select", value=team),
+            RowPropertySpec(name="Status", type="select", value=rng.choice(["Todo", "In Progress", "Blocked", "Done"])),
+            RowPropertySpec(name="Due", type="date", value=(_ROW_BASE_DATE + timedelta(days=index % 30)).date().isoformat()),
+            RowPropertySpec(name="Priority", type="select", value=rng.choice(["P0", "P1", "P2"])),
+        ],
+    )
 
-    incidents_db_id = f"db_{stable_uuid(f'{config.company}:incidents')}"
-    for index in range(preset["incidents"]):
-        owner = rng.choice(roster).synth_user_id if roster else ""
-        rows.append(
-            RowSpec(
-                synth_id=f"row_{stable_uuid(f'{config.company}:incident:{index}')}",
-                database_synth_id=incidents_db_id,
-                properties=[
-                    RowPropertySpec(name="Title", type="title", value=f"INC-{1000 + index} {rng.choice(_INCIDENT_SUMMARIES)}"),
-                    RowPropertySpec(name="Severity", type="select", value=rng.choice(["SEV1", "SEV2", "SEV3"])),
-                    RowPropertySpec(name="Status", type="select", value=rng.choice(["Resolved", "Monitoring", "Postmortem"])),
-                    RowPropertySpec(name="Owner", type="people", value=[owner] if owner else []),
-                    RowPropertySpec(
-                        name="Detected",
-                        type="date",
-                        value=(base_date + timedelta(days=index)).date().isoformat(),
-                    ),
-                    RowPropertySpec(
-                        name="Resolved",
-                        type="date",
-                        value=(base_date + timedelta(days=index + 2)).date().isoformat(),
-                    ),
-                ],
-            )
-        )
-    return rows
+
+def _incident_row(context: _RowContext, index: int, rng: random.Random) -> RowSpec:
+    owner = rng.choice(context.owners) if context.owners else ""
+    return RowSpec(
+        synth_id=f"row_{stable_uuid(f'{context.company}:incident:{index}')}",
+        database_synth_id=f"db_{stable_uuid(f'{context.company}:incidents')}",
+        properties=[
+            RowPropertySpec(name="Title", type="title", value=f"INC-{1000 + index} {rng.choice(_INCIDENT_SUMMARIES)}"),
+            RowPropertySpec(name="Severity", type="select", value=rng.choice(["SEV1", "SEV2", "SEV3"])),
+            RowPropertySpec(name="Status", type="select", value=rng.choice(["Resolved", "Monitoring", "Postmortem"])),
+            RowPropertySpec(name="Owner", type="people", value=[owner] if owner else []),
+            RowPropertySpec(
+                name="Detected",
+                type="date",
+                value=(_ROW_BASE_DATE + timedelta(days=index)).date().isoformat(),
+            ),
+            RowPropertySpec(
+                name="Resolved",
+                type="date",
+                value=(_ROW_BASE_DATE + timedelta(days=index + 2)).date().isoformat(),
+            ),
+        ],
+    )
+
+
+_ROW_BUILDERS = {"project": _project_row, "task": _task_row, "incident": _incident_row}
 
 
 def _build_comments(
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import re
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
+# `[[synth:page:<synth_id>]]` / `[[synth:user:<synth_user_id>]]` references inside block and comment text.
+PLACEHOLDER_PATTERN = re.compile(r"\[\[synth:(?P<kind>page|user):(?P<id>[a-zA-Z0-9_\-:]+)\]\]")
+
 
 class IdentityUser(BaseModel):
     synth_user_id: str
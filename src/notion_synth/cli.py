@@ -1,17 +1,37 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import sys
 import time
+from collections.abc import Iterator
+from dataclasses import asdict
 from pathlib import Path
+from typing import cast
 
 from notion_synth.audit import AuditLog
+from notion_synth.blueprint_diff import BlueprintDiff, diff_blueprints, plan_synth_ids
 from notion_synth.blueprint_generator import BlueprintConfig, generate_blueprint
 from notion_synth.blueprint_models import Blueprint
 from notion_synth.db import Database, connect
-from notion_synth.fixtures import export_fixture, import_fixture
-from notion_synth.generator import PROFILES, SyntheticWorkspaceConfig, generate_fixture
+from notion_synth.fixtures import (
+    IMPORT_CHUNK_SIZE,
+    export_fixture,
+    import_fixture,
+    import_fixture_batches,
+    import_fixture_records,
+    iter_batches_ndjson,
+    iter_fixture_ndjson,
+    iter_ndjson_records,
+)
+from notion_synth.generator import (
+    PROFILES,
+    SyntheticWorkspaceConfig,
+    fixture_exported_at,
+    generate_fixture,
+    iter_fixture_batches,
+)
 from notion_synth.llm.enrich import enrich_blueprint
 from notion_synth.models import Fixture
 from notion_synth.packs import FixturePack, get_pack, list_packs
@@ -19,16 +39,41 @@ from notion_synth.providers.entra.apply import apply_entra
 from notion_synth.providers.entra.graph import GraphClient
 from notion_synth.providers.entra.verify import verify_provisioning
 from notion_synth.providers.notion.apply import (
+    ApplyResult,
     apply_blueprint,
+    apply_blueprint_async,
     destroy_blueprint,
+    destroy_blueprint_async,
     run_activity,
     verify_users,
 )
-from notion_synth.providers.notion.client import NotionClient
+from notion_synth.providers.notion.client import AsyncNotionClient, NotionClient
+from notion_synth.providers.notion.users import USER_CACHE_TTL_SECONDS
 from notion_synth.roster import RosterConfig, generate_roster, load_roster
-from notion_synth.state import connect_state, record_run_finish, record_run_start
+from notion_synth.state import (
+    StateStore,
+    connect_state,
+    count_objects,
+    get_run,
+    get_run_baseline,
+    identities_changed_since,
+    latest_applied_blueprint,
+    load_applied_blueprint,
+    record_run_finish,
+    record_run_resume,
+    record_run_start,
+    save_applied_blueprint,
+    save_run_baseline,
+)
 from notion_synth.util import stable_hash, utc_now
 
+_PREFETCH_HELP = (
+    "How to check existing Entra users/groups: one paged tenant listing (always), "
+    "batched per-user lookups (never), whichever needs fewer requests (auto), or a directory "
+    "cached in --state and refreshed with Graph delta queries (delta). Default: delta for "
+    "verify-provisioning and --mode sync, auto otherwise."
+)
+
 
 def main(argv: list[str] | None = None) -> int:
     parser = argparse.ArgumentParser(
@@ -81,6 +126,12 @@ def main(argv: list[str] | None = None) -> int:
         default="-",
         help="Write fixture JSON to a file path (default: stdout).",
     )
+    export_parser.add_argument(
+        "--format",
+        choices=["json", "ndjson"],
+        default="json",
+        help="Output format: ndjson streams one record per line with flat memory use.",
+    )
 
     import_parser = subparsers.add_parser(
         "import",
@@ -98,6 +149,23 @@ def main(argv: list[str] | None = None) -> int:
         default="replace",
         help="Import mode: replace wipes existing data, merge upserts.",
     )
+    import_parser.add_argument(
+        "--format",
+        choices=["auto", "json", "ndjson"],
+        default="auto",
+        help="Fixture format (auto: ndjson for .ndjson/.jsonl paths, otherwise json).",
+    )
+    import_parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=IMPORT_CHUNK_SIZE,
+        help="Records validated and inserted per batch.",
+    )
+    import_parser.add_argument(
+        "--progress",
+        action="store_true",
+        help="Print running per-table counts to stderr after each batch.",
+    )
 
     profiles_parser = subparsers.add_parser("profiles", help="Synthetic data profile utilities.")
     profiles_sub = profiles_parser.add_subparsers(dest="profiles_command", required=True)
@@ -152,6 +220,12 @@ def main(argv: list[str] | None = None) -> int:
     entra_apply.add_argument("--company", required=True)
     entra_apply.add_argument("--report", default="entra_apply_report.json")
     entra_apply.add_argument("--state", default=None)
+    entra_apply.add_argument(
+        "--prefetch",
+        choices=["auto", "always", "never", "delta"],
+        default=None,
+        help=_PREFETCH_HELP,
+    )
 
     entra_verify = entra_sub.add_parser("verify-provisioning", help="Verify Entra -> Notion SCIM.")
     entra_verify.add_argument("--roster", required=True)
@@ -165,6 +239,18 @@ def main(argv: list[str] | None = None) -> int:
     entra_verify.add_argument("--require-all", action="store_true")
     entra_verify.add_argument("--wait-minutes", type=int, default=0)
     entra_verify.add_argument("--interval-seconds", type=int, default=60)
+    entra_verify.add_argument(
+        "--user-cache-ttl",
+        type=float,
+        default=USER_CACHE_TTL_SECONDS,
+        help="Seconds to reuse the Notion user directory cached in --state (0 always re-lists).",
+    )
+    entra_verify.add_argument(
+        "--prefetch",
+        choices=["auto", "always", "never", "delta"],
+        default=None,
+        help=_PREFETCH_HELP,
+    )
 
     blueprint_parser = subparsers.add_parser("blueprint", help="Blueprint utilities.")
     blueprint_sub = blueprint_parser.add_subparsers(dest="blueprint_command", required=True)
@@ -175,6 +261,16 @@ def main(argv: list[str] | None = None) -> int:
     blueprint_generate.add_argument("--output", "-o", required=True)
     blueprint_generate.add_argument("--profile", default="engineering")
     blueprint_generate.add_argument("--scale", default="small")
+    blueprint_generate.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Build rows in seeded shards across N processes (output is the same for any N).",
+    )
+    blueprint_diff = blueprint_sub.add_parser("diff", help="List Notion plan changes between two blueprints.")
+    blueprint_diff.add_argument("old")
+    blueprint_diff.add_argument("new")
+    blueprint_diff.add_argument("--output", "-o", default="-")
 
     notion_parser = subparsers.add_parser("notion", help="Notion apply/verify.")
     notion_sub = notion_parser.add_subparsers(dest="notion_command", required=True)
@@ -184,6 +280,12 @@ def main(argv: list[str] | None = None) -> int:
     notion_verify.add_argument("--token", required=True)
     notion_verify.add_argument("--report", default="notion_verify_report.json")
     notion_verify.add_argument("--require-all", action="store_true")
+    notion_verify.add_argument(
+        "--user-cache-ttl",
+        type=float,
+        default=USER_CACHE_TTL_SECONDS,
+        help="Seconds to reuse the Notion user directory cached in --state (0 always re-lists).",
+    )
 
     notion_validate = notion_sub.add_parser("validate-root", help="Validate root page access.")
     notion_validate.add_argument("--root-page-id", required=True)
@@ -198,12 +300,35 @@ def main(argv: list[str] | None = None) -> int:
     notion_apply.add_argument("--audit-dir", default="audit")
     notion_apply.add_argument("--mode", choices=["apply", "plan"], default="apply")
     notion_apply.add_argument("--redact-emails", action="store_true")
+    notion_apply.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Run up to N independent creates at once (async engine; parents are created first).",
+    )
+    notion_apply.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        default=None,
+        help="Continue an interrupted apply run from its last checkpoint (same blueprint and state DB).",
+    )
+    notion_apply.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only apply what changed since the last successful apply to this root (full apply if none).",
+    )
 
     notion_destroy = notion_sub.add_parser("destroy", help="Archive created pages.")
     notion_destroy.add_argument("--token", required=True)
     notion_destroy.add_argument("--state", default=None)
     notion_destroy.add_argument("--audit-dir", default="audit")
     notion_destroy.add_argument("--redact-emails", action="store_true")
+    notion_destroy.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Archive up to N top-level pages/databases at once (rate limits still apply).",
+    )
 
     notion_activity = notion_sub.add_parser("activity", help="Run synthetic activity.")
     notion_activity.add_argument("blueprint")
@@ -226,14 +351,32 @@ def main(argv: list[str] | None = None) -> int:
     llm_enrich.add_argument("--api-key", default=None)
 
     args = parser.parse_args(argv)
+    if args.command in {"generate", "seed"} and args.workers is not None and args.engine != "columnar":
+        parser.error("--workers requires --engine columnar")
+    if args.command == "notion" and args.notion_command in {"apply", "destroy"} and args.concurrency < 1:
+        parser.error("--concurrency must be >= 1")
+    if args.command == "notion" and args.notion_command == "apply" and args.resume and args.mode != "apply":
+        parser.error("--resume requires --mode apply")
 
     if args.command == "generate":
-        fixture = generate_fixture(_config_from_args(args))
+        config = _config_from_args(args)
+        if args.engine == "columnar":
+            batches = iter_fixture_batches(config, workers=args.workers or 1)
+            _write_chunks(args.output, iter_batches_ndjson(batches, exported_at=fixture_exported_at(config)))
+            return 0
+        fixture = generate_fixture(config)
         _write_fixture(args.output, fixture)
         return 0
 
     elif args.command == "seed":
-        fixture = generate_fixture(_config_from_args(args))
+        config = _config_from_args(args)
+        if args.engine == "columnar":
+            db = connect(args.db)
+            batches = iter_fixture_batches(config, workers=args.workers or 1)
+            fixture_result = import_fixture_batches(db, batches, mode=args.mode)
+            print(json.dumps(fixture_result.model_dump(), indent=2))
+            return 0
+        fixture = generate_fixture(config)
         db = connect(args.db)
         fixture_result = import_fixture(db, fixture, mode=args.mode)
         print(json.dumps(fixture_result.model_dump(), indent=2))
@@ -241,14 +384,34 @@ def main(argv: list[str] | None = None) -> int:
 
     elif args.command == "export":
         db = connect(args.db)
+        if args.format == "ndjson":
+            _write_chunks(args.output, iter_fixture_ndjson(db))
+            return 0
         fixture = export_fixture(db)
         _write_fixture(args.output, fixture)
         return 0
 
     elif args.command == "import":
-        fixture = _load_fixture(args.fixture)
-        db = connect(args.db)
-        fixture_result = import_fixture(db, fixture, mode=args.mode)
+        progress = _print_import_progress if args.progress else None
+        import_format = args.format
+        if import_format == "auto":
+            import_format = "ndjson" if Path(args.fixture).suffix in {".ndjson", ".jsonl"} else "json"
+        if import_format == "ndjson":
+            db = connect(args.db)
+            with Path(args.fixture).open("rb") as handle:
+                fixture_result = import_fixture_records(
+                    db,
+                    iter_ndjson_records(handle),
+                    mode=args.mode,
+                    chunk_size=args.chunk_size,
+                    progress=progress,
+                )
+        else:
+            fixture = _load_fixture(args.fixture)
+            db = connect(args.db)
+            fixture_result = import_fixture(
+                db, fixture, mode=args.mode, chunk_size=args.chunk_size, progress=progress
+            )
         print(json.dumps(fixture_result.model_dump(), indent=2))
         return 0
 
@@ -353,6 +516,7 @@ def main(argv: list[str] | None = None) -> int:
                 store=store,
                 mode=args.mode,
                 dry_run=args.dry_run,
+                prefetch=args.prefetch or ("delta" if args.mode == "sync" else "auto"),
             )
             _write_json(Path(args.report), apply_result.__dict__)
             record_run_finish(store, run_id, "ok")
@@ -361,58 +525,60 @@ def main(argv: list[str] | None = None) -> int:
         except Exception:
             record_run_finish(store, run_id, "error")
             raise
+        finally:
+            graph_client.close()
 
     elif args.command == "entra" and args.entra_command == "verify-provisioning":
         roster = load_roster(args.roster)
-        graph = GraphClient(
-            tenant_id=args.tenant_id,
-            client_id=args.client_id,
-            client_secret=args.client_secret,
-        )
-        notion = NotionClient(token=args.token)
         store = connect_state(args.state)
         run_id = stable_hash({"command": "entra-verify", "timestamp": utc_now()})
         record_run_start(store, run_id, "entra-verify", _hash_roster(args.roster))
         deadline = time.time() + (args.wait_minutes * 60)
         provisioning_report = None
-        try:
-            while True:
-                provisioning_report = verify_provisioning(
-                    graph=graph,
-                    notion=notion,
-                    roster=roster,
-                    company=args.company,
-                    store=store,
-                )
-                if (
-                    not provisioning_report.missing_in_notion
-                    and not provisioning_report.missing_in_entra
-                    and not provisioning_report.missing_groups
+        with (
+            GraphClient(tenant_id=args.tenant_id, client_id=args.client_id, client_secret=args.client_secret) as graph,
+            NotionClient.from_env(args.token) as notion,
+        ):
+            try:
+                while True:
+                    provisioning_report = verify_provisioning(
+                        graph=graph,
+                        notion=notion,
+                        roster=roster,
+                        company=args.company,
+                        store=store,
+                        prefetch=args.prefetch or "delta",
+                        user_cache_ttl=args.user_cache_ttl,
+                    )
+                    if (
+                        not provisioning_report.missing_in_notion
+                        and not provisioning_report.missing_in_entra
+                        and not provisioning_report.missing_groups
+                    ):
+                        break
+                    if time.time() >= deadline:
+                        break
+                    time.sleep(max(5, args.interval_seconds))
+                verify_payload = {
+                    "matched": provisioning_report.matched if provisioning_report else 0,
+                    "total": provisioning_report.total if provisioning_report else 0,
+                    "missing_in_entra": provisioning_report.missing_in_entra if provisioning_report else [],
+                    "missing_in_notion": provisioning_report.missing_in_notion if provisioning_report else [],
+                    "missing_groups": provisioning_report.missing_groups if provisioning_report else [],
+                }
+                _write_json(Path(args.report), verify_payload)
+                record_run_finish(store, run_id, "ok")
+                print(json.dumps(verify_payload, indent=2))
+                if args.require_all and (
+                    verify_payload["missing_in_entra"]
+                    or verify_payload["missing_in_notion"]
+                    or verify_payload["missing_groups"]
                 ):
-                    break
-                if time.time() >= deadline:
-                    break
-                time.sleep(max(5, args.interval_seconds))
-            verify_payload = {
-                "matched": provisioning_report.matched if provisioning_report else 0,
-                "total": provisioning_report.total if provisioning_report else 0,
-                "missing_in_entra": provisioning_report.missing_in_entra if provisioning_report else [],
-                "missing_in_notion": provisioning_report.missing_in_notion if provisioning_report else [],
-                "missing_groups": provisioning_report.missing_groups if provisioning_report else [],
-            }
-            _write_json(Path(args.report), verify_payload)
-            record_run_finish(store, run_id, "ok")
-            print(json.dumps(verify_payload, indent=2))
-            if args.require_all and (
-                verify_payload["missing_in_entra"]
-                or verify_payload["missing_in_notion"]
-                or verify_payload["missing_groups"]
-            ):
-                return 2
-            return 0
-        except Exception:
-            record_run_finish(store, run_id, "error")
-            raise
+                    return 2
+                return 0
+            except Exception:
+                record_run_finish(store, run_id, "error")
+                raise
 
     elif args.command == "blueprint" and args.blueprint_command == "generate":
         roster = load_roster(args.roster)
@@ -424,15 +590,26 @@ def main(argv: list[str] | None = None) -> int:
                 scale=args.scale,
             ),
             roster=roster,
+            workers=args.workers,
         )
         _write_blueprint(args.output, blueprint)
         return 0
 
+    elif args.command == "blueprint" and args.blueprint_command == "diff":
+        blueprint_changes = diff_blueprints(_load_blueprint(args.old), _load_blueprint(args.new))
+        _write_payload(args.output, {"summary": blueprint_changes.summary(), **asdict(blueprint_changes)})
+        return 0
+
     elif args.command == "notion" and args.notion_command == "verify-users":
         roster = load_roster(args.roster)
         store = connect_state(args.state)
-        notion_client = NotionClient(token=args.token)
-        verify_result = verify_users(notion_client, store, [user.model_dump() for user in roster])
+        with NotionClient.from_env(args.token) as notion_client:
+            verify_result = verify_users(
+                notion_client,
+                store,
+                [user.model_dump() for user in roster],
+                user_cache_ttl=args.user_cache_ttl,
+            )
         verify_report = {
             "matched": verify_result.matched,
             "total": verify_result.total,
@@ -445,12 +622,12 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     elif args.command == "notion" and args.notion_command == "validate-root":
-        notion_client = NotionClient(token=args.token)
-        try:
-            page = notion_client.get_page(args.root_page_id)
-            root_report = {"ok": True, "page_id": page.get("id")}
-        except Exception as exc:
-            root_report = {"ok": False, "error": str(exc)}
+        with NotionClient.from_env(args.token) as notion_client:
+            try:
+                page = notion_client.get_page(args.root_page_id)
+                root_report = {"ok": True, "page_id": page.get("id")}
+            except Exception as exc:
+                root_report = {"ok": False, "error": str(exc)}
         _write_json(Path(args.report), root_report)
         print(json.dumps(root_report, indent=2))
         return 0 if root_report["ok"] else 2
@@ -458,24 +635,59 @@ def main(argv: list[str] | None = None) -> int:
     elif args.command == "notion" and args.notion_command == "apply":
         blueprint = _load_blueprint(args.blueprint)
         store = connect_state(args.state)
-        run_id = stable_hash({"command": "notion-apply", "timestamp": utc_now()})
-        record_run_start(store, run_id, "notion-apply", stable_hash(blueprint.model_dump()))
+        blueprint_hash = stable_hash(blueprint.model_dump())
+        if args.resume:
+            run = get_run(store, args.resume)
+            if run is None or run["command"] != "notion-apply" or run["blueprint_hash"] != blueprint_hash:
+                print("Unknown run for this blueprint (see the `runs` table in the state DB).", file=sys.stderr)
+                return 2
+            run_id = args.resume
+            record_run_resume(store, run_id)
+            baseline_hash = get_run_baseline(store, run_id)
+        else:
+            run_id = stable_hash({"command": "notion-apply", "timestamp": utc_now()})
+            record_run_start(store, run_id, "notion-apply", blueprint_hash)
+            baseline_hash = _incremental_baseline(store, args.root_page_id) if args.incremental else None
+        baseline = load_applied_blueprint(store, baseline_hash) if baseline_hash else None
+        changes = diff_blueprints(Blueprint.model_validate_json(baseline), blueprint) if baseline else None
+        if changes is not None and not args.resume:
+            if _baseline_matches_state(store, blueprint, changes):
+                save_run_baseline(store, run_id, cast(str, baseline_hash))
+            else:
+                changes = None
         audit = AuditLog.open(args.audit_dir, run_id, redact_emails=args.redact_emails)
-        notion_client = NotionClient(token=args.token)
         try:
-            notion_apply_result = apply_blueprint(
-                blueprint,
-                root_page_id=args.root_page_id,
-                store=store,
-                client=notion_client,
-                audit=audit,
-                mode=args.mode,
-            )
+            if args.concurrency > 1:
+                notion_apply_result, http_stats = asyncio.run(
+                    _apply_concurrently(blueprint, args, store=store, audit=audit, run_id=run_id, changes=changes)
+                )
+            else:
+                with NotionClient.from_env(args.token) as notion_client:
+                    notion_apply_result = apply_blueprint(
+                        blueprint,
+                        root_page_id=args.root_page_id,
+                        store=store,
+                        client=notion_client,
+                        audit=audit,
+                        mode=args.mode,
+                        run_id=run_id,
+                        resume=bool(args.resume),
+                        changes=changes,
+                    )
+                    http_stats = notion_client.stats()
             record_run_finish(store, run_id, "ok")
-            print(json.dumps(notion_apply_result.__dict__, indent=2))
+            if args.mode == "apply":
+                save_applied_blueprint(store, blueprint_hash, args.root_page_id, blueprint.model_dump_json())
+            report: dict[str, object] = {"run_id": run_id, **notion_apply_result.__dict__, "http": http_stats}
+            if changes is not None:
+                report["changes"] = changes.summary()
+            print(json.dumps(report, indent=2))
             return 0
-        except Exception:
+        except BaseException:
+            # Also covers Ctrl-C and SIGTERM (raised as SystemExit inside the batched apply).
             record_run_finish(store, run_id, "error")
+            if args.mode == "apply":
+                print(f"Apply interrupted; continue with --resume {run_id}", file=sys.stderr)
             raise
 
     elif args.command == "notion" and args.notion_command == "destroy":
@@ -483,11 +695,15 @@ def main(argv: list[str] | None = None) -> int:
         run_id = stable_hash({"command": "notion-destroy", "timestamp": utc_now()})
         record_run_start(store, run_id, "notion-destroy", "n/a")
         audit = AuditLog.open(args.audit_dir, run_id, redact_emails=args.redact_emails)
-        notion_client = NotionClient(token=args.token)
         try:
-            archived = destroy_blueprint(store, notion_client, audit)
+            if args.concurrency > 1:
+                archived, http_stats = asyncio.run(_destroy_concurrently(args, store=store, audit=audit))
+            else:
+                with NotionClient.from_env(args.token) as notion_client:
+                    archived = destroy_blueprint(store, notion_client, audit)
+                    http_stats = notion_client.stats()
             record_run_finish(store, run_id, "ok")
-            print(json.dumps({"archived": archived}, indent=2))
+            print(json.dumps({"archived": archived, "http": http_stats}, indent=2))
             return 0
         except Exception:
             record_run_finish(store, run_id, "error")
@@ -499,7 +715,7 @@ def main(argv: list[str] | None = None) -> int:
         run_id = stable_hash({"command": "notion-activity", "timestamp": utc_now()})
         record_run_start(store, run_id, "notion-activity", stable_hash(blueprint.model_dump()))
         audit = AuditLog.open(args.audit_dir, run_id, redact_emails=args.redact_emails)
-        notion_client = NotionClient(token=args.token)
+        notion_client = NotionClient.from_env(args.token)
         try:
             executed = run_activity(
                 blueprint,
@@ -516,6 +732,8 @@ def main(argv: list[str] | None = None) -> int:
         except Exception:
             record_run_finish(store, run_id, "error")
             raise
+        finally:
+            notion_client.close()
 
     elif args.command == "llm" and args.llm_command == "enrich":
         blueprint = _load_blueprint(args.blueprint)
@@ -548,6 +766,18 @@ def _add_generation_args(parser: argparse.ArgumentParser) -> None:
     parser.add_argument("--projects", type=int, default=None, help="Number of projects.")
     parser.add_argument("--incidents", type=int, default=None, help="Number of incidents.")
     parser.add_argument("--candidates", type=int, default=None, help="Number of candidates.")
+    parser.add_argument(
+        "--engine",
+        choices=["standard", "columnar"],
+        default="standard",
+        help="columnar: high-volume batch generator (NDJSON output for generate).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Generate columnar shards across N processes (output is the same for any N).",
+    )
 
 
 def _config_from_args(args: argparse.Namespace) -> SyntheticWorkspaceConfig:
@@ -582,6 +812,59 @@ def _load_blueprint(path: str) -> Blueprint:
     return Blueprint.model_validate_json(raw)
 
 
+async def _apply_concurrently(
+    blueprint: Blueprint,
+    args: argparse.Namespace,
+    *,
+    store: StateStore,
+    audit: AuditLog,
+    run_id: str,
+    changes: BlueprintDiff | None,
+) -> tuple[ApplyResult, dict[str, object]]:
+    async with AsyncNotionClient.from_env(args.token) as client:
+        client.max_connections = max(client.max_connections, args.concurrency)
+        result = await apply_blueprint_async(
+            blueprint,
+            root_page_id=args.root_page_id,
+            store=store,
+            client=client,
+            audit=audit,
+            mode=args.mode,
+            concurrency=args.concurrency,
+            run_id=run_id,
+            resume=bool(args.resume),
+            changes=changes,
+        )
+        return result, client.stats()
+
+
+async def _destroy_concurrently(
+    args: argparse.Namespace, *, store: StateStore, audit: AuditLog
+) -> tuple[int, dict[str, object]]:
+    async with AsyncNotionClient.from_env(args.token) as client:
+        client.max_connections = max(client.max_connections, args.concurrency)
+        archived = await destroy_blueprint_async(store, client, audit, concurrency=args.concurrency)
+        return archived, client.stats()
+
+
+def _incremental_baseline(store: StateStore, root_page_id: str) -> str | None:
+    # Identity changes (e.g. `notion verify-users`) alter people/mention payloads without any
+    # blueprint change, so they force a full apply.
+    latest = latest_applied_blueprint(store, root_page_id)
+    if latest is None or identities_changed_since(store, latest["applied_at"]):
+        return None
+    return cast(str, latest["blueprint_hash"])
+
+
+def _baseline_matches_state(store: StateStore, blueprint: Blueprint, changes: BlueprintDiff) -> bool:
+    # A diff only covers what changed since the baseline; every object the baseline applied must
+    # still be tracked (a destroy or another state DB breaks that), else a full apply is needed.
+    created = set(changes.creates)
+    kept = [synth_id for synth_id in plan_synth_ids(blueprint.notion_plan) if synth_id not in created]
+    expected = [*kept, *changes.archives]
+    return count_objects(store, expected) == len(expected)
+
+
 def _write_json(path: Path, payload: dict[str, object]) -> None:
     path.write_text(json.dumps(payload, indent=2))
 
@@ -598,6 +881,21 @@ def _write_payload(output_path: str, payload: object) -> None:
     Path(output_path).write_text(rendered)
 
 
+def _print_import_progress(inserted: dict[str, int]) -> None:
+    counts = " ".join(f"{table}={count}" for table, count in inserted.items() if count)
+    print(f"imported {sum(inserted.values())} records ({counts})", file=sys.stderr)
+
+
+def _write_chunks(output_path: str, chunks: Iterator[str]) -> None:
+    if output_path == "-":
+        for chunk in chunks:
+            sys.stdout.write(chunk)
+        return
+    with Path(output_path).open("w") as handle:
+        for chunk in chunks:
+            handle.write(chunk)
+
+
 def _pack_info(pack: FixturePack) -> dict[str, object]:
     return {
         "name": pack.name,
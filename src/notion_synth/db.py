@@ -1,240 +1,707 @@
 import json
 import os
 import sqlite3
-from collections.abc import Mapping, Sequence
-from contextlib import suppress
-from dataclasses import dataclass
+import threading
+import time
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from queue import Empty, LifoQueue
 from typing import Any, cast
 from uuid import uuid4
 
+from notion_synth.util import env_int
+
 DEFAULT_DB_PATH = "./notion_synth.db"
+DEFAULT_POOL_SIZE = 4
+DEFAULT_POOL_TIMEOUT_MS = 5000
+
+_TRUTHY = {"1", "true", "yes", "on"}
+_FALSY = {"0", "false", "no", "off"}
+
+
+class PoolTimeoutError(RuntimeError):
+    """Raised when no reader connection frees up within the pool timeout."""
+
+
+class ConnectionPool:
+    """
+    Bounded checkout/return pool of read-only SQLite connections.
+
+    Connections are opened lazily up to `size`; callers beyond that block until one is
+    returned (or `timeout_s` elapses). Wait time and checkout counts are tracked for `/stats/pool`.
+    """
+
+    def __init__(self, factory: Any, *, size: int, timeout_s: float) -> None:
+        self._factory = factory
+        self.size = max(1, size)
+        self.timeout_s = timeout_s
+        self._idle: LifoQueue[sqlite3.Connection] = LifoQueue()
+        self._lock = threading.Lock()
+        self._opened = 0
+        self._in_use = 0
+        self._checkouts = 0
+        self._waits = 0
+        self._timeouts = 0
+        self._wait_total_s = 0.0
+        self._wait_max_s = 0.0
+        self._all: list[sqlite3.Connection] = []
+
+    def _acquire(self) -> sqlite3.Connection:
+        with self._lock:
+            try:
+                connection = self._idle.get_nowait()
+            except Empty:
+                connection = None
+            if connection is None and self._opened < self.size:
+                connection = self._factory()
+                self._opened += 1
+                self._all.append(connection)
+            if connection is not None:
+                self._checkouts += 1
+                self._in_use += 1
+                return connection
+
+        started = time.perf_counter()
+        try:
+            connection = self._idle.get(timeout=self.timeout_s)
+        except Empty as exc:
+            with self._lock:
+                self._timeouts += 1
+            raise PoolTimeoutError("Timed out waiting for a pooled SQLite connection") from exc
+        waited = time.perf_counter() - started
+        with self._lock:
+            self._checkouts += 1
+            self._in_use += 1
+            self._waits += 1
+            self._wait_total_s += waited
+            self._wait_max_s = max(self._wait_max_s, waited)
+        return connection
+
+    def _release(self, connection: sqlite3.Connection) -> None:
+        with self._lock:
+            self._in_use -= 1
+        self._idle.put(connection)
+
+    @contextmanager
+    def checkout(self) -> Iterator[sqlite3.Connection]:
+        connection = self._acquire()
+        try:
+            yield connection
+        finally:
+            self._release(connection)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "size": self.size,
+                "opened": self._opened,
+                "in_use": self._in_use,
+                "idle": self._opened - self._in_use,
+                "checkouts": self._checkouts,
+                "waits": self._waits,
+                "timeouts": self._timeouts,
+                "wait_ms_total": round(self._wait_total_s * 1000, 3),
+                "wait_ms_max": round(self._wait_max_s * 1000, 3),
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            connections, self._all = self._all, []
+            self._opened = 0
+        for connection in connections:
+            with suppress(sqlite3.Error):
+                connection.close()
 
 
 @dataclass
 class Database:
+    """
+    SQLite access for the API.
+
+    `connection` is the single writer. File-backed DBs also get a `readers` pool so route reads
+    don't queue behind writes; in-memory DBs (one private DB per connection) share the writer.
+    Reads issued while the current thread holds the writer go to the writer so they see its
+    uncommitted changes.
+    """
+
     path: str
     connection: sqlite3.Connection
+    readers: ConnectionPool | None = None
+    journal_mode: str = "delete"
+    _write_lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+    _local: threading.local = field(default_factory=threading.local, repr=False)
+
+    @contextmanager
+    def writer(self) -> Iterator[sqlite3.Connection]:
+        """Hold the writer connection for the duration of the block."""
+        with self._write_lock:
+            depth = getattr(self._local, "writer_depth", 0)
+            self._local.writer_depth = depth + 1
+            try:
+                yield self.connection
+            finally:
+                self._local.writer_depth = depth
+
+    @contextmanager
+    def reader(self) -> Iterator[sqlite3.Connection]:
+        if self.readers is None or getattr(self._local, "writer_depth", 0) > 0:
+            with self.writer() as connection:
+                yield connection
+            return
+        with self.readers.checkout() as connection:
+            yield connection
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Cursor]:
+        """
+        Unit of work on the writer: commit once on success, roll back on error.
+
+        Nested calls become SAVEPOINTs, so a failing inner block only undoes its own
+        statements. `execute` inside a transaction does not commit.
+        """
+        with self.writer() as connection:
+            depth = getattr(self._local, "tx_depth", 0)
+            savepoint = f"sp_{depth}"
+            if depth == 0:
+                connection.execute("BEGIN IMMEDIATE")
+            else:
+                connection.execute(f"SAVEPOINT {savepoint}")
+            self._local.tx_depth = depth + 1
+            try:
+                yield connection.cursor()
+            except BaseException:
+                if depth == 0:
+                    connection.rollback()
+                else:
+                    connection.execute(f"ROLLBACK TO SAVEPOINT {savepoint}")
+                    connection.execute(f"RELEASE SAVEPOINT {savepoint}")
+                raise
+            else:
+                if depth == 0:
+                    connection.commit()
+                else:
+                    connection.execute(f"RELEASE SAVEPOINT {savepoint}")
+            finally:
+                self._local.tx_depth = depth
+
+    def in_transaction(self) -> bool:
+        return getattr(self._local, "tx_depth", 0) > 0
 
     def execute(
         self, query: str, params: Sequence[Any] | Mapping[str, Any] | None = None
     ) -> sqlite3.Cursor:
-        cursor = self.connection.cursor()
-        cursor.execute(query, params or ())
-        self.connection.commit()
-        return cursor
+        with self.writer() as connection:
+            cursor = connection.cursor()
+            cursor.execute(query, params or ())
+            if not self.in_transaction():
+                connection.commit()
+            return cursor
 
     def query_all(
         self, query: str, params: Sequence[Any] | Mapping[str, Any] | None = None
     ) -> list[sqlite3.Row]:
-        cursor = self.connection.cursor()
-        cursor.execute(query, params or ())
-        rows = cursor.fetchall()
-        return rows
+        with self.reader() as connection:
+            cursor = connection.cursor()
+            cursor.execute(query, params or ())
+            rows = cursor.fetchall()
+            return rows
 
     def query_one(
         self, query: str, params: Sequence[Any] | Mapping[str, Any] | None = None
     ) -> sqlite3.Row | None:
-        cursor = self.connection.cursor()
-        cursor.execute(query, params or ())
-        return cast(sqlite3.Row | None, cursor.fetchone())
+        with self.reader() as connection:
+            cursor = connection.cursor()
+            cursor.execute(query, params or ())
+            return cast(sqlite3.Row | None, cursor.fetchone())
 
+    def stream(
+        self,
+        query: str,
+        params: Sequence[Any] | Mapping[str, Any] | None = None,
+        *,
+        batch_size: int = 500,
+    ) -> Iterator[sqlite3.Row]:
+        """
+        Yield rows from one cursor, fetched `batch_size` at a time via `fetchmany`.
 
-def connect(db_path: str | None = None) -> Database:
-    path = db_path or os.getenv("NOTION_SYNTH_DB") or DEFAULT_DB_PATH
+        File DBs pin a pooled reader for the whole iteration. In-memory DBs take the writer lock
+        per batch instead: the lock is thread-bound and a streaming response may resume the
+        generator on a different worker thread.
+        """
+        if self.readers is None or getattr(self._local, "writer_depth", 0) > 0:
+            with self.writer() as connection:
+                cursor = connection.cursor()
+                cursor.execute(query, params or ())
+            while True:
+                with self.writer():
+                    batch = cursor.fetchmany(batch_size)
+                if not batch:
+                    return
+                yield from batch
+        with self.readers.checkout() as connection:
+            cursor = connection.cursor()
+            cursor.execute(query, params or ())
+            while batch := cursor.fetchmany(batch_size):
+                yield from batch
+
+    def pool_stats(self) -> dict[str, Any]:
+        readers = self.readers.stats() if self.readers is not None else None
+        return {
+            "db_path": self.path,
+            "journal_mode": self.journal_mode,
+            "pooled": readers is not None,
+            "readers": readers,
+        }
+
+    def close(self) -> None:
+        if self.readers is not None:
+            self.readers.close()
+        with self.writer() as connection:
+            connection.close()
+
+
+def _is_memory_path(path: str) -> bool:
+    return path == ":memory:" or ("mode=memory" in path)
+
+
+def _wal_enabled() -> bool:
+    # WAL is the default for file DBs; set NOTION_SYNTH_SQLITE_WAL=0 to keep rollback journaling.
+    raw = os.getenv("NOTION_SYNTH_SQLITE_WAL", "").strip().lower()
+    if raw in _TRUTHY:
+        return True
+    return raw not in _FALSY
+
+
+def _open_connection(path: str, *, read_only: bool = False) -> sqlite3.Connection:
     use_uri = path.startswith("file:")
     connection = sqlite3.connect(path, check_same_thread=False, uri=use_uri)
     # Reduce "database is locked" flakiness for local demo workloads.
-    busy_timeout_ms = int(os.getenv("NOTION_SYNTH_SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    busy_timeout_ms = env_int("NOTION_SYNTH_SQLITE_BUSY_TIMEOUT_MS", 5000)
     if busy_timeout_ms > 0:
         connection.execute(f"PRAGMA busy_timeout={busy_timeout_ms}")
-
-    # WAL improves concurrent reader behavior (still effectively single-writer).
-    use_wal = os.getenv("NOTION_SYNTH_SQLITE_WAL", "").strip().lower() in {"1", "true", "yes", "on"}
-    is_memory = path == ":memory:" or ("mode=memory" in path)
-    if use_wal and not is_memory:
-        with suppress(sqlite3.OperationalError):
-            connection.execute("PRAGMA journal_mode=WAL")
     connection.execute("PRAGMA foreign_keys=ON")
+    if read_only:
+        connection.execute("PRAGMA query_only=ON")
     connection.row_factory = sqlite3.Row
-    db = Database(path=path, connection=connection)
+    return connection
+
+
+def connect(db_path: str | None = None) -> Database:
+    path = db_path or os.getenv("NOTION_SYNTH_DB") or DEFAULT_DB_PATH
+    connection = _open_connection(path)
+
+    # WAL lets pooled readers proceed while the writer commits (still single-writer).
+    journal_mode = "memory" if _is_memory_path(path) else "delete"
+    if _wal_enabled() and not _is_memory_path(path):
+        with suppress(sqlite3.OperationalError):
+            row = connection.execute("PRAGMA journal_mode=WAL").fetchone()
+            journal_mode = str(row[0]).lower() if row else journal_mode
+
+    readers: ConnectionPool | None = None
+    pool_size = env_int("NOTION_SYNTH_SQLITE_POOL_SIZE", DEFAULT_POOL_SIZE)
+    if not _is_memory_path(path) and pool_size > 0:
+        pool_timeout_ms = env_int("NOTION_SYNTH_SQLITE_POOL_TIMEOUT_MS", DEFAULT_POOL_TIMEOUT_MS)
+        readers = ConnectionPool(
+            lambda: _open_connection(path, read_only=True),
+            size=pool_size,
+            timeout_s=max(0, pool_timeout_ms) / 1000,
+        )
+
+    db = Database(path=path, connection=connection, readers=readers, journal_mode=journal_mode)
     _init_schema(db)
     seed_demo(db)
     return db
 
 
 def _init_schema(db: Database) -> None:
-    db.execute(
-        """
-        CREATE TABLE IF NOT EXISTS workspaces (
-            id TEXT PRIMARY KEY,
-            name TEXT NOT NULL,
-            created_at TEXT NOT NULL
+    # One transaction for all DDL: a single commit (and fsync) per startup.
+    with db.transaction():
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS workspaces (
+                id TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                created_at TEXT NOT NULL
+            )
+            """
         )
-        """
-    )
-    db.execute(
-        """
-        CREATE TABLE IF NOT EXISTS users (
-            id TEXT PRIMARY KEY,
-            workspace_id TEXT NOT NULL,
-            name TEXT NOT NULL,
-            email TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            FOREIGN KEY (workspace_id) REFERENCES workspaces(id)
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS users (
+                id TEXT PRIMARY KEY,
+                workspace_id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                email TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                FOREIGN KEY (workspace_id) REFERENCES workspaces(id)
+            )
+            """
         )
-        """
-    )
-    db.execute(
-        """
-        CREATE TABLE IF NOT EXISTS pages (
-            id TEXT PRIMARY KEY,
-            workspace_id TEXT NOT NULL,
-            title TEXT NOT NULL,
-            content TEXT NOT NULL,
-            attachments_json TEXT NOT NULL DEFAULT '[]',
-            parent_type TEXT NOT NULL,
-            parent_id TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL,
-            FOREIGN KEY (workspace_id) REFERENCES workspaces(id)
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS pages (
+                id TEXT PRIMARY KEY,
+                workspace_id TEXT NOT NULL,
+                title TEXT NOT NULL,
+                content TEXT NOT NULL,
+                attachments_json TEXT NOT NULL DEFAULT '[]',
+                parent_type TEXT NOT NULL,
+                parent_id TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                FOREIGN KEY (workspace_id) REFERENCES workspaces(id)
+            )
+            """
         )
-        """
-    )
-    db.execute(
-        """
-        CREATE TABLE IF NOT EXISTS databases (
-            id TEXT PRIMARY KEY,
-            workspace_id TEXT NOT NULL,
-            name TEXT NOT NULL,
-            schema_json TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL,
-            FOREIGN KEY (workspace_id) REFERENCES workspaces(id)
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS databases (
+                id TEXT PRIMARY KEY,
+                workspace_id TEXT NOT NULL,
+                name TEXT NOT NULL,
+                schema_json TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                FOREIGN KEY (workspace_id) REFERENCES workspaces(id)
+            )
+            """
         )
-        """
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS database_rows (
+                id TEXT PRIMARY KEY,
+                database_id TEXT NOT NULL,
+                properties_json TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                FOREIGN KEY (database_id) REFERENCES databases(id)
+            )
+            """
+        )
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS comments (
+                id TEXT PRIMARY KEY,
+                page_id TEXT NOT NULL,
+                author_id TEXT NOT NULL,
+                body TEXT NOT NULL,
+                attachments_json TEXT NOT NULL DEFAULT '[]',
+                created_at TEXT NOT NULL,
+                FOREIGN KEY (page_id) REFERENCES pages(id),
+                FOREIGN KEY (author_id) REFERENCES users(id)
+            )
+            """
+        )
+
+        pages_columns = db.query_all("PRAGMA table_info(pages)")
+        if not any(col["name"] == "attachments_json" for col in pages_columns):
+            with suppress(sqlite3.OperationalError):
+                db.execute("ALTER TABLE pages ADD COLUMN attachments_json TEXT NOT NULL DEFAULT '[]'")
+
+        comments_columns = db.query_all("PRAGMA table_info(comments)")
+        if not any(col["name"] == "attachments_json" for col in comments_columns):
+            with suppress(sqlite3.OperationalError):
+                db.execute("ALTER TABLE comments ADD COLUMN attachments_json TEXT NOT NULL DEFAULT '[]'")
+
+        # Lightweight indexes for common list/filter paths. Safe to run on every start.
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_users_workspace_created ON users (workspace_id, created_at)"
+        )
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_pages_workspace_created ON pages (workspace_id, created_at)"
+        )
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_databases_workspace_created ON databases (workspace_id, created_at)"
+        )
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_rows_database_created ON database_rows (database_id, created_at)"
+        )
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_comments_page_created ON comments (page_id, created_at)"
+        )
+        db.execute(
+            "CREATE INDEX IF NOT EXISTS idx_comments_author_created ON comments (author_id, created_at)"
+        )
+        # Unfiltered keyset walks (`cursor=`) and streamed exports order by (created_at, id)
+        # across the whole table.
+        for table in ("users", "pages", "databases", "database_rows", "comments"):
+            db.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{table}_created_id ON {table} (created_at, id)"
+            )
+
+        _init_row_property_index(db)
+
+        # Best-effort full-text search indexes (optional; depends on SQLite build).
+        # If FTS5 isn't available, search falls back to LIKE scans.
+        for fts_name, (content_table, columns) in FTS_TABLES.items():
+            _init_fts(db, fts_name, content_table, columns)
+
+
+# External-content FTS5 indexes: name -> (content table, indexed columns).
+FTS_TABLES: dict[str, tuple[str, tuple[str, ...]]] = {
+    "pages_fts": ("pages", ("title", "content")),
+    "comments_fts": ("comments", ("body", "attachments_json")),
+    "rows_fts": ("database_rows", ("properties_json",)),
+}
+
+
+def _init_fts(db: Database, fts_name: str, content_table: str, columns: tuple[str, ...]) -> None:
+    column_list = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    try:
+        with db.transaction():
+            existing = db.query_one(
+                "SELECT 1 AS ok FROM sqlite_master WHERE type='table' AND name=?", [fts_name]
+            )
+            db.execute(
+                f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {fts_name}
+                USING fts5(
+                    {column_list},
+                    content='{content_table}',
+                    content_rowid='rowid'
+                )
+                """
+            )
+            db.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {fts_name}_ai
+                AFTER INSERT ON {content_table}
+                BEGIN
+                    INSERT INTO {fts_name}(rowid, {column_list})
+                    VALUES (new.rowid, {new_values});
+                END
+                """
+            )
+            db.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {fts_name}_ad
+                AFTER DELETE ON {content_table}
+                BEGIN
+                    INSERT INTO {fts_name}({fts_name}, rowid, {column_list})
+                    VALUES('delete', old.rowid, {old_values});
+                END
+                """
+            )
+            db.execute(
+                f"""
+                CREATE TRIGGER IF NOT EXISTS {fts_name}_au
+                AFTER UPDATE ON {content_table}
+                BEGIN
+                    INSERT INTO {fts_name}({fts_name}, rowid, {column_list})
+                    VALUES('delete', old.rowid, {old_values});
+                    INSERT INTO {fts_name}(rowid, {column_list})
+                    VALUES (new.rowid, {new_values});
+                END
+                """
+            )
+
+            # Only rebuild when the index is first created or clearly empty.
+            # This keeps search usable for existing DBs without introducing migrations.
+            should_rebuild = existing is None
+            if not should_rebuild:
+                content_count = db.query_one(
+                    f"SELECT COUNT(*) AS count FROM {content_table}"  # nosec B608
+                )
+                fts_count = db.query_one(f"SELECT COUNT(*) AS count FROM {fts_name}")  # nosec B608
+                should_rebuild = (
+                    int(content_count["count"]) if content_count else 0
+                ) > 0 and (int(fts_count["count"]) if fts_count else 0) == 0
+            if should_rebuild:
+                db.execute(f"INSERT INTO {fts_name}({fts_name}) VALUES('rebuild')")
+    except sqlite3.OperationalError:
+        # "no such module: fts5" (or similar): keep schema usable without FTS.
+        pass
+
+
+# Row properties whose schema type is one of these (or that set `"indexed": true` in the
+# database schema) are mirrored into `row_property_values` for exact-match filters.
+INDEXED_PROPERTY_TYPES = ("select", "status", "title")
+
+_ROW_PROPERTY_VALUES_SELECT = """
+    SELECT {row}.database_id, v.key, CAST(v.value AS TEXT), {row}.id
+    FROM {source}json_each({row}.properties_json) v
+    JOIN {properties} ip ON ip.database_id = {row}.database_id AND ip.name = v.key
+    WHERE v.value IS NOT NULL
+"""
+
+
+def _init_row_property_index(db: Database) -> None:
+    existing = db.query_one(
+        "SELECT 1 AS ok FROM sqlite_master WHERE type='table' AND name='row_property_values'"
     )
     db.execute(
         """
-        CREATE TABLE IF NOT EXISTS database_rows (
-            id TEXT PRIMARY KEY,
+        CREATE TABLE IF NOT EXISTS row_property_values (
             database_id TEXT NOT NULL,
-            properties_json TEXT NOT NULL,
-            created_at TEXT NOT NULL,
-            updated_at TEXT NOT NULL,
-            FOREIGN KEY (database_id) REFERENCES databases(id)
+            name TEXT NOT NULL,
+            value_text TEXT NOT NULL,
+            row_id TEXT NOT NULL
         )
         """
     )
     db.execute(
         """
-        CREATE TABLE IF NOT EXISTS comments (
-            id TEXT PRIMARY KEY,
-            page_id TEXT NOT NULL,
-            author_id TEXT NOT NULL,
-            body TEXT NOT NULL,
-            attachments_json TEXT NOT NULL DEFAULT '[]',
-            created_at TEXT NOT NULL,
-            FOREIGN KEY (page_id) REFERENCES pages(id),
-            FOREIGN KEY (author_id) REFERENCES users(id)
-        )
+        CREATE INDEX IF NOT EXISTS idx_row_property_values_lookup
+        ON row_property_values (database_id, name, value_text, row_id)
         """
     )
-
-    pages_columns = db.query_all("PRAGMA table_info(pages)")
-    if not any(col["name"] == "attachments_json" for col in pages_columns):
-        with suppress(sqlite3.OperationalError):
-            db.execute("ALTER TABLE pages ADD COLUMN attachments_json TEXT NOT NULL DEFAULT '[]'")
-
-    comments_columns = db.query_all("PRAGMA table_info(comments)")
-    if not any(col["name"] == "attachments_json" for col in comments_columns):
-        with suppress(sqlite3.OperationalError):
-            db.execute("ALTER TABLE comments ADD COLUMN attachments_json TEXT NOT NULL DEFAULT '[]'")
-
-    # Lightweight indexes for common list/filter paths. Safe to run on every start.
     db.execute(
-        "CREATE INDEX IF NOT EXISTS idx_users_workspace_created ON users (workspace_id, created_at)"
+        "CREATE INDEX IF NOT EXISTS idx_row_property_values_row ON row_property_values (row_id)"
     )
+    types = ", ".join(f"'{t}'" for t in INDEXED_PROPERTY_TYPES)
     db.execute(
-        "CREATE INDEX IF NOT EXISTS idx_pages_workspace_created ON pages (workspace_id, created_at)"
+        f"""
+        CREATE VIEW IF NOT EXISTS indexed_row_properties AS
+        SELECT d.id AS database_id, p.key AS name
+        FROM databases d, json_each(d.schema_json, '$.properties') p
+        WHERE json_type(p.value) = 'object'
+          AND (
+            json_extract(p.value, '$.type') IN ({types})
+            OR json_extract(p.value, '$.indexed') = 1
+          )
+        """  # nosec B608
     )
+    # Same trigger pattern as pages_fts: every write path (routes, fixture import, seeding)
+    # keeps the side table in sync without application code.
     db.execute(
-        "CREATE INDEX IF NOT EXISTS idx_databases_workspace_created ON databases (workspace_id, created_at)"
+        f"""
+        CREATE TRIGGER IF NOT EXISTS row_property_values_ai
+        AFTER INSERT ON database_rows
+        BEGIN
+            INSERT INTO row_property_values (database_id, name, value_text, row_id)
+            {_ROW_PROPERTY_VALUES_SELECT.format(row="new", source="", properties="indexed_row_properties")};
+        END
+        """
     )
     db.execute(
-        "CREATE INDEX IF NOT EXISTS idx_rows_database_created ON database_rows (database_id, created_at)"
+        """
+        CREATE TRIGGER IF NOT EXISTS row_property_values_ad
+        AFTER DELETE ON database_rows
+        BEGIN
+            DELETE FROM row_property_values WHERE row_id = old.id;
+        END
+        """
     )
     db.execute(
-        "CREATE INDEX IF NOT EXISTS idx_comments_page_created ON comments (page_id, created_at)"
+        f"""
+        CREATE TRIGGER IF NOT EXISTS row_property_values_au
+        AFTER UPDATE OF properties_json, database_id ON database_rows
+        BEGIN
+            DELETE FROM row_property_values WHERE row_id = old.id;
+            INSERT INTO row_property_values (database_id, name, value_text, row_id)
+            {_ROW_PROPERTY_VALUES_SELECT.format(row="new", source="", properties="indexed_row_properties")};
+        END
+        """
     )
     db.execute(
-        "CREATE INDEX IF NOT EXISTS idx_comments_author_created ON comments (author_id, created_at)"
+        f"""
+        CREATE TRIGGER IF NOT EXISTS row_property_values_schema_au
+        AFTER UPDATE OF schema_json ON databases
+        BEGIN
+            DELETE FROM row_property_values WHERE database_id = new.id;
+            INSERT INTO row_property_values (database_id, name, value_text, row_id)
+            {_ROW_PROPERTY_VALUES_SELECT.format(
+                row="r", source="database_rows r, ", properties="indexed_row_properties"
+            )}
+              AND r.database_id = new.id;
+        END
+        """
     )
+    if existing is None:
+        rebuild_row_property_index(db)
 
-    # Best-effort full-text search index for pages (optional; depends on SQLite build).
-    # If FTS5 isn't available, search falls back to LIKE scans.
-    try:
-        existing = db.query_one(
-            "SELECT 1 AS ok FROM sqlite_master WHERE type='table' AND name='pages_fts'"
-        )
-        db.execute(
-            """
-            CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts
-            USING fts5(
-                title,
-                content,
-                content='pages',
-                content_rowid='rowid'
-            )
-            """
-        )
-        db.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS pages_fts_ai
-            AFTER INSERT ON pages
-            BEGIN
-                INSERT INTO pages_fts(rowid, title, content)
-                VALUES (new.rowid, new.title, new.content);
-            END
-            """
-        )
+
+def rebuild_row_property_index(db: Database) -> None:
+    """Recompute `row_property_values` from scratch (first start, or after bulk loads)."""
+    with db.transaction():
+        db.execute("DELETE FROM row_property_values")
+        # Materialize the view once; joined inline it re-expands every schema per row.
         db.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS pages_fts_ad
-            AFTER DELETE ON pages
-            BEGIN
-                INSERT INTO pages_fts(pages_fts, rowid, title, content)
-                VALUES('delete', old.rowid, old.title, old.content);
-            END
-            """
-        )
-        db.execute(
-            """
-            CREATE TRIGGER IF NOT EXISTS pages_fts_au
-            AFTER UPDATE ON pages
-            BEGIN
-                INSERT INTO pages_fts(pages_fts, rowid, title, content)
-                VALUES('delete', old.rowid, old.title, old.content);
-                INSERT INTO pages_fts(rowid, title, content)
-                VALUES (new.rowid, new.title, new.content);
-            END
-            """
+            f"""
+            WITH ip_all AS MATERIALIZED (SELECT database_id, name FROM indexed_row_properties)
+            INSERT INTO row_property_values (database_id, name, value_text, row_id)
+            {_ROW_PROPERTY_VALUES_SELECT.format(row="r", source="database_rows r, ", properties="ip_all")}
+            """  # nosec B608
         )
 
-        # Only rebuild when the index is first created or clearly empty.
-        # This keeps search usable for existing DBs without introducing migrations.
-        should_rebuild = existing is None
-        if not should_rebuild:
-            pages_count = db.query_one("SELECT COUNT(*) AS count FROM pages")
-            fts_count = db.query_one("SELECT COUNT(*) AS count FROM pages_fts")
-            should_rebuild = (
-                int(pages_count["count"]) if pages_count else 0
-            ) > 0 and (int(fts_count["count"]) if fts_count else 0) == 0
-        if should_rebuild:
-            db.execute("INSERT INTO pages_fts(pages_fts) VALUES('rebuild')")
-    except sqlite3.OperationalError:
-        # "no such module: fts5" (or similar): keep schema usable without FTS.
-        pass
+
+# Tables whose secondary indexes and triggers `bulk_load` suspends.
+BULK_LOAD_TABLES = (
+    "workspaces",
+    "users",
+    "pages",
+    "databases",
+    "database_rows",
+    "comments",
+    "row_property_values",
+)
+
+
+@contextmanager
+def bulk_load(db: Database) -> Iterator[sqlite3.Cursor]:
+    """
+    Transaction for wholesale table replacement (fixture imports in replace mode).
+
+    Secondary indexes and triggers (FTS and row-property maintenance) on the fixture tables are
+    dropped for the load and recreated once at the end, then every FTS index gets a single
+    'rebuild' and `row_property_values` is recomputed. Outside an enclosing transaction the load
+    also runs with `synchronous=OFF` and `foreign_keys=OFF` (checked with `foreign_key_check`
+    before commit), and with `journal_mode=MEMORY` unless the DB is in WAL mode, which SQLite
+    won't leave while pooled readers are open. Everything is restored afterwards; on error the
+    transaction, including the dropped schema objects, rolls back.
+    """
+    with db.writer() as connection:
+        tune = not db.in_transaction()
+        saved: dict[str, Any] = {}
+        if tune:
+            for pragma in ("synchronous", "foreign_keys", "journal_mode"):
+                saved[pragma] = connection.execute(f"PRAGMA {pragma}").fetchone()[0]
+            connection.execute("PRAGMA synchronous=OFF")
+            connection.execute("PRAGMA foreign_keys=OFF")
+            if str(saved["journal_mode"]).lower() != "wal":
+                connection.execute("PRAGMA journal_mode=MEMORY")
+        try:
+            with db.transaction() as cursor:
+                placeholders = ", ".join("?" for _ in BULK_LOAD_TABLES)
+                suspended = cursor.execute(
+                    f"""
+                    SELECT type, name, sql FROM sqlite_master
+                    WHERE type IN ('index', 'trigger') AND sql IS NOT NULL AND tbl_name IN ({placeholders})
+                    ORDER BY type, name
+                    """,  # nosec B608
+                    BULK_LOAD_TABLES,
+                ).fetchall()
+                for obj in suspended:
+                    cursor.execute(f"DROP {str(obj['type']).upper()} {obj['name']}")
+
+                yield cursor
+
+                # Derived data first, so the recreated indexes are built from sorted scans.
+                for fts_name in FTS_TABLES:
+                    exists = cursor.execute(
+                        "SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", [fts_name]
+                    ).fetchone()
+                    if exists:
+                        cursor.execute(f"INSERT INTO {fts_name}({fts_name}) VALUES('rebuild')")
+                rebuild_row_property_index(db)
+                for obj in suspended:
+                    cursor.execute(obj["sql"])
+                if tune and saved["foreign_keys"]:
+                    violations = cursor.execute("PRAGMA foreign_key_check").fetchall()
+                    if violations:
+                        raise sqlite3.IntegrityError(
+                            f"Bulk load left {len(violations)} dangling foreign key reference(s)"
+                        )
+        finally:
+            if tune:
+                if str(saved["journal_mode"]).lower() != "wal":
+                    connection.execute(f"PRAGMA journal_mode={saved['journal_mode']}")
+                connection.execute(f"PRAGMA foreign_keys={int(saved['foreign_keys'])}")
+                connection.execute(f"PRAGMA synchronous={int(saved['synchronous'])}")
 
 
 def seed_demo(db: Database, *, force: bool = False) -> None:
@@ -249,10 +716,7 @@ def seed_demo(db: Database, *, force: bool = False) -> None:
     if has_workspaces and not force:
         return
 
-    conn = db.connection
-    cursor = conn.cursor()
-    try:
-        conn.execute("BEGIN")
+    with db.transaction() as cursor:
         if force:
             cursor.execute("DELETE FROM comments")
             cursor.execute("DELETE FROM database_rows")
@@ -421,16 +885,12 @@ def seed_demo(db: Database, *, force: bool = False) -> None:
             """,
             comments,
         )
-        conn.commit()
-    except Exception:
-        conn.rollback()
-        raise
 
-    if force:
-        # Best-effort rebuild of page search index after a full reset.
-        with suppress(sqlite3.OperationalError):
-            cursor.execute("INSERT INTO pages_fts(pages_fts) VALUES('rebuild')")
-            conn.commit()
+        if force:
+            # Best-effort rebuild of search indexes after a full reset.
+            for fts_name in FTS_TABLES:
+                with suppress(sqlite3.OperationalError), db.transaction():
+                    db.execute(f"INSERT INTO {fts_name}({fts_name}) VALUES('rebuild')")
 
 
 def _utc_now() -> str:
@@ -1,9 +1,15 @@
 import json
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from dataclasses import dataclass
 from datetime import UTC, datetime
+from operator import attrgetter, itemgetter
 from typing import Any, cast
 
-from notion_synth.db import Database
+from pydantic import BaseModel, ValidationError
+
+from notion_synth.db import Database, bulk_load
 from notion_synth.models import (
+    Attachment,
     Comment,
     DatabaseRow,
     Fixture,
@@ -16,11 +22,119 @@ from notion_synth.models import (
     Database as DatabaseModel,
 )
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+EXPORT_BATCH_SIZE = 1000
+IMPORT_CHUNK_SIZE = 1000
+
+# JSON string literal for a TEXT value; a bound encoder skips `json.dumps`'s per-call setup.
+_encode_text = json.JSONEncoder().encode
+
+# (record type, table), in foreign-key order so a streamed import can insert as it reads.
+FIXTURE_TABLES: tuple[tuple[str, str], ...] = (
+    ("workspace", "workspaces"),
+    ("user", "users"),
+    ("page", "pages"),
+    ("database", "databases"),
+    ("database_row", "database_rows"),
+    ("comment", "comments"),
+)
+
 
 def _parse_json(value: str) -> dict[str, Any]:
     return cast(dict[str, Any], json.loads(value))
 
 
+def _page_record(row: Any) -> dict[str, Any]:
+    data = dict(row)
+    data["content"] = json.loads(data["content"])
+    data["attachments"] = json.loads(data.pop("attachments_json"))
+    return data
+
+
+def _database_record(row: Any) -> dict[str, Any]:
+    data = dict(row)
+    data["schema"] = json.loads(data.pop("schema_json"))
+    return data
+
+
+def _database_row_record(row: Any) -> dict[str, Any]:
+    data = dict(row)
+    data["properties"] = json.loads(data.pop("properties_json"))
+    return data
+
+
+def _comment_record(row: Any) -> dict[str, Any]:
+    data = dict(row)
+    data["attachments"] = json.loads(data.pop("attachments_json"))
+    return data
+
+
+# Row -> JSON-ready dict with the same shape as the matching model's `model_dump(by_alias=True)`,
+# without building the model.
+_RECORD_BUILDERS: dict[str, Callable[[Any], dict[str, Any]]] = {
+    "workspace": dict,
+    "user": dict,
+    "page": _page_record,
+    "database": _database_record,
+    "database_row": _database_row_record,
+    "comment": _comment_record,
+}
+
+
+def iter_fixture_records(db: Database, *, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[dict[str, Any]]:
+    """
+    Yield the DB as fixture records: a header, then one `{"type", "data"}` record per row.
+
+    Rows are read with `Database.stream`, so memory stays flat regardless of table size.
+    """
+    yield {"type": "fixture", "format_version": 1, "exported_at": _utc_now()}
+    for record_type, table in FIXTURE_TABLES:
+        build = _RECORD_BUILDERS[record_type]
+        query = f"SELECT * FROM {table} ORDER BY created_at, id"  # nosec B608
+        for row in db.stream(query, batch_size=batch_size):
+            yield {"type": record_type, "data": build(row)}
+
+
+def iter_fixture_ndjson(db: Database, *, batch_size: int = EXPORT_BATCH_SIZE) -> Iterator[str]:
+    """Render `iter_fixture_records` as NDJSON, one chunk of up to `batch_size` lines at a time."""
+    lines: list[str] = []
+    for record in iter_fixture_records(db, batch_size=batch_size):
+        lines.append(json.dumps(record, separators=(",", ":")))
+        if len(lines) >= batch_size:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+
+def iter_batches_ndjson(
+    batches: Iterable[tuple[str, list[tuple[Any, ...]]]], *, exported_at: str
+) -> Iterator[str]:
+    """
+    Render `(record_type, rows)` batches (see `import_fixture_batches`) as fixture NDJSON.
+
+    Pre-encoded JSON columns are spliced into each line as-is rather than decoded and re-dumped;
+    the other columns are all TEXT and are encoded a column at a time. Yields the header line,
+    then one chunk per batch.
+    """
+    header = {"type": "fixture", "format_version": 1, "exported_at": exported_at}
+    yield json.dumps(header, separators=(",", ":")) + "\n"
+    for record_type, rows in batches:
+        if not rows:
+            continue
+        columns = FIXTURE_COLUMNS[record_type]
+        template = (
+            f'{{"type":"{record_type}","data":{{'
+            + ",".join(f'"{_JSON_COLUMNS.get(column, column)}":%s' for column in columns)
+            + "}}"
+        )
+        values = [
+            column_values if column in _JSON_COLUMNS else list(map(_encode_text, column_values))
+            for column, column_values in zip(columns, zip(*rows, strict=True), strict=True)
+        ]
+        yield "\n".join(template % row for row in zip(*values, strict=True)) + "\n"
+
+
 def export_fixture(db: Database) -> Fixture:
     rows_workspaces = db.query_all("SELECT * FROM workspaces ORDER BY created_at")
     rows_users = db.query_all("SELECT * FROM users ORDER BY created_at")
@@ -58,224 +172,255 @@ def export_fixture(db: Database) -> Fixture:
     )
 
 
-def import_fixture(db: Database, payload: Fixture, mode: str = "replace") -> FixtureImportResult:
+@dataclass(frozen=True)
+class _ImportTable:
+    table: str
+    model: type[BaseModel]
+    columns: tuple[str, ...]
+    values: Callable[[Any], tuple[Any, ...]]
+
+
+def _attachments_json(attachments: list[Attachment]) -> str:
+    return json.dumps([attachment.model_dump() for attachment in attachments])
+
+
+_IMPORT_TABLES: dict[str, _ImportTable] = {
+    "workspace": _ImportTable(
+        "workspaces",
+        Workspace,
+        ("id", "name", "created_at"),
+        lambda w: (w.id, w.name, w.created_at),
+    ),
+    "user": _ImportTable(
+        "users",
+        User,
+        ("id", "workspace_id", "name", "email", "created_at"),
+        lambda u: (u.id, u.workspace_id, u.name, u.email, u.created_at),
+    ),
+    "page": _ImportTable(
+        "pages",
+        Page,
+        (
+            "id",
+            "workspace_id",
+            "title",
+            "content",
+            "attachments_json",
+            "parent_type",
+            "parent_id",
+            "created_at",
+            "updated_at",
+        ),
+        lambda p: (
+            p.id,
+            p.workspace_id,
+            p.title,
+            json.dumps(p.content),
+            _attachments_json(p.attachments),
+            p.parent_type,
+            p.parent_id,
+            p.created_at,
+            p.updated_at,
+        ),
+    ),
+    "database": _ImportTable(
+        "databases",
+        DatabaseModel,
+        ("id", "workspace_id", "name", "schema_json", "created_at", "updated_at"),
+        lambda d: (d.id, d.workspace_id, d.name, json.dumps(d.schema_), d.created_at, d.updated_at),
+    ),
+    "database_row": _ImportTable(
+        "database_rows",
+        DatabaseRow,
+        ("id", "database_id", "properties_json", "created_at", "updated_at"),
+        lambda r: (r.id, r.database_id, json.dumps(r.properties), r.created_at, r.updated_at),
+    ),
+    "comment": _ImportTable(
+        "comments",
+        Comment,
+        ("id", "page_id", "author_id", "body", "attachments_json", "created_at"),
+        lambda c: (c.id, c.page_id, c.author_id, c.body, _attachments_json(c.attachments), c.created_at),
+    ),
+}
+
+
+# Column order of the row tuples accepted by `import_fixture_batches`.
+FIXTURE_COLUMNS: dict[str, tuple[str, ...]] = {
+    record_type: spec.columns for record_type, spec in _IMPORT_TABLES.items()
+}
+
+# JSON-encoded DB columns -> fixture record field.
+_JSON_COLUMNS = {
+    "content": "content",
+    "attachments_json": "attachments",
+    "schema_json": "schema",
+    "properties_json": "properties",
+}
+
+
+def _insert_query(spec: _ImportTable, mode: str) -> str:
+    placeholders = ", ".join("?" for _ in spec.columns)
+    query = f"INSERT INTO {spec.table} ({', '.join(spec.columns)}) VALUES ({placeholders})"  # nosec B608
+    if mode == "merge":
+        updates = ", ".join(f"{column} = excluded.{column}" for column in spec.columns if column != "id")
+        query += f" ON CONFLICT(id) DO UPDATE SET {updates}"
+    return query
+
+
+def iter_ndjson_records(lines: Iterable[str | bytes]) -> Iterator[dict[str, Any]]:
+    """Parse NDJSON fixture lines (as written by `iter_fixture_ndjson`), skipping blank lines."""
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise ValueError(f"Invalid JSON on line {line_number}") from exc
+        if not isinstance(record, dict):
+            raise ValueError(f"Line {line_number} is not a JSON object")
+        yield record
+
+
+def _fixture_records(payload: Fixture, *, sort_ids: bool = False) -> Iterator[dict[str, Any]]:
+    collections: dict[str, list[Any]] = {
+        "workspace": payload.workspaces,
+        "user": payload.users,
+        "page": payload.pages,
+        "database": payload.databases,
+        "database_row": payload.database_rows,
+        "comment": payload.comments,
+    }
+    for record_type, _ in FIXTURE_TABLES:
+        items = collections[record_type]
+        if sort_ids:
+            items = sorted(items, key=attrgetter("id"))
+        for item in items:
+            yield {"type": record_type, "data": item}
+
+
+def import_fixture(
+    db: Database,
+    payload: Fixture,
+    mode: str = "replace",
+    *,
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    progress: Callable[[dict[str, int]], None] | None = None,
+    bulk: bool | None = None,
+) -> FixtureImportResult:
     if payload.format_version != 1:
         raise ValueError("Unsupported fixture format_version")
+    bulk = mode == "replace" if bulk is None else bulk
+    return import_fixture_records(
+        db,
+        _fixture_records(payload, sort_ids=bulk),
+        mode=mode,
+        chunk_size=chunk_size,
+        progress=progress,
+        bulk=bulk,
+    )
+
+
+def import_fixture_records(
+    db: Database,
+    records: Iterable[Mapping[str, Any]],
+    *,
+    mode: str = "replace",
+    chunk_size: int = IMPORT_CHUNK_SIZE,
+    progress: Callable[[dict[str, int]], None] | None = None,
+    bulk: bool | None = None,
+) -> FixtureImportResult:
+    """
+    Load `{"type", "data"}` fixture records in chunks, all inside one transaction.
+
+    Records are consumed lazily: each chunk of up to `chunk_size` same-type records is validated,
+    inserted with one `executemany` and then dropped, so memory stays flat for any input size.
+    `progress` receives the running per-table counts after every chunk.
+
+    `bulk` (default: on for replace mode) loads through `db.bulk_load`, which suspends secondary
+    indexes and triggers until the end; each chunk is inserted in primary-key order.
+    """
+    return import_fixture_batches(
+        db,
+        _validated_batches(records, max(1, chunk_size)),
+        mode=mode,
+        progress=progress,
+        bulk=bulk,
+    )
+
+
+def import_fixture_batches(
+    db: Database,
+    batches: Iterable[tuple[str, list[tuple[Any, ...]]]],
+    *,
+    mode: str = "replace",
+    progress: Callable[[dict[str, int]], None] | None = None,
+    bulk: bool | None = None,
+) -> FixtureImportResult:
+    """
+    Insert pre-built `(record_type, rows)` batches, skipping per-record validation.
+
+    Each row is a tuple in `FIXTURE_COLUMNS[record_type]` order with JSON columns already encoded
+    (as produced by `generator.iter_fixture_batches`). Batches should arrive in foreign-key order.
+    Transaction, `bulk` and `progress` behave as in `import_fixture_records`.
+    """
     if mode not in {"replace", "merge"}:
         raise ValueError("Unsupported import mode")
+    if bulk is None:
+        bulk = mode == "replace"
 
-    conn = db.connection
-    cursor = conn.cursor()
-
-    inserted: dict[str, int] = {}
+    inserted = {spec.table: 0 for spec in _IMPORT_TABLES.values()}
+    queries = {record_type: _insert_query(spec, mode) for record_type, spec in _IMPORT_TABLES.items()}
     try:
-        conn.execute("BEGIN")
-
-        if mode == "replace":
-            cursor.execute("DELETE FROM comments")
-            cursor.execute("DELETE FROM database_rows")
-            cursor.execute("DELETE FROM pages")
-            cursor.execute("DELETE FROM databases")
-            cursor.execute("DELETE FROM users")
-            cursor.execute("DELETE FROM workspaces")
-
-        workspaces_query = (
-            "INSERT INTO workspaces (id, name, created_at) VALUES (?, ?, ?)"
-            if mode == "replace"
-            else """
-            INSERT INTO workspaces (id, name, created_at) VALUES (?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                name = excluded.name,
-                created_at = excluded.created_at
-            """
-        )
-        cursor.executemany(
-            workspaces_query,
-            [(w.id, w.name, w.created_at) for w in payload.workspaces],
-        )
-        inserted["workspaces"] = len(payload.workspaces)
-
-        users_query = (
-            "INSERT INTO users (id, workspace_id, name, email, created_at) VALUES (?, ?, ?, ?, ?)"
-            if mode == "replace"
-            else """
-            INSERT INTO users (id, workspace_id, name, email, created_at) VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                workspace_id = excluded.workspace_id,
-                name = excluded.name,
-                email = excluded.email,
-                created_at = excluded.created_at
-            """
-        )
-        cursor.executemany(
-            users_query,
-            [(u.id, u.workspace_id, u.name, u.email, u.created_at) for u in payload.users],
-        )
-        inserted["users"] = len(payload.users)
-
-        pages_query = (
-            """
-            INSERT INTO pages (
-                id,
-                workspace_id,
-                title,
-                content,
-                attachments_json,
-                parent_type,
-                parent_id,
-                created_at,
-                updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            if mode == "replace"
-            else """
-            INSERT INTO pages (
-                id,
-                workspace_id,
-                title,
-                content,
-                attachments_json,
-                parent_type,
-                parent_id,
-                created_at,
-                updated_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                workspace_id = excluded.workspace_id,
-                title = excluded.title,
-                content = excluded.content,
-                attachments_json = excluded.attachments_json,
-                parent_type = excluded.parent_type,
-                parent_id = excluded.parent_id,
-                created_at = excluded.created_at,
-                updated_at = excluded.updated_at
-            """
-        )
-        cursor.executemany(
-            pages_query,
-            [
-                (
-                    p.id,
-                    p.workspace_id,
-                    p.title,
-                    json.dumps(p.content),
-                    json.dumps([attachment.model_dump() for attachment in p.attachments]),
-                    p.parent_type,
-                    p.parent_id,
-                    p.created_at,
-                    p.updated_at,
-                )
-                for p in payload.pages
-            ],
-        )
-        inserted["pages"] = len(payload.pages)
-
-        databases_query = (
-            """
-            INSERT INTO databases (id, workspace_id, name, schema_json, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """
-            if mode == "replace"
-            else """
-            INSERT INTO databases (id, workspace_id, name, schema_json, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                workspace_id = excluded.workspace_id,
-                name = excluded.name,
-                schema_json = excluded.schema_json,
-                created_at = excluded.created_at,
-                updated_at = excluded.updated_at
-            """
-        )
-        cursor.executemany(
-            databases_query,
-            [
-                (
-                    d.id,
-                    d.workspace_id,
-                    d.name,
-                    json.dumps(d.schema_),
-                    d.created_at,
-                    d.updated_at,
-                )
-                for d in payload.databases
-            ],
-        )
-        inserted["databases"] = len(payload.databases)
-
-        database_rows_query = (
-            """
-            INSERT INTO database_rows (id, database_id, properties_json, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-            """
-            if mode == "replace"
-            else """
-            INSERT INTO database_rows (id, database_id, properties_json, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                database_id = excluded.database_id,
-                properties_json = excluded.properties_json,
-                created_at = excluded.created_at,
-                updated_at = excluded.updated_at
-            """
-        )
-        cursor.executemany(
-            database_rows_query,
-            [
-                (
-                    r.id,
-                    r.database_id,
-                    json.dumps(r.properties),
-                    r.created_at,
-                    r.updated_at,
-                )
-                for r in payload.database_rows
-            ],
-        )
-        inserted["database_rows"] = len(payload.database_rows)
-
-        comments_query = (
-            """
-            INSERT INTO comments (id, page_id, author_id, body, attachments_json, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            """
-            if mode == "replace"
-            else """
-            INSERT INTO comments (id, page_id, author_id, body, attachments_json, created_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(id) DO UPDATE SET
-                page_id = excluded.page_id,
-                author_id = excluded.author_id,
-                body = excluded.body,
-                attachments_json = excluded.attachments_json,
-                created_at = excluded.created_at
-            """
-        )
-        cursor.executemany(
-            comments_query,
-            [
-                (
-                    c.id,
-                    c.page_id,
-                    c.author_id,
-                    c.body,
-                    json.dumps([attachment.model_dump() for attachment in c.attachments]),
-                    c.created_at,
-                )
-                for c in payload.comments
-            ],
-        )
-        inserted["comments"] = len(payload.comments)
+        with bulk_load(db) if bulk else db.transaction() as cursor:
+            if mode == "replace":
+                for _, table in reversed(FIXTURE_TABLES):
+                    cursor.execute(f"DELETE FROM {table}")  # nosec B608
 
-        conn.commit()
+            for record_type, rows in batches:
+                if not rows:
+                    continue
+                ordered = sorted(rows, key=itemgetter(0)) if bulk else rows
+                cursor.executemany(queries[record_type], ordered)
+                inserted[_IMPORT_TABLES[record_type].table] += len(rows)
+                if progress is not None:
+                    progress(dict(inserted))
+    except ValueError:
+        raise
     except Exception as exc:
-        conn.rollback()
         raise ValueError("Fixture import failed") from exc
 
     return FixtureImportResult(status="ok", inserted=inserted)
 
 
+def _validated_batches(
+    records: Iterable[Mapping[str, Any]], chunk_size: int
+) -> Iterator[tuple[str, list[tuple[Any, ...]]]]:
+    pending_type: str | None = None
+    pending: list[tuple[Any, ...]] = []
+    for index, record in enumerate(records, start=1):
+        record_type = record.get("type")
+        if record_type == "fixture":
+            if record.get("format_version", 1) != 1:
+                raise ValueError("Unsupported fixture format_version")
+            continue
+        spec = _IMPORT_TABLES.get(str(record_type))
+        if spec is None:
+            raise ValueError(f"Unknown fixture record type {record_type!r} (record {index})")
+        if record_type != pending_type:
+            if pending_type is not None and pending:
+                yield pending_type, pending
+            pending_type, pending = str(record_type), []
+        try:
+            item = spec.model.model_validate(record.get("data"))
+        except ValidationError as exc:
+            raise ValueError(f"Invalid {record_type} record (record {index})") from exc
+        pending.append(spec.values(item))
+        if len(pending) >= chunk_size:
+            yield str(record_type), pending
+            pending = []
+    if pending_type is not None and pending:
+        yield pending_type, pending
+
+
 def _utc_now() -> str:
     return datetime.now(UTC).isoformat()
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import json
 import random
 import re
-from collections.abc import Iterable
-from dataclasses import dataclass
-from datetime import UTC, datetime, timedelta
+import struct
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
+from itertools import chain, cycle, islice, product, repeat
+from operator import itemgetter
+from typing import Any
 
 from notion_synth.models import (
     Attachment,
@@ -16,6 +21,7 @@ from notion_synth.models import (
     User,
     Workspace,
 )
+from notion_synth.util import ordered_map
 
 
 @dataclass(frozen=True)
@@ -114,6 +120,385 @@ def generate_fixture(config: SyntheticWorkspaceConfig) -> Fixture:
     )
 
 
+GENERATION_BATCH_SIZE = 10_000
+
+# `(record_type, rows)`: rows are tuples in `fixtures.FIXTURE_COLUMNS[record_type]` order.
+FixtureBatch = tuple[str, list[tuple[Any, ...]]]
+
+
+def iter_fixture_batches(
+    config: SyntheticWorkspaceConfig,
+    *,
+    batch_size: int = GENERATION_BATCH_SIZE,
+    workers: int = 1,
+) -> Iterator[FixtureBatch]:
+    """
+    High-volume counterpart of `generate_fixture` for 100k+ user / million-row fixtures.
+
+    Yields column-built batches of DB-ready tuples (JSON columns pre-encoded) in foreign-key
+    order, without building Pydantic models: random fields are drawn per batch with
+    `rng.choices`, JSON properties are assembled from pre-encoded vocabulary, and IDs come from a
+    seeded 40-bit permutation, so they never collide at scale. Deterministic by seed, with the
+    same dataset shape as `generate_fixture` (not the same values). Feed the batches to
+    `fixtures.import_fixture_batches` or `fixtures.iter_batches_ndjson`.
+
+    User and row batches are shards over ID ranges, each drawing from its own stream seeded by
+    `(seed, kind, shard start)`. `workers > 1` builds them in a process pool and yields them in
+    shard order, so the output depends on `seed` and `batch_size` but not on `workers`.
+    """
+    resolved = config.resolved()
+    rng = random.Random(resolved.seed)  # nosec B311
+    base_time = _base_time(resolved.seed)
+    batch_size = max(1, batch_size)
+
+    workspace_id = _slug_id("ws", resolved.company_name)
+    teams = _pick_teams(resolved.team_count or 0)
+    yield "workspace", [(workspace_id, resolved.company_name, _ts(base_time, 0))]
+
+    context = _ShardContext(
+        seed=resolved.seed,
+        workspace_id=workspace_id,
+        teams=teams,
+        base_time=base_time,
+        user_key=_id_key(rng),
+        row_key=_id_key(rng),
+        database_ids=tuple(_id_range("db", _id_key(rng), 0, 3)),
+    )
+    user_shards = [("user", start, count, 0) for start, count in _spans(resolved.user_count or 0, batch_size)]
+    user_names: list[str] = []
+    for record_type, batch in ordered_map(_build_shard, context, user_shards, workers=workers):
+        user_names.extend(map(itemgetter(2), batch))
+        yield record_type, batch
+
+    pages = _page_tuples(
+        workspace_id,
+        company_name=resolved.company_name,
+        industry=resolved.industry,
+        teams=teams,
+        user_names=user_names,
+        rng=rng,
+        base_time=base_time,
+    )
+    yield "page", pages
+    yield "database", _database_tuples(context)
+
+    # Row shards carry their offset into the shared row-ID permutation.
+    row_shards: list[tuple[str, int, int, int]] = []
+    row_offset = 0
+    for kind, total in (
+        ("project", resolved.project_count or 0),
+        ("incident", resolved.incident_count or 0),
+        ("candidate", resolved.candidate_count or 0),
+    ):
+        row_shards.extend((kind, start, count, row_offset) for start, count in _spans(total, batch_size))
+        row_offset += total
+    # User names are vocabulary-only, so like the other picks they go into property JSON as-is.
+    context.owners = user_names or ["TBD"]
+    yield from ordered_map(_build_shard, context, row_shards, workers=workers)
+
+    yield "comment", _comment_tuples(context, [page[0] for page in pages], len(user_names), rng)
+
+
+def fixture_exported_at(config: SyntheticWorkspaceConfig) -> str:
+    """The `exported_at` stamp `generate_fixture` uses for `config` (for NDJSON headers)."""
+    return _ts(_base_time(config.resolved().seed), 1)
+
+
+@dataclass
+class _ShardContext:
+    """Everything a shard needs besides its own seeded stream; shipped once per worker."""
+
+    seed: int
+    workspace_id: str
+    teams: list[str]
+    base_time: datetime
+    user_key: tuple[int, int]
+    row_key: tuple[int, int]
+    database_ids: tuple[str, ...]
+    owners: list[str] = field(default_factory=list)
+    # Rendered timestamps per day since `base_time`'s date; filled by `_ts_range`.
+    days: dict[int, list[str]] = field(default_factory=dict)
+
+
+def _build_shard(context: _ShardContext, shard: tuple[str, int, int, int]) -> FixtureBatch:
+    kind, start, count, row_offset = shard
+    rng = random.Random(f"{context.seed}:{kind}:{start}")  # nosec B311
+    if kind == "user":
+        return "user", _user_rows(context, rng, start, count)
+    builders = {"project": _project_rows, "incident": _incident_rows, "candidate": _candidate_rows}
+    ids = _id_range("row", context.row_key, row_offset + start, count)
+    return "database_row", builders[kind](context, rng, ids, start)
+
+
+_ID_MASK = (1 << 40) - 1
+
+
+def _id_range(prefix: str, key: tuple[int, int], start: int, count: int) -> list[str]:
+    # Affine permutation of the 40-bit space (odd multiplier): `_rand_id`-shaped but collision-free.
+    # The values are packed as little-endian words and their low 5 bytes regathered big-endian, so
+    # one `hex()` call renders every ID; the 8-byte words hold up to 2**24 steps past the first.
+    if count <= 0:
+        return []
+    if count > 1 << 20:
+        half = count // 2
+        head = _id_range(prefix, key, start, half)
+        return head + _id_range(prefix, key, start + half, count - half)
+    multiplier, offset = key
+    first = (start * multiplier + offset) & _ID_MASK
+    words = struct.pack(f"<{count}Q", *range(first, first + count * multiplier, multiplier))
+    digits = bytearray(5 * count)
+    for byte in range(5):
+        digits[byte::5] = words[4 - byte :: 8]
+    return f"{prefix}_{digits.hex(':', 5)}".replace(":", f"\n{prefix}_").split("\n")
+
+
+def _id_key(rng: random.Random) -> tuple[int, int]:
+    return rng.getrandbits(40) | 1, rng.getrandbits(40)
+
+
+def _ts_range(context: _ShardContext, start: int, count: int, step: int = 1) -> list[str]:
+    # `[_ts(base, start + i * step) for i in range(count)]`.
+    return list(chain.from_iterable(_ts_days(context, start, count, step)))
+
+
+def _date_range(context: _ShardContext, start: int, count: int, step: int = 1) -> list[str]:
+    # `[stamp[:10] for stamp in _ts_range(...)]`, sharing one date string per day.
+    dates: list[str] = []
+    for stamps in _ts_days(context, start, count, step):
+        dates.extend(repeat(stamps[0][:10], len(stamps)))
+    return dates
+
+
+def _ts_days(context: _ShardContext, start: int, count: int, step: int) -> Iterator[list[str]]:
+    # `_ts_range`, split by day. Base times are whole minutes, so every stamp sits on one 17-minute
+    # lattice; each day's lattice stamps are rendered once per context and sliced, so user and row
+    # shards share them instead of re-rendering per row.
+    base = context.base_time
+    minute = base.hour * 60 + base.minute + 17 * start
+    while count > 0:
+        day, offset = divmod(minute, 1440)
+        day_stamps = context.days.get(day)
+        if day_stamps is None:
+            prefix = date.fromordinal(base.toordinal() + day).isoformat()
+            times = _TIMES_OF_DAY[offset % 17 :: 17]
+            day_stamps = context.days[day] = [prefix + time for time in times]
+        taken = day_stamps[offset // 17 :: step][:count]
+        yield taken
+        count -= len(taken)
+        minute += 17 * step * len(taken)
+
+
+_TIMES_OF_DAY = [f"T{minute // 60:02d}:{minute % 60:02d}:00+00:00" for minute in range(1440)]
+
+
+def _team_slice(teams: list[str], start: int, count: int) -> Iterator[str]:
+    # `teams[(start + i) % len(teams)]` for i in range(count): round-robin assignment.
+    return islice(cycle(teams), start % len(teams), start % len(teams) + count)
+
+
+def _spans(total: int, batch_size: int) -> Iterator[tuple[int, int]]:
+    for start in range(0, total, batch_size):
+        yield start, min(batch_size, total - start)
+
+
+def _user_rows(
+    context: _ShardContext, rng: random.Random, start: int, count: int
+) -> list[tuple[Any, ...]]:
+    workspace_id = context.workspace_id
+    domain = _email_domain(workspace_id)
+    suffixes = [f"{team})" for team in context.teams]
+    return [
+        (user_id, workspace_id, f"{name}{suffix}", f"{stem}{index}@{domain}", created_at)
+        for user_id, (name, stem), suffix, index, created_at in zip(
+            _id_range("user", context.user_key, start, count),
+            rng.choices(_PEOPLE, k=count),
+            _team_slice(suffixes, start, count),
+            range(start, start + count),
+            _ts_range(context, 10 + start, count),
+            strict=True,
+        )
+    ]
+
+
+def _page_tuples(
+    workspace_id: str,
+    *,
+    company_name: str,
+    industry: str,
+    teams: list[str],
+    user_names: list[str],
+    rng: random.Random,
+    base_time: datetime,
+) -> list[tuple[Any, ...]]:
+    id_key = _id_key(rng)
+    page_defs: list[tuple[str, dict[str, Any], int, int, int]] = [
+        (title, {"type": "doc", "blocks": blocks}, index, 200 + index, 3)
+        for index, (title, blocks) in enumerate(
+            [
+                ("Company Handbook", _handbook_blocks(company_name, industry)),
+                ("Engineering Overview", _engineering_overview_blocks(company_name, teams)),
+                ("Onboarding Checklist", _onboarding_blocks(company_name)),
+                ("Incident Response", _incident_blocks()),
+                ("Architecture Map", _architecture_blocks()),
+                ("Product Roadmap", _roadmap_blocks()),
+                ("Security & Compliance", _security_blocks()),
+            ]
+        )
+    ]
+    for index, team in enumerate(teams):
+        content = {
+            "type": "doc",
+            "blocks": [
+                f"Mission: {team} delivers quarterly milestones with high availability.",
+                "Current priorities:",
+                "- Reliability OKRs",
+                "- Automation backlog",
+                "- Cross-team alignment",
+            ],
+            "owner": rng.choice(user_names) if user_names else "TBD",
+        }
+        page_defs.append((f"{team} Team Space", content, 100 + index, 240 + index, 1))
+
+    ids = _id_range("page", id_key, 0, len(page_defs))
+    return [
+        (
+            ids[position],
+            workspace_id,
+            title,
+            json.dumps(content),
+            json.dumps(
+                [a.model_dump() for a in _build_page_attachments(title, attachment_index, rng)]
+            ),
+            "workspace",
+            workspace_id,
+            _ts(base_time, created),
+            _ts(base_time, created + updated_after),
+        )
+        for position, (title, content, attachment_index, created, updated_after) in enumerate(
+            page_defs
+        )
+    ]
+
+
+def _database_tuples(context: _ShardContext) -> list[tuple[Any, ...]]:
+    return [
+        (
+            db_id,
+            context.workspace_id,
+            name,
+            json.dumps(schema),
+            _ts(context.base_time, created),
+            _ts(context.base_time, created + 1),
+        )
+        for db_id, (name, schema, created) in zip(
+            context.database_ids,
+            (
+                ("Program & Project Portfolio", _PROJECTS_SCHEMA, 310),
+                ("Incident Log", _INCIDENTS_SCHEMA, 360),
+                ("Hiring Pipeline", _HIRING_SCHEMA, 390),
+            ),
+            strict=True,
+        )
+    ]
+
+
+def _project_rows(
+    context: _ShardContext, rng: random.Random, ids: list[str], start: int
+) -> list[tuple[Any, ...]]:
+    count = len(ids)
+    properties = [
+        f'{{"Name": "Project {number}: {name}", "Owner": "{owner}", "Team": "{team}", '
+        f'"Status": "{status}", "Target": "{target_at}"}}'
+        for number, (name, status), owner, team, target_at in zip(
+            range(start + 1, start + count + 1),
+            rng.choices(_PROJECT_PICKS, k=count),
+            rng.choices(context.owners, k=count),
+            _team_slice(context.teams, start, count),
+            _date_range(context, 400 + start * 2, count, step=2),
+            strict=True,
+        )
+    ]
+    stamps = _ts_range(context, 330 + start, count + 1)
+    return _row_tuples(ids, context.database_ids[0], properties, stamps)
+
+
+def _incident_rows(
+    context: _ShardContext, rng: random.Random, ids: list[str], start: int
+) -> list[tuple[Any, ...]]:
+    count = len(ids)
+    properties = [
+        f'{{"Title": "INC-{number} {summary}", "Severity": "{severity}", '
+        f'"Status": "{status}", "Owner": "{owner}", "Detected": "{detected_at}", '
+        f'"Resolved": "{resolved_at}"}}'
+        for number, (summary, severity, status), owner, detected_at, resolved_at in zip(
+            range(1000 + start, 1000 + start + count),
+            rng.choices(_INCIDENT_PICKS, k=count),
+            rng.choices(context.owners, k=count),
+            _date_range(context, 500 + start * 3, count, step=3),
+            _date_range(context, 504 + start * 3, count, step=3),
+            strict=True,
+        )
+    ]
+    stamps = _ts_range(context, 370 + start, count + 2)
+    return _row_tuples(ids, context.database_ids[1], properties, stamps)
+
+
+def _candidate_rows(
+    context: _ShardContext, rng: random.Random, ids: list[str], start: int
+) -> list[tuple[Any, ...]]:
+    count = len(ids)
+    properties = [
+        f'{{{fields}, "Recruiter": "{recruiter}"}}'
+        for fields, recruiter in zip(
+            rng.choices(_CANDIDATE_PICKS, k=count),
+            rng.choices(context.owners, k=count),
+            strict=True,
+        )
+    ]
+    stamps = _ts_range(context, 420 + start, count + 1)
+    return _row_tuples(ids, context.database_ids[2], properties, stamps)
+
+
+def _row_tuples(
+    ids: list[str], database_id: str, properties: list[str], stamps: list[str]
+) -> list[tuple[Any, ...]]:
+    # `stamps` runs past the rows by however many steps each row's update lags its creation.
+    count = len(ids)
+    return list(
+        zip(
+            ids,
+            repeat(database_id, count),
+            properties,
+            stamps[:count],
+            stamps[len(stamps) - count :],
+            strict=True,
+        )
+    )
+
+
+def _comment_tuples(
+    context: _ShardContext, page_ids: list[str], user_count: int, rng: random.Random
+) -> list[tuple[Any, ...]]:
+    if not user_count:
+        return []
+    ids = _id_range("comment", _id_key(rng), 0, (len(page_ids) + 1) // 2)
+    comments: list[tuple[Any, ...]] = []
+    for index in range(0, len(page_ids), 2):
+        attachments = _build_comment_attachments(index, rng)
+        comments.append(
+            (
+                ids[index // 2],
+                page_ids[index],
+                # Authors' IDs come straight from the user permutation; none are kept per user.
+                _id_range("user", context.user_key, rng.randrange(user_count), 1)[0],
+                rng.choice(_COMMENT_NOTES),
+                json.dumps([a.model_dump() for a in attachments]),
+                _ts(context.base_time, 600 + index),
+            )
+        )
+    return comments
+
+
 def _base_time(seed: int) -> datetime:
     base = datetime(2026, 1, 15, 9, 30, tzinfo=UTC)
     return base + timedelta(days=seed % 20, hours=(seed % 5))
@@ -129,19 +514,14 @@ def _slug_id(prefix: str, name: str) -> str:
 
 
 def _pick_teams(team_count: int) -> list[str]:
-    default = [
-        "Platform",
-        "Product Engineering",
-        "Growth",
-        "Data",
-        "Security",
-        "Infrastructure",
-        "SRE",
-        "Developer Experience",
-        "Mobile",
-        "QA",
+    count = max(1, team_count)
+    # Past the named teams, cycle through them with a numeric suffix ("Platform 2", ...).
+    return [
+        _TEAM_NAMES[index]
+        if index < len(_TEAM_NAMES)
+        else f"{_TEAM_NAMES[index % len(_TEAM_NAMES)]} {index // len(_TEAM_NAMES) + 1}"
+        for index in range(count)
     ]
-    return default[: max(1, team_count)]
 
 
 def _build_users(
@@ -151,75 +531,12 @@ def _build_users(
     rng: random.Random,
     base_time: datetime,
 ) -> list[User]:
-    first_names = [
-        "Alex",
-        "Bianca",
-        "Cheng",
-        "Daria",
-        "Evan",
-        "Fatima",
-        "George",
-        "Hannah",
-        "Isaac",
-        "Jules",
-        "Kai",
-        "Lina",
-        "Maya",
-        "Noah",
-        "Omar",
-        "Priya",
-        "Quinn",
-        "Ravi",
-        "Sasha",
-        "Tara",
-        "Uma",
-        "Victor",
-        "Wen",
-        "Yara",
-        "Zane",
-    ]
-    last_names = [
-        "Rivers",
-        "Holt",
-        "Zhao",
-        "Martinez",
-        "Singh",
-        "Kim",
-        "Patel",
-        "Nguyen",
-        "Chen",
-        "Khan",
-        "Garcia",
-        "Adams",
-        "Bennett",
-        "Stone",
-        "Li",
-        "Brown",
-        "Miller",
-        "Davis",
-        "Sato",
-        "Costa",
-    ]
-    roles = [
-        "Engineering Manager",
-        "Senior Software Engineer",
-        "Staff Software Engineer",
-        "Product Manager",
-        "Tech Lead",
-        "Platform Engineer",
-        "SRE",
-        "Security Engineer",
-        "Data Engineer",
-        "QA Engineer",
-        "Designer",
-    ]
-
     users: list[User] = []
     for index in range(user_count):
-        first = rng.choice(first_names)
-        last = rng.choice(last_names)
+        first = rng.choice(_FIRST_NAMES)
+        last = rng.choice(_LAST_NAMES)
         team = teams[index % len(teams)]
-        role = rng.choice(roles)
+        role = rng.choice(_USER_ROLES)
         name = f"{first} {last}"
         email = f"{first}.{last}.{index}@{_email_domain(workspace_id)}".lower()
         created_at = _ts(base_time, 10 + index)
@@ -314,15 +631,7 @@ def _build_databases(
             id=projects_db_id,
             workspace_id=workspace_id,
             name="Program & Project Portfolio",
-            schema={
-                "properties": {
-                    "Name": {"type": "title"},
-                    "Owner": {"type": "person"},
-                    "Team": {"type": "select"},
-                    "Status": {"type": "select"},
-                    "Target": {"type": "date"},
-                }
-            },
+            schema=_PROJECTS_SCHEMA,
             created_at=_ts(base_time, 310),
             updated_at=_ts(base_time, 311),
         )
@@ -336,7 +645,7 @@ def _build_databases(
                     "Name": f"Project {index + 1}: {rng.choice(_PROJECT_NAMES)}",
                     "Owner": rng.choice(users).name if users else "TBD",
                     "Team": teams[index % len(teams)],
-                    "Status": rng.choice(["Planned", "In Progress", "On Hold", "Done"]),
+                    "Status": rng.choice(_PROJECT_STATUSES),
                     "Target": _ts(base_time, 400 + index * 2)[:10],
                 },
                 created_at=_ts(base_time, 330 + index),
@@ -350,16 +659,7 @@ def _build_databases(
             id=incidents_db_id,
             workspace_id=workspace_id,
             name="Incident Log",
-            schema={
-                "properties": {
-                    "Title": {"type": "title"},
-                    "Severity": {"type": "select"},
-                    "Status": {"type": "select"},
-                    "Owner": {"type": "person"},
-                    "Detected": {"type": "date"},
-                    "Resolved": {"type": "date"},
-                }
-            },
+            schema=_INCIDENTS_SCHEMA,
             created_at=_ts(base_time, 360),
             updated_at=_ts(base_time, 361),
         )
@@ -373,8 +673,8 @@ def _build_databases(
                 database_id=incidents_db_id,
                 properties={
                     "Title": f"INC-{1000 + index} {rng.choice(_INCIDENT_SUMMARIES)}",
-                    "Severity": rng.choice(["SEV1", "SEV2", "SEV3"]),
-                    "Status": rng.choice(["Resolved", "Monitoring", "Postmortem"]),
+                    "Severity": rng.choice(_SEVERITIES),
+                    "Status": rng.choice(_INCIDENT_STATUSES),
                     "Owner": rng.choice(users).name if users else "TBD",
                     "Detected": detected[:10],
                     "Resolved": resolved[:10],
@@ -390,15 +690,7 @@ def _build_databases(
             id=hiring_db_id,
             workspace_id=workspace_id,
             name="Hiring Pipeline",
-            schema={
-                "properties": {
-                    "Candidate": {"type": "title"},
-                    "Role": {"type": "select"},
-                    "Stage": {"type": "select"},
-                    "Source": {"type": "select"},
-                    "Recruiter": {"type": "person"},
-                }
-            },
+            schema=_HIRING_SCHEMA,
             created_at=_ts(base_time, 390),
             updated_at=_ts(base_time, 391),
         )
@@ -411,8 +703,8 @@ def _build_databases(
                 properties={
                     "Candidate": f"{rng.choice(_CANDIDATE_NAMES)}",
                     "Role": rng.choice(_ROLES),
-                    "Stage": rng.choice(["Screen", "Onsite", "Offer", "Hired"]),
-                    "Source": rng.choice(["Inbound", "Referral", "Sourcing", "Agency"]),
+                    "Stage": rng.choice(_STAGES),
+                    "Source": rng.choice(_SOURCES),
                     "Recruiter": rng.choice(users).name if users else "TBD",
                 },
                 created_at=_ts(base_time, 420 + index),
@@ -432,13 +724,6 @@ def _build_comments(
     comments: list[Comment] = []
     if not users:
         return comments
-    notes = [
-        "Please align this with Q3 OKRs.",
-        "Action item: update runbook links.",
-        "We should add metrics ownership for this section.",
-        "Confirmed with Legal: proceed.",
-        "Draft reviewed, ready for sign-off.",
-    ]
     for index, page in enumerate(pages):
         if index % 2 == 0:
             comments.append(
@@ -446,7 +731,7 @@ def _build_comments(
                     id=_rand_id("comment", rng),
                     page_id=page.id,
                     author_id=rng.choice(users).id,
-                    body=rng.choice(notes),
+                    body=rng.choice(_COMMENT_NOTES),
                     attachments=_build_comment_attachments(index, rng),
                     created_at=_ts(base_time, 600 + index),
                 )
@@ -457,14 +742,7 @@ def _build_comments(
 def _build_page_attachments(title: str, index: int, rng: random.Random) -> list[Attachment]:
     if index % 2 != 0:
         return []
-    extension, mime_type = rng.choice(
-        [
-            ("pdf", "application/pdf"),
-            ("png", "image/png"),
-            ("csv", "text/csv"),
-            ("txt", "text/plain"),
-        ]
-    )
+    extension, mime_type = rng.choice(_PAGE_ATTACHMENT_TYPES)
     slug = re.sub(r"[^a-z0-9]+", "-", title.lower()).strip("-") or "page"
     filename = f"{slug}-asset.{extension}"
     return [
@@ -618,3 +896,148 @@ _ROLES = [
     "Site Reliability Engineer",
     "Security Engineer",
 ]
+
+_FIRST_NAMES = [
+    "Alex",
+    "Bianca",
+    "Cheng",
+    "Daria",
+    "Evan",
+    "Fatima",
+    "George",
+    "Hannah",
+    "Isaac",
+    "Jules",
+    "Kai",
+    "Lina",
+    "Maya",
+    "Noah",
+    "Omar",
+    "Priya",
+    "Quinn",
+    "Ravi",
+    "Sasha",
+    "Tara",
+    "Uma",
+    "Victor",
+    "Wen",
+    "Yara",
+    "Zane",
+]
+_LAST_NAMES = [
+    "Rivers",
+    "Holt",
+    "Zhao",
+    "Martinez",
+    "Singh",
+    "Kim",
+    "Patel",
+    "Nguyen",
+    "Chen",
+    "Khan",
+    "Garcia",
+    "Adams",
+    "Bennett",
+    "Stone",
+    "Li",
+    "Brown",
+    "Miller",
+    "Davis",
+    "Sato",
+    "Costa",
+]
+_USER_ROLES = [
+    "Engineering Manager",
+    "Senior Software Engineer",
+    "Staff Software Engineer",
+    "Product Manager",
+    "Tech Lead",
+    "Platform Engineer",
+    "SRE",
+    "Security Engineer",
+    "Data Engineer",
+    "QA Engineer",
+    "Designer",
+]
+
+
+_TEAM_NAMES = [
+    "Platform",
+    "Product Engineering",
+    "Growth",
+    "Data",
+    "Security",
+    "Infrastructure",
+    "SRE",
+    "Developer Experience",
+    "Mobile",
+    "QA",
+]
+
+_PROJECTS_SCHEMA: dict[str, Any] = {
+    "properties": {
+        "Name": {"type": "title"},
+        "Owner": {"type": "person"},
+        "Team": {"type": "select"},
+        "Status": {"type": "select"},
+        "Target": {"type": "date"},
+    }
+}
+
+_INCIDENTS_SCHEMA: dict[str, Any] = {
+    "properties": {
+        "Title": {"type": "title"},
+        "Severity": {"type": "select"},
+        "Status": {"type": "select"},
+        "Owner": {"type": "person"},
+        "Detected": {"type": "date"},
+        "Resolved": {"type": "date"},
+    }
+}
+
+_HIRING_SCHEMA: dict[str, Any] = {
+    "properties": {
+        "Candidate": {"type": "title"},
+        "Role": {"type": "select"},
+        "Stage": {"type": "select"},
+        "Source": {"type": "select"},
+        "Recruiter": {"type": "person"},
+    }
+}
+
+_PROJECT_STATUSES = ["Planned", "In Progress", "On Hold", "Done"]
+_SEVERITIES = ["SEV1", "SEV2", "SEV3"]
+_INCIDENT_STATUSES = ["Resolved", "Monitoring", "Postmortem"]
+_STAGES = ["Screen", "Onsite", "Offer", "Hired"]
+_SOURCES = ["Inbound", "Referral", "Sourcing", "Agency"]
+
+_COMMENT_NOTES = [
+    "Please align this with Q3 OKRs.",
+    "Action item: update runbook links.",
+    "We should add metrics ownership for this section.",
+    "Confirmed with Legal: proceed.",
+    "Draft reviewed, ready for sign-off.",
+]
+
+_PAGE_ATTACHMENT_TYPES = [
+    ("pdf", "application/pdf"),
+    ("png", "image/png"),
+    ("csv", "text/csv"),
+    ("txt", "text/plain"),
+]
+
+# One draw per user over every (first, last, role) combination instead of three.
+_PEOPLE = [
+    (f"{first} {last} · {role} (", f"{first}.{last}.".lower())
+    for first in _FIRST_NAMES
+    for last in _LAST_NAMES
+    for role in _USER_ROLES
+]
+
+# Each row's vocabulary-only fields come from one draw over their cross product.
+_PROJECT_PICKS = list(product(_PROJECT_NAMES, _PROJECT_STATUSES))
+_INCIDENT_PICKS = list(product(_INCIDENT_SUMMARIES, _SEVERITIES, _INCIDENT_STATUSES))
+_CANDIDATE_PICKS = [
+    f'"Candidate": "{name}", "Role": "{role}", "Stage": "{stage}", "Source": "{source}"'
+    for name, role, stage, source in product(_CANDIDATE_NAMES, _ROLES, _STAGES, _SOURCES)
+]
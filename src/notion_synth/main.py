@@ -54,6 +54,7 @@ def create_app(db_path: str | None = None) -> FastAPI:
                 "X-Offset",
                 "X-Has-More",
                 "X-Next-Offset",
+                "X-Next-Cursor",
                 "Link",
                 "X-Notion-Synth-Delay-Ms",
                 "X-Notion-Synth-Fault-Injected",
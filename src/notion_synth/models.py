@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -29,6 +29,25 @@ class Stats(BaseModel):
     comments: int
 
 
+class ReaderPoolStats(BaseModel):
+    size: int
+    opened: int
+    in_use: int
+    idle: int
+    checkouts: int
+    waits: int
+    timeouts: int
+    wait_ms_total: float
+    wait_ms_max: float
+
+
+class PoolStats(BaseModel):
+    db_path: str
+    journal_mode: str
+    pooled: bool
+    readers: ReaderPoolStats | None = None
+
+
 class Workspace(BaseModel):
     id: str
     name: str
@@ -83,6 +102,27 @@ class Comment(BaseModel):
     created_at: str
 
 
+class SearchHit(BaseModel):
+    type: Literal["page", "comment", "row"]
+    id: str
+    score: float = Field(
+        description=(
+            "Relevance: negated bm25 scaled by the best hit across all searched types into (0, 1], "
+            "0 for LIKE fallback. Hits of every type share this scale and merge on it."
+        )
+    )
+    snippet: str = Field(description="Matching excerpt with terms wrapped in <mark></mark>.")
+    page: Page | None = None
+    comment: Comment | None = None
+    row: DatabaseRow | None = None
+
+
+class SearchResults(BaseModel):
+    query: str
+    hits: list[SearchHit]
+    counts: dict[str, int]
+
+
 class PageCreate(BaseModel):
     model_config = ConfigDict(
         json_schema_extra={
@@ -286,6 +326,7 @@ class Fixture(BaseModel):
 class FixtureImportResult(BaseModel):
     status: str
     inserted: dict[str, int]
+    batches: int | None = None
 
 
 class AdminResetResult(BaseModel):
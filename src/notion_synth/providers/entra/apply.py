@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import secrets
 from dataclasses import dataclass
+from typing import Any
 
 import httpx
 
 from notion_synth.blueprint_models import IdentityUser
-from notion_synth.providers.entra.graph import GraphClient
+from notion_synth.providers.entra.graph import GraphClient, directory_lookup
 from notion_synth.state import StateStore, upsert_identity
 
 
@@ -19,6 +20,15 @@ class EntraApplyResult:
     memberships_added: int = 0
 
 
+class EntraApplyError(RuntimeError):
+    """Some creates failed; everything else was applied and recorded, as counted in `result`."""
+
+    def __init__(self, failures: list[str], result: EntraApplyResult) -> None:
+        super().__init__(f"{len(failures)} Entra create(s) failed: " + "; ".join(failures))
+        self.failures = failures
+        self.result = result
+
+
 def apply_entra(
     *,
     client: GraphClient,
@@ -27,66 +37,73 @@ def apply_entra(
     store: StateStore,
     mode: str = "create",
     dry_run: bool = False,
+    prefetch: str = "auto",
 ) -> EntraApplyResult:
     if mode not in {"create", "sync"}:
         raise ValueError("mode must be 'create' or 'sync'")
     result = EntraApplyResult()
 
+    if any(not user.upn for user in roster):
+        raise ValueError("Roster entries must include upn for Entra provisioning.")
+    # Existence checks use one tenant snapshot or batched filter queries (see `directory_lookup`);
+    # creates and membership adds go through Graph `$batch` (20 calls per request).
+    lookup = directory_lookup(
+        client, [user.upn for user in roster], list(groups), prefetch=prefetch, store=store
+    )
     group_ids: dict[str, str] = {}
-    for group_name, _members in groups.items():
-        existing = client.find_group_by_name(group_name)
+    failures: list[str] = []
+    missing_groups: list[str] = []
+    for group_name, existing in lookup.find_groups_by_name(list(groups)).items():
         if existing:
             group_ids[group_name] = existing["id"]
             result.existing_groups += 1
-            continue
-        if mode == "sync":
-            continue
-        if dry_run:
-            result.created_groups += 1
-            continue
-        created = client.create_group(
-            {
-                "displayName": group_name,
-                "mailEnabled": False,
-                "mailNickname": group_name.replace(" ", "").lower()[:40],
-                "securityEnabled": True,
-            }
+        elif mode == "create":
+            missing_groups.append(group_name)
+    if dry_run:
+        result.created_groups += len(missing_groups)
+    elif missing_groups:
+        created_groups = client.create_groups(
+            [
+                {
+                    "displayName": group_name,
+                    "mailEnabled": False,
+                    "mailNickname": group_name.replace(" ", "").lower()[:40],
+                    "securityEnabled": True,
+                }
+                for group_name in missing_groups
+            ]
         )
-        group_ids[group_name] = created["id"]
-        result.created_groups += 1
+        for group_name, response in zip(missing_groups, created_groups, strict=True):
+            if response.is_error:
+                failures.append(_failure("group", group_name, response))
+                continue
+            group_ids[group_name] = response.json()["id"]
+            result.created_groups += 1
 
-    for user in roster:
-        if not user.upn:
-            raise ValueError("Roster entries must include upn for Entra provisioning.")
-        existing = client.find_user_by_upn(user.upn)
-        if existing:
-            upsert_identity(store, user.synth_user_id, entra_object_id=existing["id"], email=user.email)
-            result.existing_users += 1
-            continue
-        if mode == "sync":
-            continue
+    # Identity upserts commit in batches, not one transaction per user.
+    with store.batched():
+        existing_users = lookup.find_users_by_upn([user.upn for user in roster])
+        missing_users: list[IdentityUser] = []
+        for user in roster:
+            existing = existing_users[user.upn]
+            if existing:
+                upsert_identity(store, user.synth_user_id, entra_object_id=existing["id"], email=user.email)
+                result.existing_users += 1
+            elif mode == "create":
+                missing_users.append(user)
         if dry_run:
-            result.created_users += 1
-            continue
-        password = _random_password()
-        created = client.create_user(
-            {
-                "accountEnabled": True,
-                "displayName": user.display_name,
-                "mailNickname": user.upn.split("@")[0],
-                "userPrincipalName": user.upn,
-                "givenName": user.given_name,
-                "surname": user.surname,
-                "jobTitle": user.job_title,
-                "department": user.department,
-                "officeLocation": user.office_location,
-                "passwordProfile": {"forceChangePasswordNextSignIn": True, "password": password},
-            }
-        )
-        upsert_identity(store, user.synth_user_id, entra_object_id=created["id"], email=user.email)
-        result.created_users += 1
+            result.created_users += len(missing_users)
+        elif missing_users:
+            created_users = client.create_users([_user_payload(user) for user in missing_users])
+            for user, response in zip(missing_users, created_users, strict=True):
+                if response.is_error:
+                    failures.append(_failure("user", user.upn, response))
+                    continue
+                upsert_identity(store, user.synth_user_id, entra_object_id=response.json()["id"], email=user.email)
+                result.created_users += 1
 
     # Memberships
+    pairs: list[tuple[str, str]] = []
     for group_name, members in groups.items():
         group_id = group_ids.get(group_name)
         if not group_id:
@@ -97,19 +114,44 @@ def apply_entra(
             )
             if not identity or not identity["entra_object_id"]:
                 continue
-            if dry_run:
-                result.memberships_added += 1
-                continue
-            try:
-                client.add_member(group_id, identity["entra_object_id"])
-                result.memberships_added += 1
-            except httpx.HTTPStatusError as exc:
-                if exc.response is not None and exc.response.status_code in {400, 409}:
-                    continue
-                raise
+            pairs.append((group_id, identity["entra_object_id"]))
+    if dry_run:
+        result.memberships_added += len(pairs)
+        return result
+    for response in client.add_members(pairs):
+        if response.status_code in {400, 409}:
+            continue
+        response.raise_for_status()
+        result.memberships_added += 1
 
+    # Raised last: the users and groups that were created are recorded and got their memberships.
+    if failures:
+        raise EntraApplyError(failures, result)
     return result
 
 
+def _failure(kind: str, name: str, response: httpx.Response) -> str:
+    try:
+        message = (response.json().get("error") or {}).get("message", "")
+    except ValueError:
+        message = ""
+    return f"{kind} {name}: HTTP {response.status_code} {message}".rstrip()
+
+
+def _user_payload(user: IdentityUser) -> dict[str, Any]:
+    return {
+        "accountEnabled": True,
+        "displayName": user.display_name,
+        "mailNickname": user.upn.split("@")[0],
+        "userPrincipalName": user.upn,
+        "givenName": user.given_name,
+        "surname": user.surname,
+        "jobTitle": user.job_title,
+        "department": user.department,
+        "officeLocation": user.office_location,
+        "passwordProfile": {"forceChangePasswordNextSignIn": True, "password": _random_password()},
+    }
+
+
 def _random_password() -> str:
     return f"Aa{secrets.token_urlsafe(12)}1!"
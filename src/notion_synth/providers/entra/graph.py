@@ -1,78 +1,400 @@
 from __future__ import annotations
 
+import os
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, cast
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Protocol, cast
+from urllib.parse import quote
 
 import httpx
 
+from notion_synth.state import StateStore, get_delta_link, load_directory, save_directory_delta
+
+# Graph's JSON batching caps a `$batch` request at 20 sub-requests.
+GRAPH_BATCH_SIZE = 20
+# Largest `$top` Graph allows when listing users/groups.
+GRAPH_PAGE_SIZE = 999
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+GraphCall = tuple[str, str, dict[str, Any] | None]
+
 
 @dataclass
 class GraphClient:
+    """
+    Microsoft Graph client with a cached client-credentials token and one pooled `httpx.Client`.
+
+    The access token is reused until `token_refresh_margin` seconds before its `expires_in`
+    deadline (or until Graph answers 401), so steady-state calls make a single round-trip.
+    """
+
     tenant_id: str
     client_id: str
     client_secret: str
     base_url: str = "https://graph.microsoft.com/v1.0"
     timeout: float = 30.0
     max_retries: int = 5
+    token_refresh_margin: float = 300.0
+    transport: httpx.BaseTransport | None = None
+    _http: httpx.Client | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _token_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _access_token: str | None = field(default=None, init=False, repr=False)
+    _token_expires_at: float = field(default=0.0, init=False, repr=False)
+
+    def __enter__(self) -> GraphClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _client(self) -> httpx.Client:
+        with self._lock:
+            if self._http is None:
+                self._http = httpx.Client(timeout=self.timeout, transport=self.transport)
+            return self._http
 
     def _token(self) -> str:
-        token_url = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
-        response = httpx.post(
-            token_url,
-            data={
-                "client_id": self.client_id,
-                "client_secret": self.client_secret,
-                "scope": "https://graph.microsoft.com/.default",
-                "grant_type": "client_credentials",
-            },
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-        return cast(str, response.json()["access_token"])
+        cached = self._cached_token()
+        if cached:
+            return cached
+        # One refresh at a time; threads that queued behind it reuse the new token.
+        with self._token_lock:
+            cached = self._cached_token()
+            if cached:
+                return cached
+            token_url = f"https://login.microsoftonline.com/{self.tenant_id}/oauth2/v2.0/token"
+            response = self._client().post(
+                token_url,
+                data={
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                    "scope": "https://graph.microsoft.com/.default",
+                    "grant_type": "client_credentials",
+                },
+            )
+            response.raise_for_status()
+            payload = response.json()
+            expires_in = float(payload.get("expires_in", 3600))
+            token = cast(str, payload["access_token"])
+            with self._lock:
+                self._access_token = token
+                self._token_expires_at = time.monotonic() + max(0.0, expires_in - self.token_refresh_margin)
+            return token
+
+    def _cached_token(self) -> str | None:
+        with self._lock:
+            if self._access_token and time.monotonic() < self._token_expires_at:
+                return self._access_token
+            return None
+
+    def _invalidate_token(self) -> None:
+        with self._lock:
+            self._access_token = None
 
     def request(self, method: str, path: str, *, json: Any | None = None) -> dict[str, Any]:
-        token = self._token()
-        url = f"{self.base_url}{path}"
+        response = self._send(method, path, json=json)
+        if response.status_code == 204:
+            return {}
+        return cast(dict[str, Any], response.json())
+
+    def _send(
+        self, method: str, path: str, *, json: Any | None = None, headers: dict[str, str] | None = None
+    ) -> httpx.Response:
+        client = self._client()
+        # `@odata.nextLink` / delta links come back as absolute URLs.
+        url = path if path.startswith("https://") else f"{self.base_url}{path}"
         retries = 0
+        reauthenticated = False
         while True:
-            response = httpx.request(
+            response = client.request(
                 method,
                 url,
-                headers={"Authorization": f"Bearer {token}", "Content-Type": "application/json"},
+                headers={
+                    "Authorization": f"Bearer {self._token()}",
+                    "Content-Type": "application/json",
+                    **(headers or {}),
+                },
                 json=json,
-                timeout=self.timeout,
             )
-            if response.status_code in {429, 500, 502, 503, 504} and retries < self.max_retries:
+            if response.status_code == 401 and not reauthenticated:
+                # Token revoked or expired early: fetch a fresh one once.
+                self._invalidate_token()
+                reauthenticated = True
+                continue
+            if response.status_code in RETRY_STATUSES and retries < self.max_retries:
                 time.sleep(min(2 ** retries, 20))
                 retries += 1
                 continue
             response.raise_for_status()
-            if response.status_code == 204:
-                return {}
-            return cast(dict[str, Any], response.json())
+            return response
+
+    def list_all(self, path: str) -> list[dict[str, Any]]:
+        """GET a collection, following `@odata.nextLink` until the last page."""
+        items: list[dict[str, Any]] = []
+        next_path: str | None = path
+        while next_path:
+            page = self.request("GET", next_path)
+            items.extend(page.get("value", []))
+            next_path = page.get("@odata.nextLink")
+        return items
+
+    def count_users(self) -> int:
+        # `$count` is an advanced query and needs eventual consistency.
+        return int(self._send("GET", "/users/$count", headers={"ConsistencyLevel": "eventual"}).text)
+
+    def delta(self, path: str) -> tuple[list[dict[str, Any]], str]:
+        """Run one delta round: follow `@odata.nextLink` pages, return changes and the `@odata.deltaLink`."""
+        changes: list[dict[str, Any]] = []
+        next_path = path
+        while True:
+            page = self.request("GET", next_path)
+            changes.extend(page.get("value", []))
+            if page.get("@odata.nextLink"):
+                next_path = page["@odata.nextLink"]
+                continue
+            return changes, cast(str, page["@odata.deltaLink"])
+
+    def snapshot(self, *, group_prefix: str = "") -> DirectorySnapshot:
+        """Page through every user (id + UPN) and the groups starting with `group_prefix` once."""
+        users = self.list_all(f"/users?$select=id,userPrincipalName&$top={GRAPH_PAGE_SIZE}")
+        group_path = f"/groups?$select=id,displayName&$top={GRAPH_PAGE_SIZE}"
+        if group_prefix:
+            escaped = group_prefix.replace("'", "''")
+            group_path += "&$filter=" + quote(f"startswith(displayName,'{escaped}')")
+        groups = self.list_all(group_path)
+        return DirectorySnapshot(
+            users={str(user["userPrincipalName"]).lower(): user for user in users if user.get("userPrincipalName")},
+            groups={str(group["displayName"]): group for group in groups if group.get("displayName")},
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._http = self._http, None
+        if client is not None:
+            client.close()
+
+    def batch(self, calls: Sequence[GraphCall]) -> list[httpx.Response]:
+        """
+        Send `(method, path, body)` calls through Graph's JSON `$batch` endpoint, 20 per request.
+
+        Returns one `httpx.Response` per call, in input order, so callers can check
+        `status_code` or `raise_for_status()` per item. Items throttled or failing with 5xx
+        inside a batch are resent (after the longest `Retry-After`) up to `max_retries` times.
+        """
+        responses: list[httpx.Response | None] = [None] * len(calls)
+        for start in range(0, len(calls), GRAPH_BATCH_SIZE):
+            pending = list(range(start, min(start + GRAPH_BATCH_SIZE, len(calls))))
+            retries = 0
+            while pending:
+                data = self.request(
+                    "POST", "/$batch", json={"requests": [_batch_item(index, calls[index]) for index in pending]}
+                )
+                retry: list[int] = []
+                wait = 0.0
+                for item in data.get("responses", []):
+                    index = int(item["id"])
+                    status = int(item["status"])
+                    headers = item.get("headers") or {}
+                    if status in RETRY_STATUSES and retries < self.max_retries:
+                        retry.append(index)
+                        wait = max(wait, _retry_after(headers, retries))
+                        continue
+                    method, path, _ = calls[index]
+                    request = httpx.Request(method, f"{self.base_url}{path}")
+                    body = item.get("body")
+                    if body is None:
+                        responses[index] = httpx.Response(status, headers=headers, request=request)
+                    else:
+                        responses[index] = httpx.Response(status, headers=headers, json=body, request=request)
+                pending = sorted(retry)
+                if pending:
+                    time.sleep(wait)
+                    retries += 1
+        return cast(list[httpx.Response], responses)
 
     def find_user_by_upn(self, upn: str) -> dict[str, Any] | None:
-        encoded = upn.replace("'", "''")
-        response = self.request("GET", f"/users?$filter=userPrincipalName eq '{encoded}'")
+        response = self.request("GET", _user_filter_path(upn))
         values = response.get("value", [])
         return values[0] if values else None
 
+    def find_users_by_upn(self, upns: Sequence[str]) -> dict[str, dict[str, Any] | None]:
+        responses = self.batch([("GET", _user_filter_path(upn), None) for upn in upns])
+        return {upn: _first_value(response) for upn, response in zip(upns, responses, strict=True)}
+
     def create_user(self, payload: dict[str, Any]) -> dict[str, Any]:
         return self.request("POST", "/users", json=payload)
 
+    def create_users(self, payloads: Sequence[dict[str, Any]]) -> list[httpx.Response]:
+        """Batch `create_user` calls; per-item responses are returned unraised, so one failure loses no success."""
+        return self.batch([("POST", "/users", payload) for payload in payloads])
+
     def find_group_by_name(self, name: str) -> dict[str, Any] | None:
-        encoded = name.replace("'", "''")
-        response = self.request("GET", f"/groups?$filter=displayName eq '{encoded}'")
+        response = self.request("GET", _group_filter_path(name))
         values = response.get("value", [])
         return values[0] if values else None
 
+    def find_groups_by_name(self, names: Sequence[str]) -> dict[str, dict[str, Any] | None]:
+        responses = self.batch([("GET", _group_filter_path(name), None) for name in names])
+        return {name: _first_value(response) for name, response in zip(names, responses, strict=True)}
+
     def create_group(self, payload: dict[str, Any]) -> dict[str, Any]:
         return self.request("POST", "/groups", json=payload)
 
+    def create_groups(self, payloads: Sequence[dict[str, Any]]) -> list[httpx.Response]:
+        """Batch `create_group` calls; per-item responses are returned unraised, like `create_users`."""
+        return self.batch([("POST", "/groups", payload) for payload in payloads])
+
     def add_member(self, group_id: str, user_id: str) -> None:
-        self.request(
-            "POST",
-            f"/groups/{group_id}/members/$ref",
-            json={"@odata.id": f"{self.base_url}/directoryObjects/{user_id}"},
+        path, body = _member_ref(self.base_url, group_id, user_id)
+        self.request("POST", path, json=body)
+
+    def add_members(self, pairs: Sequence[tuple[str, str]]) -> list[httpx.Response]:
+        """Batch `add_member` calls; per-item responses are returned unraised (400/409 = already a member)."""
+        return self.batch([("POST", *_member_ref(self.base_url, group_id, user_id)) for group_id, user_id in pairs])
+
+
+@dataclass
+class DirectorySnapshot:
+    """In-memory users (keyed by lower-cased UPN) and groups (by display name) from one prefetch."""
+
+    users: dict[str, dict[str, Any]]
+    groups: dict[str, dict[str, Any]]
+
+    def find_users_by_upn(self, upns: Sequence[str]) -> dict[str, dict[str, Any] | None]:
+        return {upn: self.users.get(upn.lower()) for upn in upns}
+
+    def find_groups_by_name(self, names: Sequence[str]) -> dict[str, dict[str, Any] | None]:
+        return {name: self.groups.get(name) for name in names}
+
+
+class DirectoryLookup(Protocol):
+    def find_users_by_upn(self, upns: Sequence[str]) -> dict[str, dict[str, Any] | None]: ...
+
+    def find_groups_by_name(self, names: Sequence[str]) -> dict[str, dict[str, Any] | None]: ...
+
+
+def directory_lookup(
+    client: GraphClient,
+    upns: Sequence[str],
+    group_names: Sequence[str],
+    *,
+    prefetch: str = "auto",
+    store: StateStore | None = None,
+) -> DirectoryLookup:
+    """
+    Pick how to check which users/groups exist: batched filter queries or one tenant snapshot.
+
+    `prefetch="auto"` compares the pages needed to list the whole tenant (999 users each)
+    against the `$batch` requests needed to look up each roster entry (20 each).
+    `prefetch="delta"` keeps the snapshot in `store` and fetches only changes (`sync_directory`).
+    """
+    if prefetch not in {"auto", "always", "never", "delta"}:
+        raise ValueError("prefetch must be 'auto', 'always', 'never' or 'delta'")
+    if prefetch == "delta":
+        if store is None:
+            raise ValueError("prefetch='delta' requires a state store")
+        return sync_directory(client, store)
+    if prefetch == "never" or (prefetch == "auto" and not upns):
+        return client
+    if prefetch == "auto" and not prefetch_worthwhile(len(upns) + len(group_names), client.count_users()):
+        return client
+    return client.snapshot(group_prefix=os.path.commonprefix(list(group_names)))
+
+
+def prefetch_worthwhile(lookups: int, tenant_users: int) -> bool:
+    # +1 page for the (prefix-filtered) group listing.
+    snapshot_requests = -(-tenant_users // GRAPH_PAGE_SIZE) + 1
+    batch_requests = -(-lookups // GRAPH_BATCH_SIZE)
+    return snapshot_requests < batch_requests
+
+
+# Delta rounds per resource: the collection's delta URL and the field used as its lookup key.
+_DELTA_RESOURCES = {
+    "users": ("/users/delta?$select=id,userPrincipalName", "userPrincipalName"),
+    "groups": ("/groups/delta?$select=id,displayName", "displayName"),
+}
+
+
+def sync_directory(client: GraphClient, store: StateStore) -> DirectorySnapshot:
+    """
+    Bring the directory cached in `store` up to date with Graph delta queries.
+
+    The first call (or one whose delta link has expired) pages through every user and group;
+    later calls resume from the stored `@odata.deltaLink` and only transfer what changed.
+    """
+    for resource, (start_path, name_field) in _DELTA_RESOURCES.items():
+        delta_link = get_delta_link(store, client.tenant_id, resource)
+        replace = delta_link is None
+        try:
+            changes, next_link = client.delta(delta_link or start_path)
+        except httpx.HTTPStatusError as exc:
+            # An expired delta token answers 410 Gone: start over with a full round.
+            if delta_link is None or exc.response.status_code != 410:
+                raise
+            changes, next_link = client.delta(start_path)
+            replace = True
+        save_directory_delta(
+            store,
+            client.tenant_id,
+            resource,
+            changed=[(item["id"], item.get(name_field)) for item in changes if "@removed" not in item],
+            removed=[item["id"] for item in changes if "@removed" in item],
+            delta_link=next_link,
+            replace=replace,
         )
+    return DirectorySnapshot(
+        users={
+            row["name"].lower(): {"id": row["object_id"], "userPrincipalName": row["name"]}
+            for row in load_directory(store, client.tenant_id, "users")
+        },
+        groups={
+            row["name"]: {"id": row["object_id"], "displayName": row["name"]}
+            for row in load_directory(store, client.tenant_id, "groups")
+        },
+    )
+
+
+def _user_filter_path(upn: str) -> str:
+    encoded = upn.replace("'", "''")
+    return "/users?$filter=" + quote(f"userPrincipalName eq '{encoded}'")
+
+
+def _group_filter_path(name: str) -> str:
+    encoded = name.replace("'", "''")
+    return "/groups?$filter=" + quote(f"displayName eq '{encoded}'")
+
+
+def _member_ref(base_url: str, group_id: str, user_id: str) -> tuple[str, dict[str, Any]]:
+    return f"/groups/{group_id}/members/$ref", {"@odata.id": f"{base_url}/directoryObjects/{user_id}"}
+
+
+def _batch_item(index: int, call: GraphCall) -> dict[str, Any]:
+    method, path, body = call
+    item: dict[str, Any] = {"id": str(index), "method": method, "url": path}
+    if body is not None:
+        item["body"] = body
+        item["headers"] = {"Content-Type": "application/json"}
+    return item
+
+
+def _retry_after(headers: dict[str, str], retries: int) -> float:
+    for key, value in headers.items():
+        if key.lower() == "retry-after":
+            try:
+                return float(value)
+            except ValueError:
+                break
+    return float(min(2**retries, 20))
+
+
+def _first_value(response: httpx.Response) -> dict[str, Any] | None:
+    values = _json_body(response).get("value", [])
+    return cast(dict[str, Any], values[0]) if values else None
+
+
+def _json_body(response: httpx.Response) -> dict[str, Any]:
+    response.raise_for_status()
+    return cast(dict[str, Any], response.json())
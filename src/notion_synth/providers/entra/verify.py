@@ -3,8 +3,9 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 from notion_synth.blueprint_models import IdentityUser
-from notion_synth.providers.entra.graph import GraphClient
+from notion_synth.providers.entra.graph import GraphClient, directory_lookup
 from notion_synth.providers.notion.client import NotionClient
+from notion_synth.providers.notion.users import USER_CACHE_TTL_SECONDS, user_directory
 from notion_synth.state import StateStore, upsert_identity
 
 
@@ -24,43 +25,35 @@ def verify_provisioning(
     roster: list[IdentityUser],
     company: str,
     store: StateStore,
+    prefetch: str = "auto",
+    user_cache_ttl: float = USER_CACHE_TTL_SECONDS,
 ) -> ProvisioningReport:
     missing_in_entra: list[str] = []
     missing_in_notion: list[str] = []
     missing_groups: list[str] = []
 
-    # Entra users
-    for user in roster:
-        if not user.upn:
-            continue
-        if not graph.find_user_by_upn(user.upn):
-            missing_in_entra.append(user.upn)
-
-    # Entra groups
+    # Entra users and groups (tenant snapshot or batched lookups)
+    upns = [user.upn for user in roster if user.upn]
     groups = sorted({f"SYNTH-{company}-{user.team}" for user in roster if user.team})
-    for group in groups:
-        if not graph.find_group_by_name(group):
-            missing_groups.append(group)
+    lookup = directory_lookup(graph, upns, groups, prefetch=prefetch, store=store)
+    entra_users = lookup.find_users_by_upn(upns)
+    missing_in_entra.extend(upn for upn in upns if not entra_users[upn])
+
+    entra_groups = lookup.find_groups_by_name(groups)
+    missing_groups.extend(group for group in groups if not entra_groups[group])
 
-    # Notion users
-    notion_users = notion.list_users()
-    email_map: dict[str, str] = {}
-    for notion_user in notion_users:
-        person = notion_user.get("person") or {}
-        email = person.get("email")
-        if email:
-            notion_user_id = notion_user.get("id")
-            if notion_user_id:
-                email_map[email.lower()] = notion_user_id
+    # Notion users (cached directory; see `user_directory`)
+    email_map = user_directory(notion, store, emails=[user.email for user in roster], ttl=user_cache_ttl)
 
     matched = 0
-    for user in roster:
-        email = user.email.lower() if user.email else ""
-        if email and email in email_map:
-            upsert_identity(store, user.synth_user_id, notion_user_id=email_map[email], email=email)
-            matched += 1
-        elif email:
-            missing_in_notion.append(email)
+    with store.batched():
+        for user in roster:
+            email = user.email.lower() if user.email else ""
+            if email and email in email_map:
+                upsert_identity(store, user.synth_user_id, notion_user_id=email_map[email], email=email)
+                matched += 1
+            elif email:
+                missing_in_notion.append(email)
 
     return ProvisioningReport(
         total=len(roster),
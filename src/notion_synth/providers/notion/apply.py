@@ -1,28 +1,57 @@
 from __future__ import annotations
 
+import asyncio
+import itertools
+import json
 import random
-import re
+import sqlite3
 import time
-from dataclasses import dataclass
+from collections.abc import Coroutine, Generator, Iterable
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, cast
+from urllib.parse import urlencode
 
 from notion_synth.audit import AuditLog
-from notion_synth.blueprint_models import Blueprint, PageSpec, RowPropertySpec
-from notion_synth.providers.notion.client import NotionClient
+from notion_synth.blueprint_diff import BlueprintDiff, plan_synth_ids
+from notion_synth.blueprint_models import (
+    PLACEHOLDER_PATTERN,
+    Blueprint,
+    CommentSpec,
+    DatabaseSpec,
+    NotionPlan,
+    PageSpec,
+    RootSpec,
+    RowPropertySpec,
+    RowSpec,
+)
+from notion_synth.providers.notion.client import AsyncNotionClient, NotionClient
+from notion_synth.providers.notion.users import USER_CACHE_TTL_SECONDS, user_directory
 from notion_synth.state import (
     StateStore,
+    clear_applied_blueprints,
+    clear_run_requests,
+    delete_object,
     get_identity,
     get_object,
-    list_objects_by_kind,
+    is_remote_id_tracked,
+    list_run_requests,
+    load_checkpoints,
     mark_event_run,
+    preloaded,
+    record_request_done,
+    record_request_start,
+    save_checkpoint,
     upsert_identity,
     upsert_object,
     was_event_run,
 )
 from notion_synth.util import stable_hash
 
-PLACEHOLDER_PATTERN = re.compile(r"\[\[synth:(?P<kind>page|user):(?P<id>[a-zA-Z0-9_\-:]+)\]\]")
+# Notion takes at most 100 children per create/append request and rejects bodies over 500 KB;
+# the byte budget leaves room for the rest of the payload.
+MAX_BLOCK_CHILDREN = 100
+MAX_CHILDREN_BYTES = 400_000
 
 
 @dataclass
@@ -30,6 +59,8 @@ class ApplyResult:
     created: int = 0
     updated: int = 0
     skipped: int = 0
+    resumed: int = 0
+    archived: int = 0
 
 
 @dataclass
@@ -39,24 +70,27 @@ class VerifyResult:
     missing: list[str]
 
 
-def verify_users(client: NotionClient, store: StateStore, roster: list[dict[str, str]]) -> VerifyResult:
-    users = client.list_users()
-    email_map = {}
-    for user in users:
-        person = user.get("person") or {}
-        email = person.get("email")
-        if email:
-            email_map[email.lower()] = user.get("id")
+def verify_users(
+    client: NotionClient,
+    store: StateStore,
+    roster: list[dict[str, str]],
+    *,
+    user_cache_ttl: float = USER_CACHE_TTL_SECONDS,
+) -> VerifyResult:
+    email_map = user_directory(
+        client, store, emails=[row.get("email", "") for row in roster], ttl=user_cache_ttl
+    )
 
     matched = 0
     missing: list[str] = []
-    for row in roster:
-        email = row.get("email", "").lower()
-        if email and email in email_map:
-            upsert_identity(store, row["synth_user_id"], notion_user_id=email_map[email], email=email)
-            matched += 1
-        elif email:
-            missing.append(email)
+    with store.batched():
+        for row in roster:
+            email = row.get("email", "").lower()
+            if email and email in email_map:
+                upsert_identity(store, row["synth_user_id"], notion_user_id=email_map[email], email=email)
+                matched += 1
+            elif email:
+                missing.append(email)
     total = len(roster)
     return VerifyResult(matched=matched, total=total, missing=missing)
 
@@ -69,243 +103,763 @@ def apply_blueprint(
     client: NotionClient,
     audit: AuditLog,
     mode: str = "apply",
+    run_id: str | None = None,
+    resume: bool = False,
+    changes: BlueprintDiff | None = None,
 ) -> ApplyResult:
-    if mode not in {"apply", "plan"}:
-        raise ValueError("mode must be 'apply' or 'plan'")
-    result = ApplyResult()
-
-    def record(action: str, kind: str, synth_id: str, remote_id: str | None) -> None:
-        audit.write({"action": action, "kind": kind, "synth_id": synth_id, "remote_id": remote_id})
-
-    # Roots
-    for root in blueprint.notion_plan.roots:
-        payload = _page_payload(root_page_id, root.title, [])
-        spec_hash = _page_spec_hash(root.title, [])
-        existing = get_object(store, root.synth_id)
-        if existing and existing["spec_hash"] == spec_hash:
-            result.skipped += 1
-            continue
-        if mode == "plan":
-            record("plan_create", "page", root.synth_id, None)
-            result.created += 1
+    """
+    Create or update every object of the blueprint's Notion plan, then resolve page links.
+
+    With a `run_id` (apply mode) progress is journaled in the state store; `resume=True` picks a
+    journaled run up after its last checkpoint instead of re-checking every completed object.
+    `changes` (see `diff_blueprints`) limits the run to its creates and updates and archives
+    the objects it drops, so untouched specs cost nothing.
+    """
+    context = _ApplyContext(root_page_id=root_page_id, store=store, audit=audit, mode=mode, changes=changes)
+    with preloaded(store, _plan_synth_ids(blueprint, changes)), store.batched():
+        journal = _Journal.open(context, run_id, resume=resume)
+        tasks = _apply_tasks(blueprint, context)
+        _drive_phase(journal, _OBJECTS_PHASE, [(task.synth_id, task.step) for task in tasks], client)
+        store.flush()
+        _drive_phase(journal, _LINKS_PHASE, _link_steps(blueprint, context, journal), client)
+        _drive_phase(journal, _ARCHIVES_PHASE, _archive_steps(context), client)
+        journal.finish()
+    return context.result
+
+
+async def apply_blueprint_async(
+    blueprint: Blueprint,
+    *,
+    root_page_id: str,
+    store: StateStore,
+    client: AsyncNotionClient,
+    audit: AuditLog,
+    mode: str = "apply",
+    concurrency: int = 8,
+    run_id: str | None = None,
+    resume: bool = False,
+    changes: BlueprintDiff | None = None,
+) -> ApplyResult:
+    """
+    Concurrent `apply_blueprint`: each object waits only for the objects it depends on.
+
+    Dependencies come from `parent_synth_id`/`database_synth_id`/`page_synth_id` plus page
+    mentions, so every create sees the same state-store entries as in a sequential run. Up to
+    `concurrency` requests are in flight at once; state-store writes and audit records stay on
+    the event loop thread. Checkpoints advance past an object only once every earlier object
+    has completed, so `resume` works the same as for `apply_blueprint`.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    context = _ApplyContext(root_page_id=root_page_id, store=store, audit=audit, mode=mode, changes=changes)
+    limit = asyncio.Semaphore(concurrency)
+    tasks = _apply_tasks(blueprint, context)
+    done = {task.synth_id: asyncio.Event() for task in tasks}
+
+    async def run(index: int, task: _ApplyTask) -> None:
+        for dep in task.deps:
+            await done[dep].wait()
+        await _drive_async(journal.track(_OBJECTS_PHASE, task.synth_id, task.step), client, limit)
+        journal.complete(_OBJECTS_PHASE, index)
+        done[task.synth_id].set()
+
+    with preloaded(store, _plan_synth_ids(blueprint, changes)), store.batched():
+        journal = _Journal.open(context, run_id, resume=resume)
+        for index, task in enumerate(tasks):
+            if journal.skip(_OBJECTS_PHASE, index):
+                done[task.synth_id].set()
+        await _gather(
+            run(index, task) for index, task in enumerate(tasks) if not journal.skip(_OBJECTS_PHASE, index)
+        )
+        store.flush()
+        await _drive_phase_async(journal, _LINKS_PHASE, _link_steps(blueprint, context, journal), client, limit)
+        await _drive_phase_async(journal, _ARCHIVES_PHASE, _archive_steps(context), client, limit)
+        journal.finish()
+    return context.result
+
+
+# Each object is applied by a generator "step": it reads the state store, yields the Notion
+# request it needs, receives the response, then records state and audit. The same steps are
+# driven one at a time by `apply_blueprint` and concurrently by `apply_blueprint_async`.
+_Call = tuple[str, str, dict[str, Any] | None]
+_Step = Generator[_Call, dict[str, Any], None]
+
+
+@dataclass
+class _ApplyContext:
+    root_page_id: str
+    store: StateStore
+    audit: AuditLog
+    mode: str
+    changes: BlueprintDiff | None = None
+    result: ApplyResult = field(default_factory=ApplyResult)
+    pages_pending_links: list[PageSpec] = field(default_factory=list)
+    # Remote ids a resumed run adopted instead of creating them again (see `_Journal._reconcile`).
+    adopted: set[str] = field(default_factory=set)
+
+    def __post_init__(self) -> None:
+        if self.mode not in {"apply", "plan"}:
+            raise ValueError("mode must be 'apply' or 'plan'")
+
+    def record(self, action: str, kind: str, synth_id: str, remote_id: str | None) -> None:
+        self.audit.write({"action": action, "kind": kind, "synth_id": synth_id, "remote_id": remote_id})
+
+
+# Phases of a journaled apply; each checkpoint counts the leading steps of its phase that completed.
+_OBJECTS_PHASE = "objects"
+_LINKS_PHASE = "links"
+_ARCHIVES_PHASE = "archives"
+
+
+@dataclass
+class _Journal:
+    """
+    Progress journal of one apply run, kept in the state store's `run_checkpoints`/`run_requests`.
+
+    Every Notion request is recorded under an idempotency key (stable for the run, phase, object,
+    endpoint and the request's position among that object's calls, e.g. one per block chunk)
+    and marked done with the response, so a crashed run leaves the requests whose outcome is
+    unknown. Creates are committed before they are sent, since Notion has no idempotency keys;
+    other journal rows share the write batches of the objects they describe, so a checkpoint is
+    never committed ahead of the state it vouches for. On resume, a create the run already sent
+    is not sent again: its recorded remote id is adopted, or, if no response was recorded, the
+    object is looked up under its parent (see `_find_created`). A page whose body appends were
+    cut short has its blocks listed first, so chunks that already landed are not appended twice.
+    Without a `run_id` (or in plan mode) the journal is inert.
+    """
+
+    context: _ApplyContext
+    run_id: str | None
+    checkpoints: dict[str, int] = field(default_factory=dict)
+    _completed: dict[str, set[int]] = field(default_factory=dict)
+    # Creates journaled by the run being resumed: idempotency key -> remote id, if answered.
+    _sent_creates: dict[str, str | None] = field(default_factory=dict)
+
+    @classmethod
+    def open(cls, context: _ApplyContext, run_id: str | None, *, resume: bool) -> _Journal:
+        if context.mode != "apply" or run_id is None:
+            if resume:
+                raise ValueError("resume needs a run_id and mode 'apply'")
+            return cls(context, None)
+        journal = cls(context, run_id)
+        if resume:
+            journal.checkpoints = load_checkpoints(context.store, run_id)
+            context.result.resumed = journal.checkpoints.get(_OBJECTS_PHASE, 0)
+            for request in list_run_requests(context.store, run_id):
+                if request["method"] == "POST":
+                    journal._sent_creates[request["idempotency_key"]] = request["remote_id"]
+                if request["completed_at"] is not None:
+                    continue
+                context.audit.write(
+                    {
+                        "action": "resume_in_flight",
+                        "synth_id": request["synth_id"],
+                        "method": request["method"],
+                        "path": request["path"],
+                        "idempotency_key": request["idempotency_key"],
+                    }
+                )
+        return journal
+
+    @property
+    def active(self) -> bool:
+        return self.run_id is not None
+
+    def skip(self, phase: str, index: int) -> bool:
+        return index < self.checkpoints.get(phase, 0)
+
+    def complete(self, phase: str, index: int) -> None:
+        if self.run_id is None:
+            return
+        completed = self._completed.setdefault(phase, set())
+        completed.add(index)
+        position = start = self.checkpoints.get(phase, 0)
+        while position in completed:
+            completed.remove(position)
+            position += 1
+        if position != start:
+            self.checkpoints[phase] = position
+            save_checkpoint(self.context.store, self.run_id, phase, position)
+
+    def track(self, phase: str, synth_id: str, step: _Step) -> _Step:
+        if self.run_id is None:
+            return step
+        return self._tracked(self.run_id, phase, synth_id, step)
+
+    def finish(self) -> None:
+        # Completed runs keep their checkpoints; the per-request rows only matter after a crash.
+        if self.run_id is not None:
+            clear_run_requests(self.context.store, self.run_id)
+
+    def _tracked(self, run_id: str, phase: str, synth_id: str, step: _Step) -> _Step:
+        store = self.context.store
+        try:
+            call = next(step)
+            for seq in itertools.count():
+                method, path, _ = call
+                key = stable_hash(
+                    {"run_id": run_id, "phase": phase, "synth_id": synth_id, "seq": seq, "method": method, "path": path}
+                )
+                if key in self._sent_creates:
+                    remote_id = yield from self._reconcile(run_id, key, synth_id, call)
+                    if remote_id is not None:
+                        call = step.send({"id": remote_id})
+                        continue
+                record_request_start(store, run_id, key, synth_id=synth_id, method=method, path=path)
+                if method == "POST":
+                    store.flush()
+                response = yield call
+                record_request_done(store, run_id, key, response.get("id"))
+                call = step.send(response)
+        except StopIteration:
+            return
+
+    def _reconcile(self, run_id: str, key: str, synth_id: str, call: _Call) -> Generator[_Call, Any, str | None]:
+        remote_id = self._sent_creates.pop(key)
+        if remote_id is None:
+            remote_id = yield from _find_created(call, self.context.store)
+            if remote_id is None:
+                return None
+            record_request_done(self.context.store, run_id, key, remote_id)
+        self.context.adopted.add(remote_id)
+        self.context.audit.write(
+            {"action": "resume_adopted", "synth_id": synth_id, "remote_id": remote_id, "idempotency_key": key}
+        )
+        return remote_id
+
+
+@dataclass
+class _ApplyTask:
+    synth_id: str
+    deps: tuple[str, ...]
+    step: _Step
+
+
+def _apply_tasks(blueprint: Blueprint, context: _ApplyContext) -> list[_ApplyTask]:
+    """Steps in sequential apply order; deps only point at earlier tasks, so the graph is acyclic."""
+    plan = _plan(blueprint, context)
+    tasks: list[_ApplyTask] = []
+    seen: set[str] = set()
+
+    def add(synth_id: str, deps: list[str], step: _Step) -> None:
+        tasks.append(_ApplyTask(synth_id, tuple(dict.fromkeys(dep for dep in deps if dep in seen)), step))
+        seen.add(synth_id)
+
+    for root in plan.roots:
+        add(root.synth_id, [], _root_step(root, context))
+    for db in plan.databases:
+        add(db.synth_id, [db.parent_synth_id], _database_step(db, context))
+    for page in plan.pages:
+        mentions = [ident for block in page.blocks for ident in _page_mentions(block.text or "")]
+        add(page.synth_id, [page.parent_synth_id, *mentions], _page_step(page, context))
+    for row in plan.rows:
+        add(row.synth_id, [row.database_synth_id], _row_step(row, context))
+    for comment in plan.comments:
+        add(comment.synth_id, [comment.page_synth_id, *_page_mentions(comment.body)], _comment_step(comment, context))
+    return tasks
+
+
+def _plan(blueprint: Blueprint, context: _ApplyContext) -> NotionPlan:
+    """The blueprint's Notion plan, narrowed to the creates and updates of `context.changes`."""
+    plan = blueprint.notion_plan
+    if context.changes is None:
+        return plan
+    changed = context.changes.changed
+    return NotionPlan.model_construct(
+        roots=[spec for spec in plan.roots if spec.synth_id in changed],
+        databases=[spec for spec in plan.databases if spec.synth_id in changed],
+        pages=[spec for spec in plan.pages if spec.synth_id in changed],
+        rows=[spec for spec in plan.rows if spec.synth_id in changed],
+        comments=[spec for spec in plan.comments if spec.synth_id in changed],
+    )
+
+
+def _plan_synth_ids(blueprint: Blueprint, changes: BlueprintDiff | None = None) -> list[str]:
+    if changes is not None:
+        return [*changes.creates, *changes.updates, *changes.archives]
+    return plan_synth_ids(blueprint.notion_plan)
+
+
+def _page_mentions(text: str) -> list[str]:
+    return [match.group("id") for match in PLACEHOLDER_PATTERN.finditer(text) if match.group("kind") == "page"]
+
+
+def _find_created(call: _Call, store: StateStore) -> Generator[_Call, Any, str | None]:
+    """
+    The object an unanswered create may have left in Notion, if any: the newest child of its
+    parent, not tracked in state yet, with the create's title (pages, databases, rows) or text
+    (comments).
+    """
+    _, path, body = call
+    payload = cast(dict[str, Any], body)
+    parent = payload["parent"]
+    if path == "/comments":
+        comments = yield from _listing("GET", "/comments", {"block_id": parent["page_id"]})
+        text = _plain_text(payload["rich_text"])
+        matches = [comment["id"] for comment in comments if _plain_text(comment.get("rich_text", [])) == text]
+    elif "database_id" in parent:
+        titles = [(name, value["title"]) for name, value in payload["properties"].items() if "title" in value]
+        if not titles:
+            return None
+        name, title = titles[0]
+        rows = yield from _listing(
+            "POST",
+            f"/databases/{parent['database_id']}/query",
+            {
+                "filter": {"property": name, "title": {"equals": _plain_text(title)}},
+                "sorts": [{"timestamp": "created_time", "direction": "ascending"}],
+            },
+        )
+        matches = [row["id"] for row in rows]
+    else:
+        kind, title = (
+            ("child_database", payload["title"])
+            if path == "/databases"
+            else ("child_page", payload["properties"]["title"]["title"])
+        )
+        children = yield from _listing("GET", f"/blocks/{parent['page_id']}/children")
+        text = _plain_text(title)
+        matches = [child["id"] for child in children if (child.get(kind) or {}).get("title") == text]
+    untracked = [remote_id for remote_id in matches if not is_remote_id_tracked(store, remote_id)]
+    return untracked[-1] if untracked else None
+
+
+def _listing(
+    method: str, path: str, query: dict[str, Any] | None = None
+) -> Generator[_Call, Any, list[dict[str, Any]]]:
+    # Every result of a paginated endpoint: GET takes the query in the URL, POST (database queries) in the body.
+    results: list[dict[str, Any]] = []
+    params: dict[str, Any] = {**(query or {}), "page_size": 100}
+    while True:
+        if method == "GET":
+            page = yield (method, f"{path}?{urlencode(params)}", None)
+        else:
+            page = yield (method, path, params)
+        results.extend(page.get("results", []))
+        if not page.get("has_more"):
+            return results
+        params["start_cursor"] = page.get("next_cursor")
+
+
+def _plain_text(rich_text: list[dict[str, Any]]) -> str:
+    # Only text runs: a mention renders differently in a response than in the request that made it.
+    return "".join(part["text"]["content"] for part in rich_text if part.get("type") == "text")
+
+
+def _drive(step: _Step, client: NotionClient) -> None:
+    try:
+        method, path, payload = next(step)
+        while True:
+            method, path, payload = step.send(client.request(method, path, json=payload))
+    except StopIteration:
+        return
+
+
+async def _drive_async(step: _Step, client: AsyncNotionClient, limit: asyncio.Semaphore) -> None:
+    try:
+        method, path, payload = next(step)
+        while True:
+            async with limit:
+                response = await client.request(method, path, json=payload)
+            method, path, payload = step.send(response)
+    except StopIteration:
+        return
+
+
+def _drive_phase(journal: _Journal, phase: str, steps: list[tuple[str, _Step]], client: NotionClient) -> None:
+    for index, (synth_id, step) in enumerate(steps):
+        if journal.skip(phase, index):
             continue
-        created = client.create_page(payload)
+        _drive(journal.track(phase, synth_id, step), client)
+        journal.complete(phase, index)
+
+
+async def _drive_phase_async(
+    journal: _Journal, phase: str, steps: list[tuple[str, _Step]], client: AsyncNotionClient, limit: asyncio.Semaphore
+) -> None:
+    async def run(index: int, synth_id: str, step: _Step) -> None:
+        await _drive_async(journal.track(phase, synth_id, step), client, limit)
+        journal.complete(phase, index)
+
+    await _gather(
+        run(index, synth_id, step) for index, (synth_id, step) in enumerate(steps) if not journal.skip(phase, index)
+    )
+
+
+async def _gather(coroutines: Iterable[Coroutine[Any, Any, None]]) -> None:
+    # TaskGroup cancels the remaining work on the first failure; re-raise that error unwrapped.
+    try:
+        async with asyncio.TaskGroup() as group:
+            for coroutine in coroutines:
+                group.create_task(coroutine)
+    except ExceptionGroup as exc:
+        raise exc.exceptions[0] from None
+
+
+def _root_step(root: RootSpec, context: _ApplyContext) -> _Step:
+    store = context.store
+    payload = _page_payload(context.root_page_id, root.title, [])
+    spec_hash = _page_spec_hash(root.title, [])
+    existing = get_object(store, root.synth_id)
+    if existing and existing["spec_hash"] == spec_hash:
+        context.result.skipped += 1
+        return
+    if context.mode == "plan":
+        context.record("plan_create", "page", root.synth_id, None)
+        context.result.created += 1
+        return
+    created = yield ("POST", "/pages", payload)
+    upsert_object(
+        store,
+        root.synth_id,
+        kind="page",
+        provider="notion",
+        remote_id=created["id"],
+        parent_synth_id=None,
+        spec_hash=spec_hash,
+    )
+    context.record("created", "page", root.synth_id, created["id"])
+    context.result.created += 1
+
+
+def _database_step(db: DatabaseSpec, context: _ApplyContext) -> _Step:
+    store = context.store
+    parent_id = _resolve_parent_id(db.parent_type, db.parent_synth_id, context.root_page_id, store)
+    payload = {
+        "parent": {"type": "page_id", "page_id": parent_id},
+        "title": _rich_text(db.title),
+        "properties": db.properties,
+    }
+    spec_hash = stable_hash(payload)
+    existing = get_object(store, db.synth_id)
+    if existing and existing["spec_hash"] == spec_hash:
+        context.result.skipped += 1
+        return
+    if context.mode == "plan":
+        context.record("plan_create", "database", db.synth_id, None)
+        context.result.created += 1
+        return
+    if existing:
+        updated = yield (
+            "PATCH",
+            f"/databases/{existing['remote_id']}",
+            {"title": _rich_text(db.title), "properties": db.properties},
+        )
         upsert_object(
             store,
-            root.synth_id,
-            kind="page",
+            db.synth_id,
+            kind="database",
+            provider="notion",
+            remote_id=updated["id"],
+            parent_synth_id=db.parent_synth_id,
+            spec_hash=spec_hash,
+        )
+        context.record("updated", "database", db.synth_id, updated["id"])
+        context.result.updated += 1
+    else:
+        created = yield ("POST", "/databases", payload)
+        upsert_object(
+            store,
+            db.synth_id,
+            kind="database",
             provider="notion",
             remote_id=created["id"],
-            parent_synth_id=None,
+            parent_synth_id=db.parent_synth_id,
             spec_hash=spec_hash,
         )
-        record("created", "page", root.synth_id, created["id"])
-        result.created += 1
-
-    # Databases
-    for db in blueprint.notion_plan.databases:
-        parent_id = _resolve_parent_id(db.parent_type, db.parent_synth_id, root_page_id, store)
-        payload = {
-            "parent": {"type": "page_id", "page_id": parent_id},
-            "title": _rich_text(db.title),
-            "properties": db.properties,
-        }
-        spec_hash = stable_hash(payload)
-        existing = get_object(store, db.synth_id)
-        if existing and existing["spec_hash"] == spec_hash:
-            result.skipped += 1
-            continue
-        if mode == "plan":
-            record("plan_create", "database", db.synth_id, None)
-            result.created += 1
-            continue
-        if existing:
-            updated = client.update_database(existing["remote_id"], {"title": _rich_text(db.title), "properties": db.properties})
-            upsert_object(
-                store,
-                db.synth_id,
-                kind="database",
-                provider="notion",
-                remote_id=updated["id"],
-                parent_synth_id=db.parent_synth_id,
-                spec_hash=spec_hash,
-            )
-            record("updated", "database", db.synth_id, updated["id"])
-            result.updated += 1
-        else:
-            created = client.create_database(payload)
-            upsert_object(
-                store,
-                db.synth_id,
-                kind="database",
-                provider="notion",
-                remote_id=created["id"],
-                parent_synth_id=db.parent_synth_id,
-                spec_hash=spec_hash,
-            )
-            record("created", "database", db.synth_id, created["id"])
-            result.created += 1
-
-    # Pages
-    pages_pending_links: list[PageSpec] = []
-    for page in blueprint.notion_plan.pages:
-        parent_id = _resolve_parent_id(page.parent_type, page.parent_synth_id, root_page_id, store)
-        resolved_blocks, has_unresolved = _blocks_from_spec(page.blocks, store)
-        payload = _page_payload(parent_id, page.title, resolved_blocks)
-        spec_hash = _page_spec_hash(page.title, resolved_blocks)
-        existing = get_object(store, page.synth_id)
-        if existing and existing["spec_hash"] == spec_hash:
-            result.skipped += 1
-            if has_unresolved:
-                pages_pending_links.append(page)
-            continue
-        if mode == "plan":
-            record("plan_create", "page", page.synth_id, None)
-            result.created += 1
-            continue
-        if existing:
-            updated = client.update_page(existing["remote_id"], {"properties": {"title": {"title": _rich_text(page.title)}}})
-            if resolved_blocks:
-                client.request("PATCH", f"/blocks/{existing['remote_id']}/children", json={"children": resolved_blocks})
-            upsert_object(
-                store,
-                page.synth_id,
-                kind="page",
-                provider="notion",
-                remote_id=updated["id"],
-                parent_synth_id=page.parent_synth_id,
-                spec_hash=spec_hash,
-            )
-            record("updated", "page", page.synth_id, updated["id"])
-            result.updated += 1
+        context.record("created", "database", db.synth_id, created["id"])
+        context.result.created += 1
+
+
+def _page_step(page: PageSpec, context: _ApplyContext) -> _Step:
+    store = context.store
+    parent_id = _resolve_parent_id(page.parent_type, page.parent_synth_id, context.root_page_id, store)
+    resolved_blocks, has_unresolved = _blocks_from_spec(page.blocks, store)
+    spec_hash = _page_spec_hash(page.title, resolved_blocks)
+    existing = get_object(store, page.synth_id)
+    if existing and existing["spec_hash"] == spec_hash:
+        context.result.skipped += 1
+        if has_unresolved:
+            context.pages_pending_links.append(page)
+        return
+    if context.mode == "plan":
+        context.record("plan_create", "page", page.synth_id, None)
+        context.result.created += 1
+        return
+    appended = _appended_chunks(existing["spec_hash"], spec_hash) if existing else None
+    if existing and appended is None:
+        updated = yield (
+            "PATCH",
+            f"/pages/{existing['remote_id']}",
+            {"properties": {"title": {"title": _rich_text(page.title)}}},
+        )
+        yield from _append_blocks(existing["remote_id"], _chunk_blocks(resolved_blocks))
+        upsert_object(
+            store,
+            page.synth_id,
+            kind="page",
+            provider="notion",
+            remote_id=updated["id"],
+            parent_synth_id=page.parent_synth_id,
+            spec_hash=spec_hash,
+        )
+        context.record("updated", "page", page.synth_id, updated["id"])
+        context.result.updated += 1
+    else:
+        chunks = _chunk_blocks(resolved_blocks)
+        if existing and appended is not None:
+            # An earlier run created the page and died while appending its body.
+            remote_id = existing["remote_id"]
         else:
-            created = client.create_page(payload)
+            created = yield ("POST", "/pages", _page_payload(parent_id, page.title, chunks[0] if chunks else []))
+            remote_id, appended = created["id"], 1
+        if len(chunks) > 1 and (existing or remote_id in context.adopted):
+            # The recorded progress may lag an append whose response was lost: count what landed.
+            children = yield from _listing("GET", f"/blocks/{remote_id}/children")
+            appended = _landed_chunks(chunks, children)
+        for index in range(appended, len(chunks)):
+            # Commit the page and how much of its body Notion holds before each append, so a
+            # run that dies mid-way resumes after the last appended chunk.
             upsert_object(
                 store,
                 page.synth_id,
                 kind="page",
                 provider="notion",
-                remote_id=created["id"],
+                remote_id=remote_id,
                 parent_synth_id=page.parent_synth_id,
-                spec_hash=spec_hash,
+                spec_hash=_partial_page_hash(spec_hash, index),
             )
-            record("created", "page", page.synth_id, created["id"])
-            result.created += 1
-        if has_unresolved:
-            pages_pending_links.append(page)
+            yield from _append_blocks(remote_id, chunks[index : index + 1])
+        upsert_object(
+            store,
+            page.synth_id,
+            kind="page",
+            provider="notion",
+            remote_id=remote_id,
+            parent_synth_id=page.parent_synth_id,
+            spec_hash=spec_hash,
+        )
+        context.record("created", "page", page.synth_id, remote_id)
+        context.result.created += 1
+    if has_unresolved:
+        context.pages_pending_links.append(page)
 
-    # Rows (database entries)
-    for row in blueprint.notion_plan.rows:
-        db_obj = get_object(store, row.database_synth_id)
-        if not db_obj:
-            continue
-        properties = _row_properties(row.properties, store)
-        payload = {"parent": {"database_id": db_obj["remote_id"]}, "properties": properties}
-        spec_hash = stable_hash(payload)
-        existing = get_object(store, row.synth_id)
-        if existing and existing["spec_hash"] == spec_hash:
-            result.skipped += 1
-            continue
-        if mode == "plan":
-            record("plan_create", "row", row.synth_id, None)
-            result.created += 1
-            continue
-        if existing:
-            updated = client.update_page(existing["remote_id"], {"properties": properties})
-            upsert_object(
-                store,
-                row.synth_id,
-                kind="row",
-                provider="notion",
-                remote_id=updated["id"],
-                parent_synth_id=row.database_synth_id,
-                spec_hash=spec_hash,
-            )
-            record("updated", "row", row.synth_id, updated["id"])
-            result.updated += 1
-        else:
-            created = client.create_page(payload)
-            upsert_object(
-                store,
-                row.synth_id,
-                kind="row",
-                provider="notion",
-                remote_id=created["id"],
-                parent_synth_id=row.database_synth_id,
-                spec_hash=spec_hash,
-            )
-            record("created", "row", row.synth_id, created["id"])
-            result.created += 1
 
-    # Comments
-    for comment in blueprint.notion_plan.comments:
-        page_obj = get_object(store, comment.page_synth_id)
-        if not page_obj:
-            continue
-        rich_text, _ = _rich_text_with_placeholders(comment.body, store)
-        payload = {"parent": {"page_id": page_obj["remote_id"]}, "rich_text": rich_text}
-        spec_hash = stable_hash(payload)
-        existing = get_object(store, comment.synth_id)
-        if existing and existing["spec_hash"] == spec_hash:
-            result.skipped += 1
-            continue
-        if mode == "plan":
-            record("plan_create", "comment", comment.synth_id, None)
-            result.created += 1
-            continue
-        created = client.create_comment(payload)
+def _row_step(row: RowSpec, context: _ApplyContext) -> _Step:
+    store = context.store
+    db_obj = get_object(store, row.database_synth_id)
+    if not db_obj:
+        return
+    properties = _row_properties(row.properties, store)
+    payload = {"parent": {"database_id": db_obj["remote_id"]}, "properties": properties}
+    spec_hash = stable_hash(payload)
+    existing = get_object(store, row.synth_id)
+    if existing and existing["spec_hash"] == spec_hash:
+        context.result.skipped += 1
+        return
+    if context.mode == "plan":
+        context.record("plan_create", "row", row.synth_id, None)
+        context.result.created += 1
+        return
+    if existing:
+        updated = yield ("PATCH", f"/pages/{existing['remote_id']}", {"properties": properties})
         upsert_object(
             store,
-            comment.synth_id,
-            kind="comment",
+            row.synth_id,
+            kind="row",
+            provider="notion",
+            remote_id=updated["id"],
+            parent_synth_id=row.database_synth_id,
+            spec_hash=spec_hash,
+        )
+        context.record("updated", "row", row.synth_id, updated["id"])
+        context.result.updated += 1
+    else:
+        created = yield ("POST", "/pages", payload)
+        upsert_object(
+            store,
+            row.synth_id,
+            kind="row",
             provider="notion",
             remote_id=created["id"],
-            parent_synth_id=comment.page_synth_id,
+            parent_synth_id=row.database_synth_id,
             spec_hash=spec_hash,
         )
-        record("created", "comment", comment.synth_id, created["id"])
-        result.created += 1
+        context.record("created", "row", row.synth_id, created["id"])
+        context.result.created += 1
+
 
+def _comment_step(comment: CommentSpec, context: _ApplyContext) -> _Step:
+    store = context.store
+    page_obj = get_object(store, comment.page_synth_id)
+    if not page_obj:
+        return
+    rich_text, _ = _rich_text_with_placeholders(comment.body, store)
+    payload = {"parent": {"page_id": page_obj["remote_id"]}, "rich_text": rich_text}
+    spec_hash = stable_hash(payload)
+    existing = get_object(store, comment.synth_id)
+    if existing and existing["spec_hash"] == spec_hash:
+        context.result.skipped += 1
+        return
+    if context.mode == "plan":
+        context.record("plan_create", "comment", comment.synth_id, None)
+        context.result.created += 1
+        return
+    created = yield ("POST", "/comments", payload)
+    upsert_object(
+        store,
+        comment.synth_id,
+        kind="comment",
+        provider="notion",
+        remote_id=created["id"],
+        parent_synth_id=comment.page_synth_id,
+        spec_hash=spec_hash,
+    )
+    context.record("created", "comment", comment.synth_id, created["id"])
+    context.result.created += 1
+
+
+def _link_steps(blueprint: Blueprint, context: _ApplyContext, journal: _Journal) -> list[tuple[str, _Step]]:
     # Link resolution pass (pages with unresolved placeholders)
-    if pages_pending_links and mode == "apply":
-        for page in pages_pending_links:
-            page_obj = get_object(store, page.synth_id)
-            if not page_obj:
-                continue
-            resolved_blocks, _ = _blocks_from_spec(page.blocks, store, force_resolve=True)
-            payload_hash = _page_spec_hash(page.title, resolved_blocks)
-            if page_obj["spec_hash"] == payload_hash:
-                continue
-            client.request("PATCH", f"/blocks/{page_obj['remote_id']}/children", json={"children": resolved_blocks})
-            upsert_object(
-                store,
-                page.synth_id,
-                kind="page",
-                provider="notion",
-                remote_id=page_obj["remote_id"],
-                parent_synth_id=page.parent_synth_id,
-                spec_hash=payload_hash,
-            )
+    if context.mode != "apply":
+        return []
+    pages = context.pages_pending_links
+    if journal.active:
+        # A resumed run skips the page steps that queue links, so journaled runs take every page
+        # with a placeholder, in plan order; pages already linked finish without a request.
+        pages = [
+            page
+            for page in _plan(blueprint, context).pages
+            if any(PLACEHOLDER_PATTERN.search(block.text or "") for block in page.blocks)
+        ]
+    return [(page.synth_id, _link_step(page, context)) for page in pages]
+
+
+def _archive_steps(context: _ApplyContext) -> list[tuple[str, _Step]]:
+    if context.changes is None:
+        return []
+    removed = set(context.changes.archives)
+    return [(synth_id, _archive_step(synth_id, removed, context)) for synth_id in context.changes.archives]
+
+
+def _archive_step(synth_id: str, removed: set[str], context: _ApplyContext) -> _Step:
+    store = context.store
+    obj = get_object(store, synth_id)
+    if not obj:
+        return
+    if context.mode == "plan":
+        context.record("plan_archive", obj["kind"], synth_id, obj["remote_id"])
+        context.result.archived += 1
+        return
+    # Children of an archived page/database go with it; the API cannot delete comments.
+    if obj["kind"] != "comment" and obj["parent_synth_id"] not in removed:
+        yield ("PATCH", f"/pages/{obj['remote_id']}", {"archived": True})
+    delete_object(store, synth_id)
+    context.record("archived", obj["kind"], synth_id, obj["remote_id"])
+    context.result.archived += 1
+
 
-    return result
+def _link_step(page: PageSpec, context: _ApplyContext) -> _Step:
+    store = context.store
+    page_obj = get_object(store, page.synth_id)
+    if not page_obj:
+        return
+    resolved_blocks, _ = _blocks_from_spec(page.blocks, store, force_resolve=True)
+    payload_hash = _page_spec_hash(page.title, resolved_blocks)
+    if page_obj["spec_hash"] == payload_hash:
+        return
+    yield from _append_blocks(page_obj["remote_id"], _chunk_blocks(resolved_blocks))
+    upsert_object(
+        store,
+        page.synth_id,
+        kind="page",
+        provider="notion",
+        remote_id=page_obj["remote_id"],
+        parent_synth_id=page.parent_synth_id,
+        spec_hash=payload_hash,
+    )
 
 
 def destroy_blueprint(store: StateStore, client: NotionClient, audit: AuditLog) -> int:
-    archived = 0
-    kinds = ("page", "database", "row")
+    """
+    Archive every page, database and row in state; returns how many were archived.
+
+    Archiving a page or database archives everything below it, so only the top-most tracked
+    objects (by `parent_synth_id`) get a request; their subtrees are audited as archived with
+    them and removed from state together with their comments. Stored apply baselines are
+    dropped first, so a later `--incremental` apply starts from a full one.
+    """
+    clear_applied_blueprints(store)
+    trees = _destroy_trees(store)
+    with store.batched():
+        for step in _destroy_steps(trees, store, audit):
+            _drive(step, client)
+    return _archived_count(trees)
+
+
+async def destroy_blueprint_async(
+    store: StateStore, client: AsyncNotionClient, audit: AuditLog, *, concurrency: int = 8
+) -> int:
+    """`destroy_blueprint` with up to `concurrency` archive requests in flight (the subtrees are disjoint)."""
+    if concurrency < 1:
+        raise ValueError("concurrency must be >= 1")
+    limit = asyncio.Semaphore(concurrency)
+    clear_applied_blueprints(store)
+    trees = _destroy_trees(store)
+    with store.batched():
+        await _gather(_drive_async(step, client, limit) for step in _destroy_steps(trees, store, audit))
+    return _archived_count(trees)
+
+
+_ARCHIVABLE_KINDS = ("page", "database", "row")
+
+# A top-most archivable object and every tracked object below it.
+_DestroyTree = tuple[sqlite3.Row, list[sqlite3.Row]]
+
+
+def _destroy_trees(store: StateStore) -> list[_DestroyTree]:
+    objects = {obj["synth_id"]: obj for obj in store.query_all("SELECT * FROM objects ORDER BY created_at, synth_id")}
+    children: dict[str, list[sqlite3.Row]] = {}
+    for obj in objects.values():
+        if obj["parent_synth_id"] is not None:
+            children.setdefault(obj["parent_synth_id"], []).append(obj)
+
+    def archived_with_parent(obj: sqlite3.Row) -> bool:
+        parent = objects.get(obj["parent_synth_id"])
+        return parent is not None and parent["kind"] in _ARCHIVABLE_KINDS
+
+    trees: list[_DestroyTree] = []
     seen: set[str] = set()
-    for kind in kinds:
-        for obj in list_objects_by_kind(store, kind):
-            remote_id = obj["remote_id"]
-            if remote_id in seen:
-                continue
-            client.archive_page(remote_id)
-            audit.write(
-                {"action": "archived", "kind": kind, "synth_id": obj["synth_id"], "remote_id": remote_id}
-            )
-            archived += 1
-            seen.add(remote_id)
-    return archived
+    for obj in objects.values():
+        if obj["kind"] not in _ARCHIVABLE_KINDS or archived_with_parent(obj) or obj["remote_id"] in seen:
+            continue
+        seen.add(obj["remote_id"])
+        subtree: list[sqlite3.Row] = []
+        pending = list(children.get(obj["synth_id"], []))
+        while pending:
+            child = pending.pop()
+            subtree.append(child)
+            pending.extend(children.get(child["synth_id"], []))
+        trees.append((obj, subtree))
+    return trees
+
+
+def _destroy_steps(trees: list[_DestroyTree], store: StateStore, audit: AuditLog) -> list[_Step]:
+    return [_destroy_step(top, subtree, store, audit) for top, subtree in trees]
+
+
+def _destroy_step(top: sqlite3.Row, subtree: list[sqlite3.Row], store: StateStore, audit: AuditLog) -> _Step:
+    yield ("PATCH", f"/pages/{top['remote_id']}", {"archived": True})
+    for obj in (top, *subtree):
+        delete_object(store, obj["synth_id"])
+        event = {"action": "archived", "kind": obj["kind"], "synth_id": obj["synth_id"], "remote_id": obj["remote_id"]}
+        if obj is not top:
+            event["with"] = top["synth_id"]
+        audit.write(event)
+
+
+def _archived_count(trees: list[_DestroyTree]) -> int:
+    return sum(1 + sum(obj["kind"] in _ARCHIVABLE_KINDS for obj in subtree) for _, subtree in trees)
 
 
 def run_activity(
@@ -356,10 +910,52 @@ def _page_payload(parent_id: str, title: str, blocks: list[dict[str, Any]]) -> d
     }
 
 
+def _chunk_blocks(blocks: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    """Split blocks into request-sized runs: at most `MAX_BLOCK_CHILDREN` and `MAX_CHILDREN_BYTES` each."""
+    chunks: list[list[dict[str, Any]]] = []
+    size = 0
+    for block in blocks:
+        block_size = len(json.dumps(block, separators=(",", ":")).encode("utf-8"))
+        if not chunks or len(chunks[-1]) >= MAX_BLOCK_CHILDREN or size + block_size > MAX_CHILDREN_BYTES:
+            chunks.append([])
+            size = 0
+        chunks[-1].append(block)
+        size += block_size
+    return chunks
+
+
+def _append_blocks(block_id: str, chunks: list[list[dict[str, Any]]]) -> _Step:
+    # Appends to one parent must stay in order, so a page's chunks go one request at a time;
+    # the async engine still overlaps the appends of different pages.
+    for chunk in chunks:
+        yield ("PATCH", f"/blocks/{block_id}/children", {"children": chunk})
+
+
 def _page_spec_hash(title: str, blocks: list[dict[str, Any]]) -> str:
     return stable_hash({"title": title, "children": blocks})
 
 
+def _partial_page_hash(spec_hash: str, appended: int) -> str:
+    # State of a page created with only its first `appended` block chunks of the `spec_hash` body.
+    return f"partial:{appended}:{spec_hash}"
+
+
+def _appended_chunks(stored_hash: str, spec_hash: str) -> int | None:
+    prefix, _, rest = stored_hash.partition(":")
+    appended, _, partial_of = rest.partition(":")
+    return int(appended) if prefix == "partial" and partial_of == spec_hash else None
+
+
+def _landed_chunks(chunks: list[list[dict[str, Any]]], children: list[dict[str, Any]]) -> int:
+    # Leading chunks a page holds, by its listed blocks: appends land whole, and child pages and
+    # databases are blocks of the page but never part of its body.
+    landed = sum(child.get("type") not in {"child_page", "child_database"} for child in children)
+    for index, total in enumerate(itertools.accumulate(map(len, chunks))):
+        if total > landed:
+            return max(index, 1)
+    return len(chunks)
+
+
 def _blocks_from_spec(blocks: list[Any], store: StateStore, force_resolve: bool = False) -> tuple[list[dict[str, Any]], bool]:
     resolved: list[dict[str, Any]] = []
     has_unresolved = False
@@ -1,21 +1,68 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
 import time
-from dataclasses import dataclass
-from typing import Any, cast
+from dataclasses import dataclass, field
+from typing import Any, Self, cast
 
 import httpx
 
+from notion_synth.providers.notion.ratelimit import DEFAULT_BURST, DEFAULT_RATE, RateLimiter
+from notion_synth.util import env_float, env_int
+
 DEFAULT_NOTION_VERSION = "2022-06-28"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+_TRUTHY = {"1", "true", "yes", "on"}
 
 
 @dataclass
-class NotionClient:
+class _NotionClientBase:
+    """Settings and connection-reuse counters shared by the sync and async Notion clients."""
+
     token: str
     base_url: str = "https://api.notion.com/v1"
     version: str = DEFAULT_NOTION_VERSION
     timeout: float = 30.0
     max_retries: int = 5
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 30.0
+    http2: bool = False
+    rate_limiter: RateLimiter | None = None
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _stats: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._stats = {
+            "requests": 0,
+            "retries": 0,
+            "new_connections": 0,
+            "tls_handshakes": 0,
+            "http_versions": {},
+        }
+
+    @classmethod
+    def from_env(cls, token: str) -> Self:
+        """
+        Build a client, reading pool/HTTP2 overrides from `NOTION_SYNTH_HTTP_*` env vars.
+
+        Requests are rate limited to `NOTION_SYNTH_RATE_LIMIT` req/s (default 3, `0` disables)
+        with bursts of `NOTION_SYNTH_RATE_BURST`.
+        """
+        rate = env_float("NOTION_SYNTH_RATE_LIMIT", DEFAULT_RATE)
+        return cls(
+            token=token,
+            max_connections=env_int("NOTION_SYNTH_HTTP_MAX_CONNECTIONS", 20),
+            max_keepalive_connections=env_int("NOTION_SYNTH_HTTP_MAX_KEEPALIVE", 10),
+            http2=os.getenv("NOTION_SYNTH_HTTP2", "").strip().lower() in _TRUTHY,
+            rate_limiter=(
+                RateLimiter(rate=rate, burst=max(1, env_int("NOTION_SYNTH_RATE_BURST", DEFAULT_BURST)))
+                if rate > 0
+                else None
+            ),
+        )
 
     def _headers(self) -> dict[str, str]:
         return {
@@ -24,39 +71,123 @@ class NotionClient:
             "Content-Type": "application/json",
         }
 
+    def _client_options(self) -> dict[str, Any]:
+        return {
+            "base_url": self.base_url,
+            "headers": self._headers(),
+            "timeout": self.timeout,
+            "http2": self.http2,
+            "limits": httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+        }
+
+    def _on_trace(self, event_name: str) -> None:
+        # httpcore trace hook: fires connect/TLS events only when a request opens a new connection.
+        if event_name == "connection.connect_tcp.complete":
+            self._count("new_connections")
+        elif event_name == "connection.start_tls.complete":
+            self._count("tls_handshakes")
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._stats[key] += 1
+
+    def _record_response(self, response: httpx.Response) -> None:
+        with self._lock:
+            self._stats["requests"] += 1
+            versions = self._stats["http_versions"]
+            versions[response.http_version] = versions.get(response.http_version, 0) + 1
+        if self.rate_limiter is not None and response.status_code != 429:
+            self.rate_limiter.on_success()
+
+    def _retry_wait(self, response: httpx.Response, retries: int) -> float:
+        """Seconds to sleep before retrying; 429 waits are left to the shared rate limiter."""
+        self._count("retries")
+        wait = _retry_delay(response, retries)
+        if self.rate_limiter is not None and response.status_code == 429:
+            self.rate_limiter.on_rate_limited(wait)
+            return 0.0
+        return wait
+
+    def stats(self) -> dict[str, Any]:
+        """Request and connection-reuse counters (`reused` = requests that opened no connection)."""
+        with self._lock:
+            stats = {**self._stats, "http_versions": dict(self._stats["http_versions"])}
+        stats["reused"] = max(0, stats["requests"] - stats["new_connections"])
+        if self.rate_limiter is not None:
+            stats["rate_limit"] = self.rate_limiter.stats()
+        return stats
+
+
+@dataclass
+class NotionClient(_NotionClientBase):
+    """
+    Notion REST client on one long-lived `httpx.Client`, so applies reuse keep-alive connections.
+
+    The underlying client is opened on first request; use `close()` or `with NotionClient(...)`
+    to release it. `http2=True` needs the `h2` package (`pip install 'httpx[http2]'`).
+    """
+
+    transport: httpx.BaseTransport | None = None
+    _http: httpx.Client | None = field(default=None, init=False, repr=False)
+
+    def __enter__(self) -> NotionClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _client(self) -> httpx.Client:
+        with self._lock:
+            if self._http is None:
+                self._http = httpx.Client(transport=self.transport, **self._client_options())
+            return self._http
+
+    def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        _ = info
+        self._on_trace(event_name)
+
     def request(self, method: str, path: str, *, json: Any | None = None) -> dict[str, Any]:
-        url = f"{self.base_url}{path}"
+        client = self._client()
         retries = 0
         while True:
-            response = httpx.request(
-                method,
-                url,
-                headers=self._headers(),
-                json=json,
-                timeout=self.timeout,
-            )
-            if response.status_code in {429, 500, 502, 503, 504} and retries < self.max_retries:
-                wait = _retry_delay(response, retries)
-                time.sleep(wait)
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            response = client.request(method, path, json=json, extensions={"trace": self._trace})
+            self._record_response(response)
+            if response.status_code in RETRY_STATUSES and retries < self.max_retries:
+                time.sleep(self._retry_wait(response, retries))
                 retries += 1
                 continue
             response.raise_for_status()
             return cast(dict[str, Any], response.json())
 
+    def close(self) -> None:
+        with self._lock:
+            client, self._http = self._http, None
+        if client is not None:
+            client.close()
+
     def list_users(self) -> list[dict[str, Any]]:
         users: list[dict[str, Any]] = []
         cursor: str | None = None
         while True:
-            payload: dict[str, Any] = {"page_size": 100}
-            if cursor:
-                payload["start_cursor"] = cursor
-            data = self.request("POST", "/users/list", json=payload)
+            data = self.list_users_page(cursor)
             users.extend(data.get("results", []))
             if not data.get("has_more"):
                 break
             cursor = data.get("next_cursor")
         return users
 
+    def list_users_page(self, cursor: str | None = None) -> dict[str, Any]:
+        payload: dict[str, Any] = {"page_size": 100}
+        if cursor:
+            payload["start_cursor"] = cursor
+        return self.request("POST", "/users/list", json=payload)
+
     def create_page(self, payload: dict[str, Any]) -> dict[str, Any]:
         return self.request("POST", "/pages", json=payload)
 
@@ -79,6 +210,54 @@ class NotionClient:
         return self.request("GET", f"/pages/{page_id}")
 
 
+@dataclass
+class AsyncNotionClient(_NotionClientBase):
+    """
+    `NotionClient` counterpart on `httpx.AsyncClient`, for running many requests concurrently.
+
+    Size `max_connections` to at least the number of in-flight requests. Release it with
+    `await aclose()` or `async with AsyncNotionClient(...)`.
+    """
+
+    transport: httpx.AsyncBaseTransport | None = None
+    _http: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+
+    async def __aenter__(self) -> AsyncNotionClient:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = httpx.AsyncClient(transport=self.transport, **self._client_options())
+        return self._http
+
+    async def _trace(self, event_name: str, info: dict[str, Any]) -> None:
+        _ = info
+        self._on_trace(event_name)
+
+    async def request(self, method: str, path: str, *, json: Any | None = None) -> dict[str, Any]:
+        client = self._client()
+        retries = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            response = await client.request(method, path, json=json, extensions={"trace": self._trace})
+            self._record_response(response)
+            if response.status_code in RETRY_STATUSES and retries < self.max_retries:
+                await asyncio.sleep(self._retry_wait(response, retries))
+                retries += 1
+                continue
+            response.raise_for_status()
+            return cast(dict[str, Any], response.json())
+
+    async def aclose(self) -> None:
+        client, self._http = self._http, None
+        if client is not None:
+            await client.aclose()
+
+
 def _retry_delay(response: httpx.Response, retries: int) -> float:
     retry_after: str | None = response.headers.get("retry-after")
     if retry_after:
@@ -87,3 +266,4 @@ def _retry_delay(response: httpx.Response, retries: int) -> float:
         except ValueError:
             pass
     return float(min(2**retries, 20))
+
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# Notion documents an average of ~3 requests/second per integration, with short bursts allowed.
+DEFAULT_RATE = 3.0
+DEFAULT_BURST = 5
+
+
+@dataclass
+class RateLimiter:
+    """
+    Token bucket shared by every request of a client (threads and coroutines alike).
+
+    Callers reserve a token up front and sleep for the returned delay outside the lock, so
+    waiters are served in arrival order. A 429 halves the refill rate (down to `min_rate`) and
+    holds every caller back for its `Retry-After`; each success then adds `recovery` req/s back
+    until `rate` is reached again.
+    """
+
+    rate: float = DEFAULT_RATE
+    burst: int = DEFAULT_BURST
+    min_rate: float = 0.5
+    backoff: float = 0.5
+    recovery: float = 0.05
+    clock: Callable[[], float] = field(default=time.monotonic, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _current_rate: float = field(default=0.0, init=False)
+    _tokens: float = field(default=0.0, init=False)
+    _updated: float = field(default=0.0, init=False, repr=False)
+    _waits: int = field(default=0, init=False, repr=False)
+    _throttled_seconds: float = field(default=0.0, init=False, repr=False)
+    _rate_limited: int = field(default=0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0 or self.burst < 1:
+            raise ValueError("rate must be > 0 and burst >= 1")
+        self._current_rate = self.rate
+        self._tokens = float(self.burst)
+        self._updated = self.clock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before sending."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            wait = -self._tokens / self._current_rate
+            self._waits += 1
+            self._throttled_seconds += wait
+            return wait
+
+    def acquire(self) -> float:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        with self._lock:
+            if self._current_rate < self.rate:
+                self._refill()
+                self._current_rate = min(self.rate, self._current_rate + self.recovery)
+
+    def on_rate_limited(self, retry_after: float) -> None:
+        """Back off after a 429: slow the refill rate; the next token is `retry_after` away."""
+        with self._lock:
+            self._refill()
+            self._rate_limited += 1
+            self._current_rate = max(self.min_rate, self._current_rate * self.backoff)
+            self._tokens = min(self._tokens, 1 - retry_after * self._current_rate)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "rate": round(self._current_rate, 3),
+                "throttled_requests": self._waits,
+                "throttled_seconds": round(self._throttled_seconds, 3),
+                "rate_limited": self._rate_limited,
+            }
+
+    def _refill(self) -> None:
+        now = self.clock()
+        self._tokens = min(float(self.burst), self._tokens + (now - self._updated) * self._current_rate)
+        self._updated = now
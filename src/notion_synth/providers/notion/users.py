@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable
+from typing import Any, Protocol
+
+from notion_synth.state import (
+    StateStore,
+    get_cache_meta,
+    load_notion_users,
+    save_notion_users,
+    set_cache_meta,
+)
+
+USER_CACHE_TTL_SECONDS = 900.0
+_CACHE_NAME = "notion_users"
+
+
+class UserPager(Protocol):
+    def list_users_page(self, cursor: str | None = None) -> dict[str, Any]: ...
+
+
+def user_directory(
+    client: UserPager,
+    store: StateStore,
+    *,
+    emails: Iterable[str] | None = None,
+    ttl: float = USER_CACHE_TTL_SECONDS,
+) -> dict[str, str]:
+    """
+    Notion workspace users as lower-cased email -> user id, cached in the state store.
+
+    Within `ttl` of the last full listing the cache is reused when it already holds every
+    wanted email, so verify polling for matched users costs no request. Otherwise users are
+    paged in, stopping early once every wanted email is found: a new user can land on any
+    page of `/users`, so no single page can vouch for the cache. Only a listing that reaches
+    the last page replaces the cache and renews the TTL.
+    """
+    wanted = {email.lower() for email in emails or () if email}
+    cached = load_notion_users(store)
+    meta = get_cache_meta(store, _CACHE_NAME)
+    fresh = meta is not None and time.time() - float(meta["fetched_at"]) < ttl
+    if fresh and wanted <= cached.keys():
+        return cached
+
+    page = client.list_users_page()
+    found: dict[str, str] = {}
+    while True:
+        found.update(_emails(page.get("results", [])))
+        if not page.get("has_more"):
+            save_notion_users(store, [(user_id, email) for email, user_id in found.items()], replace=True)
+            set_cache_meta(store, _CACHE_NAME, {"fetched_at": time.time()})
+            return found
+        if wanted and wanted <= (cached.keys() | found.keys()):
+            # Partial listing: merge what we saw but keep the previous TTL.
+            save_notion_users(store, [(user_id, email) for email, user_id in found.items()])
+            return {**cached, **found}
+        page = client.list_users_page(page.get("next_cursor"))
+
+
+def _emails(users: list[dict[str, Any]]) -> dict[str, str]:
+    emails: dict[str, str] = {}
+    for user in users:
+        email = (user.get("person") or {}).get("email")
+        if email and user.get("id"):
+            emails[email.lower()] = user["id"]
+    return emails
+
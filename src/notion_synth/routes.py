@@ -1,13 +1,27 @@
+import base64
+import binascii
 import json
 import os
+import sqlite3
+import tempfile
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
-from typing import Annotated, Any, cast
+from typing import Annotated, Any, Literal, cast
 
 from fastapi import APIRouter, HTTPException, Query, Request, Response
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.datastructures import URL
 
 from notion_synth.db import Database, new_id, seed_demo
+from notion_synth.fixtures import (
+    IMPORT_CHUNK_SIZE,
+    NDJSON_MEDIA_TYPE,
+    import_fixture_records,
+    iter_fixture_ndjson,
+    iter_ndjson_records,
+)
 from notion_synth.fixtures import export_fixture as export_fixture_payload
 from notion_synth.fixtures import import_fixture as import_fixture_payload
 from notion_synth.generator import generate_fixture
@@ -30,6 +44,9 @@ from notion_synth.models import (
     Page,
     PageCreate,
     PageUpdate,
+    PoolStats,
+    SearchHit,
+    SearchResults,
     Stats,
     User,
     UserCreate,
@@ -78,21 +95,105 @@ def _set_pagination_headers(
     limit: int,
     offset: int,
     has_more: bool,
+    cursor: str | None = None,
+    next_cursor: str | None = None,
 ) -> None:
     response.headers["X-Limit"] = str(limit)
-    response.headers["X-Offset"] = str(offset)
+    if cursor is None:
+        response.headers["X-Offset"] = str(offset)
     response.headers["X-Has-More"] = "true" if has_more else "false"
 
     if not has_more:
         return
 
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
+
+    if cursor is not None and next_cursor is not None:
+        next_url: URL = request.url.remove_query_params("offset").include_query_params(
+            limit=limit, cursor=next_cursor
+        )
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
+        return
+
     next_offset = offset + limit
     response.headers["X-Next-Offset"] = str(next_offset)
 
-    next_url: URL = request.url.include_query_params(limit=limit, offset=next_offset)
+    next_url = request.url.include_query_params(limit=limit, offset=next_offset)
     response.headers["Link"] = f'<{next_url}>; rel="next"'
 
 
+def _encode_cursor(values: list[Any]) -> str:
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str, size: int) -> list[Any]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, binascii.Error) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def _keyset_condition(
+    cursor: str | None, offset: int, columns: list[str]
+) -> tuple[str | None, list[Any]]:
+    """
+    Translate an opaque cursor into a row-value predicate like `(created_at, id) > (?, ?)`.
+
+    An empty cursor starts keyset mode at the beginning of the collection.
+    """
+    if cursor is None:
+        return None, []
+    if offset:
+        raise HTTPException(status_code=400, detail="cursor and offset are mutually exclusive")
+    if not cursor:
+        return None, []
+    values = _decode_cursor(cursor, len(columns))
+    placeholders = ", ".join("?" for _ in columns)
+    return f"({', '.join(columns)}) > ({placeholders})", values
+
+
+def _created_key(row: sqlite3.Row) -> list[Any]:
+    return [row["created_at"], row["id"]]
+
+
+def _search_score_key(row: sqlite3.Row) -> list[Any]:
+    return [row["search_score"], row["id"]]
+
+
+def _paginate_rows(
+    request: Request,
+    response: Response,
+    rows: list[sqlite3.Row],
+    *,
+    limit: int,
+    offset: int,
+    cursor: str | None,
+    include_pagination: bool,
+    key: Callable[[sqlite3.Row], list[Any]] = _created_key,
+) -> list[sqlite3.Row]:
+    if not include_pagination and cursor is None:
+        return rows
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = _encode_cursor(key(rows[-1])) if rows else None
+    _set_pagination_headers(
+        request,
+        response,
+        limit=limit,
+        offset=offset,
+        has_more=has_more,
+        cursor=cursor,
+        next_cursor=next_cursor,
+    )
+    return rows
+
+
 def _parse_json(value: str) -> dict[str, Any]:
     return cast(dict[str, Any], json.loads(value))
 
@@ -156,13 +257,133 @@ def _count(db: Database, query: str, params: list[Any]) -> int:
     return int(row["count"]) if row else 0
 
 
-def _has_pages_fts(db: Database) -> bool:
-    row = db.query_one(
-        "SELECT 1 AS ok FROM sqlite_master WHERE type='table' AND name='pages_fts'"
+def _indexed_property_names(db: Database, database_id: str) -> set[str]:
+    rows = db.query_all(
+        "SELECT name FROM indexed_row_properties WHERE database_id = ?", [database_id]
     )
+    return {str(row["name"]) for row in rows}
+
+
+def _has_fts(db: Database, name: str) -> bool:
+    row = db.query_one("SELECT 1 AS ok FROM sqlite_master WHERE type='table' AND name=?", [name])
     return row is not None
 
 
+def _fts_match_query(q: str) -> str | None:
+    """
+    Quote each term as an FTS5 prefix phrase ("kick"* matches "kickoff").
+
+    Keeps user input from tripping FTS query syntax (e.g. `kickoff-summary`), and approximates
+    the substring semantics of the LIKE fallback. Returns None when there are no terms.
+    """
+    terms = [term.replace('"', '""') for term in q.split()]
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+SearchType = Literal["page", "comment", "row"]
+
+SNIPPET_OPEN = "<mark>"
+SNIPPET_CLOSE = "</mark>"
+
+
+@dataclass(frozen=True)
+class _SearchTarget:
+    """How one entity type is searched by the unified `/search` endpoint."""
+
+    fts: str
+    table: str
+    alias: str
+    joins: str
+    workspace_column: str
+    text_columns: tuple[str, ...]
+
+
+SEARCH_TARGETS: dict[str, _SearchTarget] = {
+    "page": _SearchTarget(
+        fts="pages_fts",
+        table="pages p",
+        alias="p",
+        joins="",
+        workspace_column="p.workspace_id",
+        text_columns=("title", "content"),
+    ),
+    "comment": _SearchTarget(
+        fts="comments_fts",
+        table="comments c",
+        alias="c",
+        joins="JOIN pages p ON p.id = c.page_id",
+        workspace_column="p.workspace_id",
+        text_columns=("body", "attachments_json"),
+    ),
+    "row": _SearchTarget(
+        fts="rows_fts",
+        table="database_rows r",
+        alias="r",
+        joins="JOIN databases d ON d.id = r.database_id",
+        workspace_column="d.workspace_id",
+        text_columns=("properties_json",),
+    ),
+}
+
+
+def _like_snippet(row: sqlite3.Row, columns: tuple[str, ...], q: str, width: int = 40) -> str:
+    """Approximate FTS5 snippet() for LIKE matches: a window around the first hit."""
+    needle = q.lower()
+    for column in columns:
+        text = str(row[column] or "")
+        start = text.lower().find(needle)
+        if start < 0:
+            continue
+        end = start + len(q)
+        prefix = "…" if start > width else ""
+        suffix = "…" if end + width < len(text) else ""
+        return (
+            f"{prefix}{text[max(0, start - width):start]}"
+            f"{SNIPPET_OPEN}{text[start:end]}{SNIPPET_CLOSE}"
+            f"{text[end:end + width]}{suffix}"
+        )
+    return ""
+
+
+def _search_target_rows(
+    db: Database, target: _SearchTarget, q: str, workspace_id: str | None, limit: int
+) -> tuple[list[sqlite3.Row], bool]:
+    """Top `limit` matches for one entity type; the flag is True when ranked by FTS5."""
+    alias = target.alias
+    match = _fts_match_query(q) if _has_fts(db, target.fts) else None
+    if match is not None:
+        source = f"{target.fts} JOIN {target.table} ON {alias}.rowid = {target.fts}.rowid {target.joins}"
+        conditions = [f"{target.fts} MATCH ?"]
+        params: list[Any] = [match]
+        extra = (
+            f"bm25({target.fts}) AS search_score, "
+            f"snippet({target.fts}, -1, '{SNIPPET_OPEN}', '{SNIPPET_CLOSE}', '…', 12) AS search_snippet"
+        )
+        order = f"bm25({target.fts}), {alias}.id"
+    else:
+        like = f"%{q}%"
+        source = f"{target.table} {target.joins}"
+        conditions = [
+            "(" + " OR ".join(f"{alias}.{column} LIKE ?" for column in target.text_columns) + ")"
+        ]
+        params = [like] * len(target.text_columns)
+        extra = "0.0 AS search_score, NULL AS search_snippet"
+        order = f"{alias}.created_at, {alias}.id"
+    if workspace_id:
+        conditions.append(f"{target.workspace_column} = ?")
+        params.append(workspace_id)
+    query = f"""
+    SELECT {alias}.*, {extra}
+    FROM {source}
+    WHERE {' AND '.join(conditions)}
+    ORDER BY {order}
+    LIMIT ?
+    """  # nosec B608
+    return db.query_all(query, [*params, limit]), match is not None
+
+
 def _homepage_html() -> str:
     return """<!doctype html>
 <html lang="en">
@@ -298,7 +519,7 @@ curl http://localhost:8000/databases?include_total=true</code></pre>
           <h2>Defaults</h2>
           <ul>
             <li>Demo org seeds on first run</li>
-            <li>Pagination via <code>limit</code> + <code>offset</code></li>
+            <li>Pagination via <code>limit</code> + <code>offset</code> or keyset <code>cursor</code></li>
             <li>Totals via <code>X-Total-Count</code> header</li>
           </ul>
         </div>
@@ -350,6 +571,12 @@ def stats(request: Request) -> Stats:
     return _stats_for_db(db)
 
 
+@router.get("/stats/pool", response_model=PoolStats, tags=["meta"])
+def pool_stats(request: Request) -> PoolStats:
+    db = _get_db(request)
+    return PoolStats(**db.pool_stats())
+
+
 @router.get("/packs", response_model=list[PackInfo], tags=["packs"])
 def packs() -> list[PackInfo]:
     infos: list[PackInfo] = []
@@ -440,7 +667,7 @@ def admin_apply_pack(
         raise HTTPException(status_code=400, detail="confirm=true required")
 
     try:
-        result = import_fixture_payload(db, fixture, mode="replace")
+        result = import_fixture_payload(db, fixture, mode="replace", bulk=False)
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
@@ -490,12 +717,31 @@ def admin_reset(
     return AdminResetResult(status="ok", before=before, after=after)
 
 
-@router.get("/fixtures/export", response_model=Fixture, tags=["fixtures"])
-def export_fixture(request: Request) -> Fixture:
+@router.get(
+    "/fixtures/export",
+    response_model=Fixture,
+    tags=["fixtures"],
+    responses={200: {"content": {NDJSON_MEDIA_TYPE: {}}}},
+)
+def export_fixture(
+    request: Request,
+    export_format: Literal["json", "ndjson"] = Query(
+        "json",
+        alias="format",
+        description="`ndjson` streams one `{type, data}` record per line with flat memory use.",
+    ),
+) -> Fixture | StreamingResponse:
     db = _get_db(request)
+    if export_format == "ndjson":
+        return StreamingResponse(iter_fixture_ndjson(db), media_type=NDJSON_MEDIA_TYPE)
     return export_fixture_payload(db)
 
 
+# The bulk-load path drops indexes and triggers on the serving DB for the whole load, so the
+# HTTP import endpoints only take it when asked to (the CLI defaults it on for replace mode).
+_BULK_IMPORT_HELP = "Load via the bulk path (indexes/triggers suspended until the end; replace mode only)."
+
+
 @router.post("/fixtures/import", response_model=FixtureImportResult, tags=["fixtures"])
 def import_fixture(
     payload: Fixture,
@@ -504,14 +750,72 @@ def import_fixture(
         "replace",
         description="Import mode: 'replace' (wipe then load) or 'merge' (upsert).",
     ),
+    bulk: bool = Query(False, description=_BULK_IMPORT_HELP),
 ) -> FixtureImportResult:
     db = _get_db(request)
     try:
-        return import_fixture_payload(db, payload, mode=mode)
+        return import_fixture_payload(db, payload, mode=mode, bulk=bulk and mode == "replace")
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
 
 
+# Import bodies larger than this spill from memory to a temporary file while they are received.
+_IMPORT_SPOOL_BYTES = 8 * 1024 * 1024
+
+
+@router.post(
+    "/fixtures/import/stream",
+    response_model=FixtureImportResult,
+    tags=["fixtures"],
+    openapi_extra={"requestBody": {"content": {NDJSON_MEDIA_TYPE: {}}, "required": True}},
+)
+async def import_fixture_stream(
+    request: Request,
+    mode: str = Query(
+        "replace",
+        description="Import mode: 'replace' (wipe then load) or 'merge' (upsert).",
+    ),
+    chunk_size: int = Query(
+        IMPORT_CHUNK_SIZE,
+        ge=1,
+        le=100_000,
+        description="Records validated and inserted per executemany batch.",
+    ),
+    bulk: bool = Query(False, description=_BULK_IMPORT_HELP),
+) -> FixtureImportResult:
+    """
+    Import an NDJSON fixture (see `GET /fixtures/export?format=ndjson`) in validated chunks.
+
+    The body is spooled to a temporary file before the write transaction opens, so a slow or
+    stalled client never holds the writer lock. `batches` in the result counts inserted chunks.
+    """
+    db = _get_db(request)
+    batches = 0
+
+    def count_batch(_: dict[str, int]) -> None:
+        nonlocal batches
+        batches += 1
+
+    with tempfile.SpooledTemporaryFile(max_size=_IMPORT_SPOOL_BYTES) as body:
+        async for chunk in request.stream():
+            body.write(chunk)
+        body.seek(0)
+        try:
+            result = await run_in_threadpool(
+                import_fixture_records,
+                db,
+                iter_ndjson_records(body),
+                mode=mode,
+                chunk_size=chunk_size,
+                progress=count_batch,
+                bulk=bulk and mode == "replace",
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    result.batches = batches
+    return result
+
+
 @router.get("/workspaces", response_model=list[Workspace])
 def list_workspaces(request: Request) -> list[Workspace]:
     db = _get_db(request)
@@ -634,33 +938,29 @@ def delete_workspace(
             },
         )
 
-    conn = db.connection
-    cursor = conn.cursor()
     try:
-        conn.execute("BEGIN")
-        # Comments depend on both pages + users.
-        cursor.execute(
-            """
-            DELETE FROM comments
-            WHERE page_id IN (SELECT id FROM pages WHERE workspace_id = ?)
-               OR author_id IN (SELECT id FROM users WHERE workspace_id = ?)
-            """,
-            [workspace_id, workspace_id],
-        )
-        cursor.execute(
-            """
-            DELETE FROM database_rows
-            WHERE database_id IN (SELECT id FROM databases WHERE workspace_id = ?)
-            """,
-            [workspace_id],
-        )
-        cursor.execute("DELETE FROM databases WHERE workspace_id = ?", [workspace_id])
-        cursor.execute("DELETE FROM pages WHERE workspace_id = ?", [workspace_id])
-        cursor.execute("DELETE FROM users WHERE workspace_id = ?", [workspace_id])
-        cursor.execute("DELETE FROM workspaces WHERE id = ?", [workspace_id])
-        conn.commit()
+        with db.transaction() as cursor:
+            # Comments depend on both pages + users.
+            cursor.execute(
+                """
+                DELETE FROM comments
+                WHERE page_id IN (SELECT id FROM pages WHERE workspace_id = ?)
+                   OR author_id IN (SELECT id FROM users WHERE workspace_id = ?)
+                """,
+                [workspace_id, workspace_id],
+            )
+            cursor.execute(
+                """
+                DELETE FROM database_rows
+                WHERE database_id IN (SELECT id FROM databases WHERE workspace_id = ?)
+                """,
+                [workspace_id],
+            )
+            cursor.execute("DELETE FROM databases WHERE workspace_id = ?", [workspace_id])
+            cursor.execute("DELETE FROM pages WHERE workspace_id = ?", [workspace_id])
+            cursor.execute("DELETE FROM users WHERE workspace_id = ?", [workspace_id])
+            cursor.execute("DELETE FROM workspaces WHERE id = ?", [workspace_id])
     except Exception as exc:
-        conn.rollback()
         raise HTTPException(status_code=500, detail="Failed to delete workspace") from exc
 
     return Response(status_code=204)
@@ -675,6 +975,10 @@ def list_users(
     email_contains: str | None = None,
     limit: int = Query(50),
     offset: int = Query(0),
+    cursor: str | None = Query(
+        None,
+        description="Opaque keyset cursor from X-Next-Cursor; an empty value starts cursor mode.",
+    ),
     include_total: bool = Query(False),
     include_pagination: bool = Query(
         False,
@@ -701,15 +1005,26 @@ def list_users(
         count_row = db.query_one(f"SELECT COUNT(*) AS count FROM users {where}", params)  # nosec B608
         _set_total_header(response, int(count_row["count"]) if count_row else 0)
 
-    query_limit = limit + 1 if include_pagination else limit
+    keyset, keyset_params = _keyset_condition(cursor, offset, ["created_at", "id"])
+    if keyset:
+        conditions.append(keyset)
+        params.extend(keyset_params)
+        where = f"WHERE {' AND '.join(conditions)}"
+
+    query_limit = limit + 1 if include_pagination or cursor is not None else limit
     rows = db.query_all(
-        f"SELECT * FROM users {where} ORDER BY created_at LIMIT ? OFFSET ?",  # nosec B608
+        f"SELECT * FROM users {where} ORDER BY created_at, id LIMIT ? OFFSET ?",  # nosec B608
         [*params, query_limit, offset],
     )
-    if include_pagination:
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-        _set_pagination_headers(request, response, limit=limit, offset=offset, has_more=has_more)
+    rows = _paginate_rows(
+        request,
+        response,
+        rows,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_pagination=include_pagination,
+    )
     return [User(**dict(row)) for row in rows]
 
 
@@ -725,16 +1040,17 @@ def get_user(user_id: str, request: Request) -> User:
 @router.post("/users", response_model=User, status_code=201)
 def create_user(payload: UserCreate, request: Request) -> User:
     db = _get_db(request)
-    workspace = db.query_one("SELECT id FROM workspaces WHERE id = ?", [payload.workspace_id])
-    if workspace is None:
-        raise HTTPException(status_code=400, detail="Invalid workspace_id")
-
-    now = _utc_now()
-    user_id = new_id("user")
-    db.execute(
-        "INSERT INTO users (id, workspace_id, name, email, created_at) VALUES (?, ?, ?, ?, ?)",
-        [user_id, payload.workspace_id, payload.name, payload.email, now],
-    )
+    with db.transaction():
+        workspace = db.query_one("SELECT id FROM workspaces WHERE id = ?", [payload.workspace_id])
+        if workspace is None:
+            raise HTTPException(status_code=400, detail="Invalid workspace_id")
+
+        now = _utc_now()
+        user_id = new_id("user")
+        db.execute(
+            "INSERT INTO users (id, workspace_id, name, email, created_at) VALUES (?, ?, ?, ?, ?)",
+            [user_id, payload.workspace_id, payload.name, payload.email, now],
+        )
     return User(
         id=user_id,
         workspace_id=payload.workspace_id,
@@ -751,15 +1067,11 @@ def delete_user(user_id: str, request: Request) -> Response:
     if row is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    conn = db.connection
-    cursor = conn.cursor()
     try:
-        conn.execute("BEGIN")
-        cursor.execute("DELETE FROM comments WHERE author_id = ?", [user_id])
-        cursor.execute("DELETE FROM users WHERE id = ?", [user_id])
-        conn.commit()
+        with db.transaction() as cursor:
+            cursor.execute("DELETE FROM comments WHERE author_id = ?", [user_id])
+            cursor.execute("DELETE FROM users WHERE id = ?", [user_id])
     except Exception as exc:
-        conn.rollback()
         raise HTTPException(status_code=500, detail="Failed to delete user") from exc
 
     return Response(status_code=204)
@@ -775,6 +1087,10 @@ def list_pages(
     title_contains: str | None = None,
     limit: int = Query(50),
     offset: int = Query(0),
+    cursor: str | None = Query(
+        None,
+        description="Opaque keyset cursor from X-Next-Cursor; an empty value starts cursor mode.",
+    ),
     include_total: bool = Query(False),
     include_pagination: bool = Query(
         False,
@@ -804,15 +1120,26 @@ def list_pages(
         count_row = db.query_one(f"SELECT COUNT(*) AS count FROM pages {where}", params)  # nosec B608
         _set_total_header(response, int(count_row["count"]) if count_row else 0)
 
-    query_limit = limit + 1 if include_pagination else limit
+    keyset, keyset_params = _keyset_condition(cursor, offset, ["created_at", "id"])
+    if keyset:
+        conditions.append(keyset)
+        params.extend(keyset_params)
+        where = f"WHERE {' AND '.join(conditions)}"
+
+    query_limit = limit + 1 if include_pagination or cursor is not None else limit
     rows = db.query_all(
-        f"SELECT * FROM pages {where} ORDER BY created_at LIMIT ? OFFSET ?",  # nosec B608
+        f"SELECT * FROM pages {where} ORDER BY created_at, id LIMIT ? OFFSET ?",  # nosec B608
         [*params, query_limit, offset],
     )
-    if include_pagination:
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-        _set_pagination_headers(request, response, limit=limit, offset=offset, has_more=has_more)
+    rows = _paginate_rows(
+        request,
+        response,
+        rows,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_pagination=include_pagination,
+    )
     return [
         _page_from_row(row)
         for row in rows
@@ -831,40 +1158,41 @@ def get_page(page_id: str, request: Request) -> Page:
 @router.post("/pages", response_model=Page, status_code=201)
 def create_page(payload: PageCreate, request: Request) -> Page:
     db = _get_db(request)
-    workspace = db.query_one("SELECT id FROM workspaces WHERE id = ?", [payload.workspace_id])
-    if workspace is None:
-        raise HTTPException(status_code=400, detail="Invalid workspace_id")
+    with db.transaction():
+        workspace = db.query_one("SELECT id FROM workspaces WHERE id = ?", [payload.workspace_id])
+        if workspace is None:
+            raise HTTPException(status_code=400, detail="Invalid workspace_id")
 
-    now = _utc_now()
-    page_id = new_id("page")
-    normalized_attachments = _normalize_attachments(payload.attachments)
-    db.execute(
-        """
-        INSERT INTO pages (
-            id,
-            workspace_id,
-            title,
-            content,
-            attachments_json,
-            parent_type,
-            parent_id,
-            created_at,
-            updated_at
+        now = _utc_now()
+        page_id = new_id("page")
+        normalized_attachments = _normalize_attachments(payload.attachments)
+        db.execute(
+            """
+            INSERT INTO pages (
+                id,
+                workspace_id,
+                title,
+                content,
+                attachments_json,
+                parent_type,
+                parent_id,
+                created_at,
+                updated_at
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                page_id,
+                payload.workspace_id,
+                payload.title,
+                json.dumps(payload.content),
+                _attachments_to_json(normalized_attachments),
+                payload.parent_type,
+                payload.parent_id,
+                now,
+                now,
+            ],
         )
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """,
-        [
-            page_id,
-            payload.workspace_id,
-            payload.title,
-            json.dumps(payload.content),
-            _attachments_to_json(normalized_attachments),
-            payload.parent_type,
-            payload.parent_id,
-            now,
-            now,
-        ],
-    )
     return Page(
         id=page_id,
         workspace_id=payload.workspace_id,
@@ -881,33 +1209,34 @@ def create_page(payload: PageCreate, request: Request) -> Page:
 @router.patch("/pages/{page_id}", response_model=Page)
 def update_page(page_id: str, payload: PageUpdate, request: Request) -> Page:
     db = _get_db(request)
-    row = db.query_one("SELECT * FROM pages WHERE id = ?", [page_id])
-    if row is None:
-        raise HTTPException(status_code=404, detail="Page not found")
-    updated = dict(row)
-    if payload.title is not None:
-        updated["title"] = payload.title
-    if payload.content is not None:
-        updated["content"] = json.dumps(payload.content)
-    if payload.attachments is not None:
-        normalized_attachments = _normalize_attachments(payload.attachments)
-        updated["attachments_json"] = _attachments_to_json(normalized_attachments)
-    updated["updated_at"] = _utc_now()
-    db.execute(
-        """
-        UPDATE pages SET title = ?, content = ?, attachments_json = ?, updated_at = ? WHERE id = ?
-        """,
-        [
-            updated["title"],
-            updated["content"],
-            updated.get("attachments_json", "[]"),
-            updated["updated_at"],
-            page_id,
-        ],
-    )
-    row = db.query_one("SELECT * FROM pages WHERE id = ?", [page_id])
-    if row is None:
-        raise HTTPException(status_code=404, detail="Page not found")
+    with db.transaction():
+        row = db.query_one("SELECT * FROM pages WHERE id = ?", [page_id])
+        if row is None:
+            raise HTTPException(status_code=404, detail="Page not found")
+        updated = dict(row)
+        if payload.title is not None:
+            updated["title"] = payload.title
+        if payload.content is not None:
+            updated["content"] = json.dumps(payload.content)
+        if payload.attachments is not None:
+            normalized_attachments = _normalize_attachments(payload.attachments)
+            updated["attachments_json"] = _attachments_to_json(normalized_attachments)
+        updated["updated_at"] = _utc_now()
+        db.execute(
+            """
+            UPDATE pages SET title = ?, content = ?, attachments_json = ?, updated_at = ? WHERE id = ?
+            """,
+            [
+                updated["title"],
+                updated["content"],
+                updated.get("attachments_json", "[]"),
+                updated["updated_at"],
+                page_id,
+            ],
+        )
+        row = db.query_one("SELECT * FROM pages WHERE id = ?", [page_id])
+        if row is None:
+            raise HTTPException(status_code=404, detail="Page not found")
     return _page_from_row(row)
 
 
@@ -918,20 +1247,82 @@ def delete_page(page_id: str, request: Request) -> Response:
     if row is None:
         raise HTTPException(status_code=404, detail="Page not found")
 
-    conn = db.connection
-    cursor = conn.cursor()
     try:
-        conn.execute("BEGIN")
-        cursor.execute("DELETE FROM comments WHERE page_id = ?", [page_id])
-        cursor.execute("DELETE FROM pages WHERE id = ?", [page_id])
-        conn.commit()
+        with db.transaction() as cursor:
+            cursor.execute("DELETE FROM comments WHERE page_id = ?", [page_id])
+            cursor.execute("DELETE FROM pages WHERE id = ?", [page_id])
     except Exception as exc:
-        conn.rollback()
         raise HTTPException(status_code=500, detail="Failed to delete page") from exc
 
     return Response(status_code=204)
 
 
+@router.get("/search", response_model=SearchResults, tags=["search"])
+def search(
+    request: Request,
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=200,
+        description="Search query (matches pages, comments and database rows).",
+    ),
+    types: Annotated[
+        list[SearchType] | None,
+        Query(description="Entity types to search (repeatable); defaults to all."),
+    ] = None,
+    workspace_id: str | None = None,
+    limit: int = Query(20, description="Maximum number of merged hits."),
+    per_type_limit: int | None = Query(
+        None,
+        description="Maximum hits considered per entity type (defaults to limit).",
+    ),
+) -> SearchResults:
+    db = _get_db(request)
+    limit, _ = _limit_offset(limit, 0)
+    per_type, _ = _limit_offset(per_type_limit if per_type_limit is not None else limit, 0)
+
+    selected = list(dict.fromkeys(types or SEARCH_TARGETS))
+    candidates: list[tuple[str, _SearchTarget, list[sqlite3.Row], bool]] = []
+    for kind in selected:
+        target = SEARCH_TARGETS[kind]
+        rows, ranked = _search_target_rows(db, target, q, workspace_id, per_type)
+        candidates.append((kind, target, rows, ranked))
+    # bm25() is lower-is-better: negate it and scale every type by the best hit of the whole
+    # candidate set into (0, 1], so a strong match of one type outranks weak matches of another.
+    best = max(
+        (
+            -float(row["search_score"])
+            for _, _, rows, ranked in candidates
+            if ranked
+            for row in rows
+        ),
+        default=0.0,
+    )
+    hits: list[SearchHit] = []
+    for kind, target, rows, ranked in candidates:
+        for row in rows:
+            hit = SearchHit(
+                type=cast(SearchType, kind),
+                id=row["id"],
+                score=-float(row["search_score"]) / best if ranked and best > 0 else 0.0,
+                snippet=row["search_snippet"] if ranked else _like_snippet(row, target.text_columns, q),
+            )
+            if kind == "page":
+                hit.page = _page_from_row(row)
+            elif kind == "comment":
+                hit.comment = _comment_from_row(row)
+            else:
+                hit.row = DatabaseRow(**{**dict(row), "properties": _parse_json(row["properties_json"])})
+            hits.append(hit)
+
+    hits.sort(key=lambda hit: -hit.score)
+    hits = hits[:limit]
+    counts = dict.fromkeys(selected, 0)
+    for hit in hits:
+        counts[hit.type] += 1
+    return SearchResults(query=q, hits=hits, counts=counts)
+
+
 @router.get("/search/pages", response_model=list[Page], tags=["search"])
 def search_pages(
     request: Request,
@@ -945,6 +1336,10 @@ def search_pages(
     workspace_id: str | None = None,
     limit: int = Query(50),
     offset: int = Query(0),
+    cursor: str | None = Query(
+        None,
+        description="Opaque keyset cursor from X-Next-Cursor; an empty value starts cursor mode.",
+    ),
     include_total: bool = Query(False),
     include_pagination: bool = Query(
         False,
@@ -954,11 +1349,13 @@ def search_pages(
     db = _get_db(request)
     limit, offset = _limit_offset(limit, offset)
 
-    query_limit = limit + 1 if include_pagination else limit
+    query_limit = limit + 1 if include_pagination or cursor is not None else limit
+    key: Callable[[sqlite3.Row], list[Any]] = _created_key
 
-    if _has_pages_fts(db):
+    match = _fts_match_query(q) if _has_fts(db, "pages_fts") else None
+    if match is not None:
         conditions: list[str] = ["pages_fts MATCH ?"]
-        params: list[Any] = [q]
+        params: list[Any] = [match]
         if workspace_id:
             conditions.append("p.workspace_id = ?")
             params.append(workspace_id)
@@ -974,15 +1371,23 @@ def search_pages(
             count_row = db.query_one(count_query, params)
             _set_total_header(response, int(count_row["count"]) if count_row else 0)
 
+        # Relevance-ordered results page on (bm25 score, id) instead of (created_at, id).
+        keyset, keyset_params = _keyset_condition(cursor, offset, ["bm25(pages_fts)", "p.id"])
+        if keyset:
+            conditions.append(keyset)
+            params.extend(keyset_params)
+            where = f"WHERE {' AND '.join(conditions)}"
+
         query = f"""
-        SELECT p.*
+        SELECT p.*, bm25(pages_fts) AS search_score
         FROM pages_fts
         JOIN pages p ON p.rowid = pages_fts.rowid
         {where}
-        ORDER BY bm25(pages_fts)
+        ORDER BY bm25(pages_fts), p.id
         LIMIT ? OFFSET ?
         """  # nosec B608
         rows = db.query_all(query, [*params, query_limit, offset])
+        key = _search_score_key
     else:
         like = f"%{q}%"
         conditions = ["(title LIKE ? OR content LIKE ?)"]
@@ -999,15 +1404,27 @@ def search_pages(
             )
             _set_total_header(response, int(count_row["count"]) if count_row else 0)
 
+        keyset, keyset_params = _keyset_condition(cursor, offset, ["created_at", "id"])
+        if keyset:
+            conditions.append(keyset)
+            params.extend(keyset_params)
+            where = f"WHERE {' AND '.join(conditions)}"
+
         rows = db.query_all(
-            f"SELECT * FROM pages {where} ORDER BY created_at LIMIT ? OFFSET ?",  # nosec B608
+            f"SELECT * FROM pages {where} ORDER BY created_at, id LIMIT ? OFFSET ?",  # nosec B608
             [*params, query_limit, offset],
         )
 
-    if include_pagination:
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-        _set_pagination_headers(request, response, limit=limit, offset=offset, has_more=has_more)
+    rows = _paginate_rows(
+        request,
+        response,
+        rows,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_pagination=include_pagination,
+        key=key,
+    )
 
     return [
         _page_from_row(row)
@@ -1030,6 +1447,10 @@ def search_comments(
     author_id: str | None = None,
     limit: int = Query(50),
     offset: int = Query(0),
+    cursor: str | None = Query(
+        None,
+        description="Opaque keyset cursor from X-Next-Cursor; an empty value starts cursor mode.",
+    ),
     include_total: bool = Query(False),
     include_pagination: bool = Query(
         False,
@@ -1038,10 +1459,22 @@ def search_comments(
 ) -> list[Comment]:
     db = _get_db(request)
     limit, offset = _limit_offset(limit, offset)
-    like = f"%{q}%"
-
-    conditions: list[str] = ["(c.body LIKE ? OR c.attachments_json LIKE ?)"]
-    params: list[Any] = [like, like]
+    match = _fts_match_query(q) if _has_fts(db, "comments_fts") else None
+    rank: str | None = None
+    if match is not None:
+        source = """
+        comments_fts
+        JOIN comments c ON c.rowid = comments_fts.rowid
+        JOIN pages p ON p.id = c.page_id
+        """
+        conditions: list[str] = ["comments_fts MATCH ?"]
+        params: list[Any] = [match]
+        rank = "bm25(comments_fts)"
+    else:
+        like = f"%{q}%"
+        source = "comments c JOIN pages p ON p.id = c.page_id"
+        conditions = ["(c.body LIKE ? OR c.attachments_json LIKE ?)"]
+        params = [like, like]
     if workspace_id:
         conditions.append("p.workspace_id = ?")
         params.append(workspace_id)
@@ -1054,29 +1487,37 @@ def search_comments(
     where = f"WHERE {' AND '.join(conditions)}"
 
     if include_total:
-        count_query = f"""
-        SELECT COUNT(*) AS count
-        FROM comments c
-        JOIN pages p ON p.id = c.page_id
-        {where}
-        """  # nosec B608
+        count_query = f"SELECT COUNT(*) AS count FROM {source} {where}"  # nosec B608
         count_row = db.query_one(count_query, params)
         _set_total_header(response, int(count_row["count"]) if count_row else 0)
 
-    query_limit = limit + 1 if include_pagination else limit
+    order_columns = [rank, "c.id"] if rank else ["c.created_at", "c.id"]
+    keyset, keyset_params = _keyset_condition(cursor, offset, order_columns)
+    if keyset:
+        conditions.append(keyset)
+        params.extend(keyset_params)
+        where = f"WHERE {' AND '.join(conditions)}"
+
+    query_limit = limit + 1 if include_pagination or cursor is not None else limit
+    score = f", {rank} AS search_score" if rank else ""
     query = f"""
-    SELECT c.*
-    FROM comments c
-    JOIN pages p ON p.id = c.page_id
+    SELECT c.*{score}
+    FROM {source}
     {where}
-    ORDER BY c.created_at
+    ORDER BY {', '.join(order_columns)}
     LIMIT ? OFFSET ?
     """  # nosec B608
     rows = db.query_all(query, [*params, query_limit, offset])
-    if include_pagination:
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-        _set_pagination_headers(request, response, limit=limit, offset=offset, has_more=has_more)
+    rows = _paginate_rows(
+        request,
+        response,
+        rows,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_pagination=include_pagination,
+        key=_search_score_key if rank else _created_key,
+    )
     return [_comment_from_row(row) for row in rows]
 
 
@@ -1095,6 +1536,10 @@ def search_rows(
     property_name: str | None = Query(default=None, min_length=1),
     limit: int = Query(50),
     offset: int = Query(0),
+    cursor: str | None = Query(
+        None,
+        description="Opaque keyset cursor from X-Next-Cursor; an empty value starts cursor mode.",
+    ),
     include_total: bool = Query(False),
     include_pagination: bool = Query(
         False,
@@ -1104,12 +1549,25 @@ def search_rows(
     db = _get_db(request)
     limit, offset = _limit_offset(limit, offset)
 
-    conditions: list[str] = []
-    params: list[Any] = []
+    match = _fts_match_query(q) if _has_fts(db, "rows_fts") else None
+    rank: str | None = None
+    if match is not None:
+        source = """
+        rows_fts
+        JOIN database_rows r ON r.rowid = rows_fts.rowid
+        JOIN databases d ON d.id = r.database_id
+        """
+        conditions: list[str] = ["rows_fts MATCH ?"]
+        params: list[Any] = [match]
+        rank = "bm25(rows_fts)"
+    else:
+        source = "database_rows r JOIN databases d ON d.id = r.database_id"
+        conditions = []
+        params = []
     if property_name:
         conditions.append("CAST(json_extract(r.properties_json, ?) AS TEXT) LIKE ?")
         params.extend([_json_path_for_property(property_name), f"%{q}%"])
-    else:
+    elif match is None:
         conditions.append("r.properties_json LIKE ?")
         params.append(f"%{q}%")
 
@@ -1122,29 +1580,37 @@ def search_rows(
     where = f"WHERE {' AND '.join(conditions)}"
 
     if include_total:
-        count_query = f"""
-        SELECT COUNT(*) AS count
-        FROM database_rows r
-        JOIN databases d ON d.id = r.database_id
-        {where}
-        """  # nosec B608
+        count_query = f"SELECT COUNT(*) AS count FROM {source} {where}"  # nosec B608
         count_row = db.query_one(count_query, params)
         _set_total_header(response, int(count_row["count"]) if count_row else 0)
 
-    query_limit = limit + 1 if include_pagination else limit
+    order_columns = [rank, "r.id"] if rank else ["r.created_at", "r.id"]
+    keyset, keyset_params = _keyset_condition(cursor, offset, order_columns)
+    if keyset:
+        conditions.append(keyset)
+        params.extend(keyset_params)
+        where = f"WHERE {' AND '.join(conditions)}"
+
+    query_limit = limit + 1 if include_pagination or cursor is not None else limit
+    score = f", {rank} AS search_score" if rank else ""
     query = f"""
-    SELECT r.*
-    FROM database_rows r
-    JOIN databases d ON d.id = r.database_id
+    SELECT r.*{score}
+    FROM {source}
     {where}
-    ORDER BY r.created_at
+    ORDER BY {', '.join(order_columns)}
     LIMIT ? OFFSET ?
     """  # nosec B608
     rows = db.query_all(query, [*params, query_limit, offset])
-    if include_pagination:
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-        _set_pagination_headers(request, response, limit=limit, offset=offset, has_more=has_more)
+    rows = _paginate_rows(
+        request,
+        response,
+        rows,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_pagination=include_pagination,
+        key=_search_score_key if rank else _created_key,
+    )
 
     return [
         DatabaseRow(**{**dict(row), "properties": _parse_json(row["properties_json"])})
@@ -1160,6 +1626,10 @@ def list_databases(
     name_contains: str | None = None,
     limit: int = Query(50),
     offset: int = Query(0),
+    cursor: str | None = Query(
+        None,
+        description="Opaque keyset cursor from X-Next-Cursor; an empty value starts cursor mode.",
+    ),
     include_total: bool = Query(False),
     include_pagination: bool = Query(
         False,
@@ -1186,15 +1656,26 @@ def list_databases(
         )
         _set_total_header(response, int(count_row["count"]) if count_row else 0)
 
-    query_limit = limit + 1 if include_pagination else limit
+    keyset, keyset_params = _keyset_condition(cursor, offset, ["created_at", "id"])
+    if keyset:
+        conditions.append(keyset)
+        params.extend(keyset_params)
+        where = f"WHERE {' AND '.join(conditions)}"
+
+    query_limit = limit + 1 if include_pagination or cursor is not None else limit
     rows = db.query_all(
-        f"SELECT * FROM databases {where} ORDER BY created_at LIMIT ? OFFSET ?",  # nosec B608
+        f"SELECT * FROM databases {where} ORDER BY created_at, id LIMIT ? OFFSET ?",  # nosec B608
         [*params, query_limit, offset],
     )
-    if include_pagination:
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-        _set_pagination_headers(request, response, limit=limit, offset=offset, has_more=has_more)
+    rows = _paginate_rows(
+        request,
+        response,
+        rows,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_pagination=include_pagination,
+    )
     return [
         DatabaseModel(**{**dict(row), "schema": _parse_json(row["schema_json"])})
         for row in rows
@@ -1215,19 +1696,20 @@ def get_database(database_id: str, request: Request) -> DatabaseModel:
 @router.post("/databases", response_model=DatabaseModel, status_code=201)
 def create_database(payload: DatabaseCreate, request: Request) -> DatabaseModel:
     db = _get_db(request)
-    workspace = db.query_one("SELECT id FROM workspaces WHERE id = ?", [payload.workspace_id])
-    if workspace is None:
-        raise HTTPException(status_code=400, detail="Invalid workspace_id")
-
-    now = _utc_now()
-    database_id = new_id("db")
-    db.execute(
-        """
-        INSERT INTO databases (id, workspace_id, name, schema_json, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        [database_id, payload.workspace_id, payload.name, json.dumps(payload.schema_), now, now],
-    )
+    with db.transaction():
+        workspace = db.query_one("SELECT id FROM workspaces WHERE id = ?", [payload.workspace_id])
+        if workspace is None:
+            raise HTTPException(status_code=400, detail="Invalid workspace_id")
+
+        now = _utc_now()
+        database_id = new_id("db")
+        db.execute(
+            """
+            INSERT INTO databases (id, workspace_id, name, schema_json, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [database_id, payload.workspace_id, payload.name, json.dumps(payload.schema_), now, now],
+        )
     return DatabaseModel(
         id=database_id,
         workspace_id=payload.workspace_id,
@@ -1241,24 +1723,25 @@ def create_database(payload: DatabaseCreate, request: Request) -> DatabaseModel:
 @router.patch("/databases/{database_id}", response_model=DatabaseModel)
 def update_database(database_id: str, payload: DatabaseUpdate, request: Request) -> DatabaseModel:
     db = _get_db(request)
-    row = db.query_one("SELECT * FROM databases WHERE id = ?", [database_id])
-    if row is None:
-        raise HTTPException(status_code=404, detail="Database not found")
-
-    if payload.name is None and payload.schema_ is None:
-        raise HTTPException(status_code=400, detail="No fields to update")
-
-    updated = dict(row)
-    if payload.name is not None:
-        updated["name"] = payload.name
-    if payload.schema_ is not None:
-        updated["schema_json"] = json.dumps(payload.schema_)
-    updated["updated_at"] = _utc_now()
-    db.execute(
-        "UPDATE databases SET name = ?, schema_json = ?, updated_at = ? WHERE id = ?",
-        [updated["name"], updated["schema_json"], updated["updated_at"], database_id],
-    )
-    updated["schema"] = _parse_json(updated.pop("schema_json"))
+    with db.transaction():
+        row = db.query_one("SELECT * FROM databases WHERE id = ?", [database_id])
+        if row is None:
+            raise HTTPException(status_code=404, detail="Database not found")
+
+        if payload.name is None and payload.schema_ is None:
+            raise HTTPException(status_code=400, detail="No fields to update")
+
+        updated = dict(row)
+        if payload.name is not None:
+            updated["name"] = payload.name
+        if payload.schema_ is not None:
+            updated["schema_json"] = json.dumps(payload.schema_)
+        updated["updated_at"] = _utc_now()
+        db.execute(
+            "UPDATE databases SET name = ?, schema_json = ?, updated_at = ? WHERE id = ?",
+            [updated["name"], updated["schema_json"], updated["updated_at"], database_id],
+        )
+        updated["schema"] = _parse_json(updated.pop("schema_json"))
     return DatabaseModel(**updated)
 
 
@@ -1269,15 +1752,11 @@ def delete_database(database_id: str, request: Request) -> Response:
     if row is None:
         raise HTTPException(status_code=404, detail="Database not found")
 
-    conn = db.connection
-    cursor = conn.cursor()
     try:
-        conn.execute("BEGIN")
-        cursor.execute("DELETE FROM database_rows WHERE database_id = ?", [database_id])
-        cursor.execute("DELETE FROM databases WHERE id = ?", [database_id])
-        conn.commit()
+        with db.transaction() as cursor:
+            cursor.execute("DELETE FROM database_rows WHERE database_id = ?", [database_id])
+            cursor.execute("DELETE FROM databases WHERE id = ?", [database_id])
     except Exception as exc:
-        conn.rollback()
         raise HTTPException(status_code=500, detail="Failed to delete database") from exc
 
     return Response(status_code=204)
@@ -1299,6 +1778,10 @@ def list_database_rows(
     ] = None,
     limit: int = Query(50),
     offset: int = Query(0),
+    cursor: str | None = Query(
+        None,
+        description="Opaque keyset cursor from X-Next-Cursor; an empty value starts cursor mode.",
+    ),
     include_total: bool = Query(False),
     include_pagination: bool = Query(
         False,
@@ -1313,26 +1796,44 @@ def list_database_rows(
     if property_value_equals and not property_name:
         raise HTTPException(status_code=400, detail="property_value_equals requires property_name")
 
+    equals: list[tuple[str, str]] = []
     for expr in property_equals or []:
         try:
-            name, value = _parse_property_equals(expr)
+            equals.append(_parse_property_equals(expr))
         except ValueError as exc:
             raise HTTPException(status_code=400, detail=str(exc)) from exc
-        conditions.append("CAST(json_extract(properties_json, ?) AS TEXT) = ?")
-        params.extend([_json_path_for_property(name), value])
-
-    if property_name:
-        property_path = _json_path_for_property(property_name)
-        if property_value_equals:
+    if property_name and property_value_equals:
+        equals.append((property_name, property_value_equals))
+
+    indexed = _indexed_property_names(db, database_id) if equals else set()
+    lookups: list[str] = []
+    lookup_params: list[Any] = []
+    for name, value in equals:
+        if name in indexed:
+            lookups.append(
+                "SELECT row_id FROM row_property_values"
+                " WHERE database_id = ? AND name = ? AND value_text = ?"
+            )
+            lookup_params.extend([database_id, name, value])
+        else:
             conditions.append("CAST(json_extract(properties_json, ?) AS TEXT) = ?")
-            params.extend([property_path, property_value_equals])
-        elif property_value_contains:
+            params.extend([_json_path_for_property(name), value])
+    if lookups:
+        # Drive the query from the property index (intersecting each filter's row ids); the
+        # unary + stops the planner from walking every row via idx_rows_database_created.
+        conditions[0] = "+database_id = ?"
+        conditions.append(f"id IN ({' INTERSECT '.join(lookups)})")
+        params.extend(lookup_params)
+
+    if property_name and not property_value_equals:
+        property_path = _json_path_for_property(property_name)
+        if property_value_contains:
             conditions.append("CAST(json_extract(properties_json, ?) AS TEXT) LIKE ?")
             params.extend([property_path, f"%{property_value_contains}%"])
         else:
             conditions.append("json_extract(properties_json, ?) IS NOT NULL")
             params.append(property_path)
-    elif property_value_contains:
+    elif property_value_contains and not property_name:
         conditions.append("properties_json LIKE ?")
         params.append(f"%{property_value_contains}%")
 
@@ -1343,15 +1844,26 @@ def list_database_rows(
             params,
         )
         _set_total_header(response, int(count_row["count"]) if count_row else 0)
-    query_limit = limit + 1 if include_pagination else limit
+    keyset, keyset_params = _keyset_condition(cursor, offset, ["created_at", "id"])
+    if keyset:
+        conditions.append(keyset)
+        params.extend(keyset_params)
+        where = f"WHERE {' AND '.join(conditions)}"
+
+    query_limit = limit + 1 if include_pagination or cursor is not None else limit
     rows = db.query_all(
-        f"SELECT * FROM database_rows {where} ORDER BY created_at LIMIT ? OFFSET ?",  # nosec B608
+        f"SELECT * FROM database_rows {where} ORDER BY created_at, id LIMIT ? OFFSET ?",  # nosec B608
         [*params, query_limit, offset],
     )
-    if include_pagination:
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-        _set_pagination_headers(request, response, limit=limit, offset=offset, has_more=has_more)
+    rows = _paginate_rows(
+        request,
+        response,
+        rows,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_pagination=include_pagination,
+    )
     return [
         DatabaseRow(**{**dict(row), "properties": _parse_json(row["properties_json"])})
         for row in rows
@@ -1363,19 +1875,20 @@ def create_database_row(
     database_id: str, payload: DatabaseRowCreate, request: Request
 ) -> DatabaseRow:
     db = _get_db(request)
-    database = db.query_one("SELECT id FROM databases WHERE id = ?", [database_id])
-    if database is None:
-        raise HTTPException(status_code=400, detail="Invalid database_id")
-
-    now = _utc_now()
-    row_id = new_id("row")
-    db.execute(
-        """
-        INSERT INTO database_rows (id, database_id, properties_json, created_at, updated_at)
-        VALUES (?, ?, ?, ?, ?)
-        """,
-        [row_id, database_id, json.dumps(payload.properties), now, now],
-    )
+    with db.transaction():
+        database = db.query_one("SELECT id FROM databases WHERE id = ?", [database_id])
+        if database is None:
+            raise HTTPException(status_code=400, detail="Invalid database_id")
+
+        now = _utc_now()
+        row_id = new_id("row")
+        db.execute(
+            """
+            INSERT INTO database_rows (id, database_id, properties_json, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            """,
+            [row_id, database_id, json.dumps(payload.properties), now, now],
+        )
     return DatabaseRow(
         id=row_id,
         database_id=database_id,
@@ -1404,27 +1917,28 @@ def update_database_row(
     database_id: str, row_id: str, payload: DatabaseRowUpdate, request: Request
 ) -> DatabaseRow:
     db = _get_db(request)
-    row = db.query_one(
-        "SELECT * FROM database_rows WHERE id = ? AND database_id = ?",
-        [row_id, database_id],
-    )
-    if row is None:
-        raise HTTPException(status_code=404, detail="Database row not found")
-    if payload.properties is None:
-        raise HTTPException(status_code=400, detail="No fields to update")
-
-    updated = dict(row)
-    updated["properties_json"] = json.dumps(payload.properties)
-    updated["updated_at"] = _utc_now()
-    db.execute(
-        """
-        UPDATE database_rows
-        SET properties_json = ?, updated_at = ?
-        WHERE id = ? AND database_id = ?
-        """,
-        [updated["properties_json"], updated["updated_at"], row_id, database_id],
-    )
-    updated["properties"] = _parse_json(updated.pop("properties_json"))
+    with db.transaction():
+        row = db.query_one(
+            "SELECT * FROM database_rows WHERE id = ? AND database_id = ?",
+            [row_id, database_id],
+        )
+        if row is None:
+            raise HTTPException(status_code=404, detail="Database row not found")
+        if payload.properties is None:
+            raise HTTPException(status_code=400, detail="No fields to update")
+
+        updated = dict(row)
+        updated["properties_json"] = json.dumps(payload.properties)
+        updated["updated_at"] = _utc_now()
+        db.execute(
+            """
+            UPDATE database_rows
+            SET properties_json = ?, updated_at = ?
+            WHERE id = ? AND database_id = ?
+            """,
+            [updated["properties_json"], updated["updated_at"], row_id, database_id],
+        )
+        updated["properties"] = _parse_json(updated.pop("properties_json"))
     return DatabaseRow(**updated)
 
 
@@ -1448,6 +1962,10 @@ def list_comments(
     author_id: str | None = None,
     limit: int = Query(50),
     offset: int = Query(0),
+    cursor: str | None = Query(
+        None,
+        description="Opaque keyset cursor from X-Next-Cursor; an empty value starts cursor mode.",
+    ),
     include_total: bool = Query(False),
     include_pagination: bool = Query(
         False,
@@ -1471,15 +1989,26 @@ def list_comments(
         count_row = db.query_one(f"SELECT COUNT(*) AS count FROM comments {where}", params)  # nosec B608
         _set_total_header(response, int(count_row["count"]) if count_row else 0)
 
-    query_limit = limit + 1 if include_pagination else limit
+    keyset, keyset_params = _keyset_condition(cursor, offset, ["created_at", "id"])
+    if keyset:
+        conditions.append(keyset)
+        params.extend(keyset_params)
+        where = f"WHERE {' AND '.join(conditions)}"
+
+    query_limit = limit + 1 if include_pagination or cursor is not None else limit
     rows = db.query_all(
-        f"SELECT * FROM comments {where} ORDER BY created_at LIMIT ? OFFSET ?",  # nosec B608
+        f"SELECT * FROM comments {where} ORDER BY created_at, id LIMIT ? OFFSET ?",  # nosec B608
         [*params, query_limit, offset],
     )
-    if include_pagination:
-        has_more = len(rows) > limit
-        rows = rows[:limit]
-        _set_pagination_headers(request, response, limit=limit, offset=offset, has_more=has_more)
+    rows = _paginate_rows(
+        request,
+        response,
+        rows,
+        limit=limit,
+        offset=offset,
+        cursor=cursor,
+        include_pagination=include_pagination,
+    )
     return [_comment_from_row(row) for row in rows]
 
 
@@ -1495,30 +2024,31 @@ def get_comment(comment_id: str, request: Request) -> Comment:
 @router.post("/comments", response_model=Comment, status_code=201)
 def create_comment(payload: CommentCreate, request: Request) -> Comment:
     db = _get_db(request)
-    page = db.query_one("SELECT id FROM pages WHERE id = ?", [payload.page_id])
-    if page is None:
-        raise HTTPException(status_code=400, detail="Invalid page_id")
-    author = db.query_one("SELECT id FROM users WHERE id = ?", [payload.author_id])
-    if author is None:
-        raise HTTPException(status_code=400, detail="Invalid author_id")
-
-    now = _utc_now()
-    comment_id = new_id("comment")
-    normalized_attachments = _normalize_attachments(payload.attachments)
-    db.execute(
-        """
-        INSERT INTO comments (id, page_id, author_id, body, attachments_json, created_at)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        [
-            comment_id,
-            payload.page_id,
-            payload.author_id,
-            payload.body,
-            _attachments_to_json(normalized_attachments),
-            now,
-        ],
-    )
+    with db.transaction():
+        page = db.query_one("SELECT id FROM pages WHERE id = ?", [payload.page_id])
+        if page is None:
+            raise HTTPException(status_code=400, detail="Invalid page_id")
+        author = db.query_one("SELECT id FROM users WHERE id = ?", [payload.author_id])
+        if author is None:
+            raise HTTPException(status_code=400, detail="Invalid author_id")
+
+        now = _utc_now()
+        comment_id = new_id("comment")
+        normalized_attachments = _normalize_attachments(payload.attachments)
+        db.execute(
+            """
+            INSERT INTO comments (id, page_id, author_id, body, attachments_json, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            [
+                comment_id,
+                payload.page_id,
+                payload.author_id,
+                payload.body,
+                _attachments_to_json(normalized_attachments),
+                now,
+            ],
+        )
     return Comment(
         id=comment_id,
         page_id=payload.page_id,
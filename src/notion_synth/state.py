@@ -1,29 +1,98 @@
 from __future__ import annotations
 
+import json
 import os
+import signal
 import sqlite3
-from collections.abc import Iterable
-from dataclasses import dataclass
+import threading
+import time
+import zlib
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from itertools import groupby
+from operator import itemgetter
 from typing import Any, cast
 
+# Row from `objects`/`identity_map`: a sqlite3.Row, or a dict when served from a `preloaded` cache.
+StateRow = sqlite3.Row | dict[str, Any]
+
+# Stay under SQLite's bound-parameter limit for `IN (...)` bulk fetches.
+_IN_CHUNK = 500
+
 
 @dataclass
 class StateStore:
     path: str
     connection: sqlite3.Connection
+    _objects: dict[str, dict[str, Any] | None] | None = field(default=None, init=False, repr=False)
+    _identities: dict[str, dict[str, Any] | None] | None = field(default=None, init=False, repr=False)
+    _pending: list[tuple[str, tuple[Any, ...]]] | None = field(default=None, init=False, repr=False)
+    _pending_since: float = field(default=0.0, init=False, repr=False)
+    _batch_size: int = field(default=500, init=False, repr=False)
+    _batch_delay: float = field(default=0.25, init=False, repr=False)
 
     def execute(self, query: str, params: Iterable[Any] | None = None) -> None:
+        self.flush()
         cursor = self.connection.cursor()
         cursor.execute(query, tuple(params or ()))
         self.connection.commit()
 
+    def write(self, query: str, params: Iterable[Any]) -> None:
+        """`execute`, but buffered while inside `batched()`; reads and `execute` flush first."""
+        if self._pending is None:
+            self.execute(query, params)
+            return
+        if not self._pending:
+            self._pending_since = time.monotonic()
+        self._pending.append((query, tuple(params)))
+        if len(self._pending) >= self._batch_size or time.monotonic() - self._pending_since >= self._batch_delay:
+            self.flush()
+
+    def flush(self) -> None:
+        """Commit buffered writes in one transaction, as `executemany` runs of the same statement."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        with self.connection:
+            for query, group in groupby(pending, key=itemgetter(0)):
+                self.connection.executemany(query, [params for _, params in group])
+
+    @contextmanager
+    def batched(self, *, max_items: int = 500, max_delay: float = 0.25) -> Iterator[StateStore]:
+        """
+        Buffer `write` calls and commit them every `max_items` writes or `max_delay` seconds.
+
+        Everything buffered is flushed when the block exits, including on exceptions, Ctrl-C
+        and SIGTERM (turned into `SystemExit` while the block runs on the main thread), so an
+        interrupted apply keeps the records of everything it created. A hard kill loses what is
+        still buffered; journaled applies flush before every create, and a resumed run looks up
+        the creates whose outcome it lost (see `providers.notion.apply._Journal`).
+        """
+        if self._pending is not None:
+            yield self
+            return
+        self._pending, self._batch_size, self._batch_delay = [], max_items, max_delay
+        previous = _trap_sigterm()
+        try:
+            yield self
+        finally:
+            try:
+                self.flush()
+            finally:
+                self._pending = None
+                if previous is not None:
+                    signal.signal(signal.SIGTERM, previous)
+
     def query_one(self, query: str, params: Iterable[Any] | None = None) -> sqlite3.Row | None:
+        self.flush()
         cursor = self.connection.cursor()
         cursor.execute(query, tuple(params or ()))
         return cast(sqlite3.Row | None, cursor.fetchone())
 
     def query_all(self, query: str, params: Iterable[Any] | None = None) -> list[sqlite3.Row]:
+        self.flush()
         cursor = self.connection.cursor()
         cursor.execute(query, tuple(params or ()))
         return cursor.fetchall()
@@ -33,11 +102,27 @@ def connect_state(path: str | None = None) -> StateStore:
     resolved = path or os.getenv("NOTION_SYNTH_STATE_DB") or "./state.db"
     connection = sqlite3.connect(resolved, check_same_thread=False)
     connection.row_factory = sqlite3.Row
+    if resolved != ":memory:":
+        # WAL + NORMAL: commits no longer fsync the main DB file; a crash loses at most the last
+        # transactions, which apply re-creates from spec hashes on the next run.
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
     store = StateStore(path=resolved, connection=connection)
     _init_schema(store)
     return store
 
 
+def _trap_sigterm() -> Any:
+    if threading.current_thread() is not threading.main_thread():
+        return None
+
+    def handle(signum: int, frame: Any) -> None:
+        _ = frame
+        raise SystemExit(128 + signum)
+
+    return signal.signal(signal.SIGTERM, handle)
+
+
 def _init_schema(store: StateStore) -> None:
     store.execute(
         """
@@ -65,6 +150,50 @@ def _init_schema(store: StateStore) -> None:
         )
         """
     )
+    store.execute(
+        """
+        CREATE TABLE IF NOT EXISTS run_checkpoints (
+            run_id TEXT NOT NULL,
+            phase TEXT NOT NULL,
+            position INTEGER NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (run_id, phase)
+        )
+        """
+    )
+    store.execute(
+        """
+        CREATE TABLE IF NOT EXISTS run_requests (
+            run_id TEXT NOT NULL,
+            idempotency_key TEXT NOT NULL,
+            synth_id TEXT NOT NULL,
+            method TEXT NOT NULL,
+            path TEXT NOT NULL,
+            remote_id TEXT,
+            started_at TEXT NOT NULL,
+            completed_at TEXT,
+            PRIMARY KEY (run_id, idempotency_key)
+        )
+        """
+    )
+    store.execute(
+        """
+        CREATE TABLE IF NOT EXISTS applied_blueprints (
+            blueprint_hash TEXT PRIMARY KEY,
+            root_page_id TEXT NOT NULL,
+            body BLOB NOT NULL,
+            applied_at TEXT NOT NULL
+        )
+        """
+    )
+    store.execute(
+        """
+        CREATE TABLE IF NOT EXISTS run_baselines (
+            run_id TEXT PRIMARY KEY,
+            blueprint_hash TEXT NOT NULL
+        )
+        """
+    )
     store.execute(
         """
         CREATE TABLE IF NOT EXISTS identity_map (
@@ -76,6 +205,45 @@ def _init_schema(store: StateStore) -> None:
         )
         """
     )
+    store.execute(
+        """
+        CREATE TABLE IF NOT EXISTS directory_objects (
+            tenant_id TEXT NOT NULL,
+            resource TEXT NOT NULL,
+            object_id TEXT NOT NULL,
+            name TEXT,
+            PRIMARY KEY (tenant_id, resource, object_id)
+        )
+        """
+    )
+    store.execute(
+        """
+        CREATE TABLE IF NOT EXISTS delta_links (
+            tenant_id TEXT NOT NULL,
+            resource TEXT NOT NULL,
+            delta_link TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            PRIMARY KEY (tenant_id, resource)
+        )
+        """
+    )
+    store.execute(
+        """
+        CREATE TABLE IF NOT EXISTS notion_users (
+            notion_user_id TEXT PRIMARY KEY,
+            email TEXT NOT NULL
+        )
+        """
+    )
+    store.execute(
+        """
+        CREATE TABLE IF NOT EXISTS cache_meta (
+            name TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            updated_at TEXT NOT NULL
+        )
+        """
+    )
     store.execute(
         """
         CREATE TABLE IF NOT EXISTS activity_events (
@@ -97,7 +265,7 @@ def upsert_object(
     spec_hash: str,
 ) -> None:
     now = _utc_now()
-    store.execute(
+    store.write(
         """
         INSERT INTO objects (synth_id, kind, provider, remote_id, parent_synth_id, spec_hash, created_at, updated_at)
         VALUES (?, ?, ?, ?, ?, ?, ?, ?)
@@ -111,10 +279,33 @@ def upsert_object(
         """,
         [synth_id, kind, provider, remote_id, parent_synth_id, spec_hash, now, now],
     )
+    if store._objects is not None:
+        previous = store._objects.get(synth_id)
+        store._objects[synth_id] = {
+            "synth_id": synth_id,
+            "kind": kind,
+            "provider": provider,
+            "remote_id": remote_id,
+            "parent_synth_id": parent_synth_id,
+            "spec_hash": spec_hash,
+            "created_at": previous["created_at"] if previous else now,
+            "updated_at": now,
+        }
 
 
-def get_object(store: StateStore, synth_id: str) -> sqlite3.Row | None:
-    return store.query_one("SELECT * FROM objects WHERE synth_id = ?", [synth_id])
+def get_object(store: StateStore, synth_id: str) -> StateRow | None:
+    if store._objects is None:
+        return store.query_one("SELECT * FROM objects WHERE synth_id = ?", [synth_id])
+    if synth_id not in store._objects:
+        row = store.query_one("SELECT * FROM objects WHERE synth_id = ?", [synth_id])
+        store._objects[synth_id] = dict(row) if row else None
+    return store._objects[synth_id]
+
+
+def delete_object(store: StateStore, synth_id: str) -> None:
+    store.write("DELETE FROM objects WHERE synth_id = ?", [synth_id])
+    if store._objects is not None:
+        store._objects[synth_id] = None
 
 
 def list_objects_by_kind(store: StateStore, kind: str) -> list[sqlite3.Row]:
@@ -130,7 +321,7 @@ def upsert_identity(
     email: str | None = None,
 ) -> None:
     now = _utc_now()
-    store.execute(
+    store.write(
         """
         INSERT INTO identity_map (synth_user_id, entra_object_id, notion_user_id, email, updated_at)
         VALUES (?, ?, ?, ?, ?)
@@ -142,10 +333,79 @@ def upsert_identity(
         """,
         [synth_user_id, entra_object_id, notion_user_id, email, now],
     )
+    if store._identities is not None:
+        merged = dict(store._identities.get(synth_user_id) or {"synth_user_id": synth_user_id})
+        for key, value in (
+            ("entra_object_id", entra_object_id),
+            ("notion_user_id", notion_user_id),
+            ("email", email),
+        ):
+            if value is not None or key not in merged:
+                merged[key] = value
+        merged["updated_at"] = now
+        store._identities[synth_user_id] = merged
+
+
+def get_identity(store: StateStore, synth_user_id: str) -> StateRow | None:
+    if store._identities is None:
+        return store.query_one("SELECT * FROM identity_map WHERE synth_user_id = ?", [synth_user_id])
+    if synth_user_id not in store._identities:
+        row = store.query_one("SELECT * FROM identity_map WHERE synth_user_id = ?", [synth_user_id])
+        store._identities[synth_user_id] = dict(row) if row else None
+    return store._identities[synth_user_id]
+
+
+@contextmanager
+def preloaded(
+    store: StateStore, synth_ids: Iterable[str], synth_user_ids: Iterable[str] | None = None
+) -> Iterator[StateStore]:
+    """
+    Serve `get_object`/`get_identity` from memory inside the block.
+
+    `objects` rows for `synth_ids` are bulk-fetched with `IN (...)` queries (all of
+    `identity_map` when `synth_user_ids` is None); ids outside that set are fetched once and
+    cached, misses included. `upsert_object`/`upsert_identity` write through to the cache.
+    """
+    objects: dict[str, dict[str, Any] | None] = dict.fromkeys(synth_ids)
+    for row in _select_in(store, "objects", "synth_id", list(objects)):
+        objects[row["synth_id"]] = dict(row)
+    if synth_user_ids is None:
+        identity_rows = store.query_all("SELECT * FROM identity_map")
+        identities: dict[str, dict[str, Any] | None] = {}
+    else:
+        identities = dict.fromkeys(synth_user_ids)
+        identity_rows = _select_in(store, "identity_map", "synth_user_id", list(identities))
+    for row in identity_rows:
+        identities[row["synth_user_id"]] = dict(row)
+    store._objects, store._identities = objects, identities
+    try:
+        yield store
+    finally:
+        store._objects = store._identities = None
+
 
+def is_remote_id_tracked(store: StateStore, remote_id: str) -> bool:
+    return store.query_one("SELECT 1 FROM objects WHERE remote_id = ?", [remote_id]) is not None
 
-def get_identity(store: StateStore, synth_user_id: str) -> sqlite3.Row | None:
-    return store.query_one("SELECT * FROM identity_map WHERE synth_user_id = ?", [synth_user_id])
+
+def count_objects(store: StateStore, synth_ids: list[str]) -> int:
+    """How many of `synth_ids` have an `objects` row."""
+    count = 0
+    for start in range(0, len(synth_ids), _IN_CHUNK):
+        chunk = synth_ids[start : start + _IN_CHUNK]
+        placeholders = ", ".join("?" * len(chunk))
+        row = store.query_one(f"SELECT COUNT(*) FROM objects WHERE synth_id IN ({placeholders})", chunk)  # nosec B608
+        count += row[0] if row else 0
+    return count
+
+
+def _select_in(store: StateStore, table: str, column: str, keys: list[str]) -> list[sqlite3.Row]:
+    rows: list[sqlite3.Row] = []
+    for start in range(0, len(keys), _IN_CHUNK):
+        chunk = keys[start : start + _IN_CHUNK]
+        placeholders = ", ".join("?" * len(chunk))
+        rows.extend(store.query_all(f"SELECT * FROM {table} WHERE {column} IN ({placeholders})", chunk))  # nosec B608
+    return rows
 
 
 def record_run_start(store: StateStore, run_id: str, command: str, blueprint_hash: str) -> None:
@@ -167,13 +427,125 @@ def record_run_finish(store: StateStore, run_id: str, status: str) -> None:
     )
 
 
+def get_run(store: StateStore, run_id: str) -> sqlite3.Row | None:
+    return store.query_one("SELECT * FROM runs WHERE run_id = ?", [run_id])
+
+
+def record_run_resume(store: StateStore, run_id: str) -> None:
+    store.execute("UPDATE runs SET finished_at = NULL, status = ? WHERE run_id = ?", ["running", run_id])
+
+
+def load_checkpoints(store: StateStore, run_id: str) -> dict[str, int]:
+    """Per-phase count of leading steps a run has completed."""
+    rows = store.query_all("SELECT phase, position FROM run_checkpoints WHERE run_id = ?", [run_id])
+    return {row["phase"]: row["position"] for row in rows}
+
+
+def save_checkpoint(store: StateStore, run_id: str, phase: str, position: int) -> None:
+    store.write(
+        """
+        INSERT INTO run_checkpoints (run_id, phase, position, updated_at) VALUES (?, ?, ?, ?)
+        ON CONFLICT(run_id, phase) DO UPDATE SET
+            position = excluded.position,
+            updated_at = excluded.updated_at
+        """,
+        [run_id, phase, position, _utc_now()],
+    )
+
+
+def record_request_start(
+    store: StateStore, run_id: str, idempotency_key: str, *, synth_id: str, method: str, path: str
+) -> None:
+    store.write(
+        """
+        INSERT INTO run_requests (run_id, idempotency_key, synth_id, method, path, started_at)
+        VALUES (?, ?, ?, ?, ?, ?)
+        ON CONFLICT(run_id, idempotency_key) DO UPDATE SET
+            started_at = excluded.started_at,
+            completed_at = NULL,
+            remote_id = NULL
+        """,
+        [run_id, idempotency_key, synth_id, method, path, _utc_now()],
+    )
+
+
+def record_request_done(store: StateStore, run_id: str, idempotency_key: str, remote_id: str | None) -> None:
+    store.write(
+        """
+        UPDATE run_requests SET completed_at = ?, remote_id = ? WHERE run_id = ? AND idempotency_key = ?
+        """,
+        [_utc_now(), remote_id, run_id, idempotency_key],
+    )
+
+
+def list_run_requests(store: StateStore, run_id: str) -> list[sqlite3.Row]:
+    """
+    Requests a run journaled and has not cleared yet; rows without `completed_at` were sent
+    without a recorded response (they may or may not have reached Notion).
+    """
+    return store.query_all("SELECT * FROM run_requests WHERE run_id = ? ORDER BY started_at", [run_id])
+
+
+def clear_run_requests(store: StateStore, run_id: str) -> None:
+    store.write("DELETE FROM run_requests WHERE run_id = ?", [run_id])
+
+
+def save_applied_blueprint(store: StateStore, blueprint_hash: str, root_page_id: str, body: str) -> None:
+    """Keep the blueprint a successful apply left in the workspace, as the next diff baseline."""
+    store.execute(
+        """
+        INSERT INTO applied_blueprints (blueprint_hash, root_page_id, body, applied_at) VALUES (?, ?, ?, ?)
+        ON CONFLICT(blueprint_hash) DO UPDATE SET
+            root_page_id = excluded.root_page_id,
+            body = excluded.body,
+            applied_at = excluded.applied_at
+        """,
+        [blueprint_hash, root_page_id, zlib.compress(body.encode("utf-8")), _utc_now()],
+    )
+
+
+def clear_applied_blueprints(store: StateStore) -> None:
+    store.execute("DELETE FROM applied_blueprints")
+
+
+def latest_applied_blueprint(store: StateStore, root_page_id: str) -> sqlite3.Row | None:
+    return store.query_one(
+        """
+        SELECT blueprint_hash, applied_at FROM applied_blueprints
+        WHERE root_page_id = ? ORDER BY applied_at DESC LIMIT 1
+        """,
+        [root_page_id],
+    )
+
+
+def load_applied_blueprint(store: StateStore, blueprint_hash: str) -> str | None:
+    row = store.query_one("SELECT body FROM applied_blueprints WHERE blueprint_hash = ?", [blueprint_hash])
+    return zlib.decompress(row["body"]).decode("utf-8") if row else None
+
+
+def identities_changed_since(store: StateStore, timestamp: str) -> bool:
+    row = store.query_one("SELECT 1 FROM identity_map WHERE updated_at > ? LIMIT 1", [timestamp])
+    return row is not None
+
+
+def save_run_baseline(store: StateStore, run_id: str, blueprint_hash: str) -> None:
+    store.execute(
+        "INSERT OR REPLACE INTO run_baselines (run_id, blueprint_hash) VALUES (?, ?)", [run_id, blueprint_hash]
+    )
+
+
+def get_run_baseline(store: StateStore, run_id: str) -> str | None:
+    row = store.query_one("SELECT blueprint_hash FROM run_baselines WHERE run_id = ?", [run_id])
+    return cast(str, row["blueprint_hash"]) if row else None
+
+
 def was_event_run(store: StateStore, event_id: str) -> bool:
     row = store.query_one("SELECT event_id FROM activity_events WHERE event_id = ?", [event_id])
     return row is not None
 
 
 def mark_event_run(store: StateStore, event_id: str) -> None:
-    store.execute(
+    store.write(
         """
         INSERT INTO activity_events (event_id, last_run_at) VALUES (?, ?)
         ON CONFLICT(event_id) DO UPDATE SET last_run_at = excluded.last_run_at
@@ -182,5 +554,98 @@ def mark_event_run(store: StateStore, event_id: str) -> None:
     )
 
 
+def get_delta_link(store: StateStore, tenant_id: str, resource: str) -> str | None:
+    row = store.query_one(
+        "SELECT delta_link FROM delta_links WHERE tenant_id = ? AND resource = ?", [tenant_id, resource]
+    )
+    return cast(str, row["delta_link"]) if row else None
+
+
+def save_directory_delta(
+    store: StateStore,
+    tenant_id: str,
+    resource: str,
+    *,
+    changed: Iterable[tuple[str, str | None]],
+    removed: Iterable[str],
+    delta_link: str,
+    replace: bool = False,
+) -> None:
+    """
+    Apply one Graph delta round to the cached directory and store its delta link, atomically.
+
+    `replace` drops the cached objects first (a full round after no or an expired delta link).
+    Changed objects without a name keep the cached one, since delta may omit unchanged fields.
+    """
+    store.flush()
+    with store.connection:
+        if replace:
+            store.connection.execute(
+                "DELETE FROM directory_objects WHERE tenant_id = ? AND resource = ?", (tenant_id, resource)
+            )
+        store.connection.executemany(
+            """
+            INSERT INTO directory_objects (tenant_id, resource, object_id, name) VALUES (?, ?, ?, ?)
+            ON CONFLICT(tenant_id, resource, object_id) DO UPDATE SET
+                name = COALESCE(excluded.name, directory_objects.name)
+            """,
+            [(tenant_id, resource, object_id, name) for object_id, name in changed],
+        )
+        store.connection.executemany(
+            "DELETE FROM directory_objects WHERE tenant_id = ? AND resource = ? AND object_id = ?",
+            [(tenant_id, resource, object_id) for object_id in removed],
+        )
+        store.connection.execute(
+            """
+            INSERT INTO delta_links (tenant_id, resource, delta_link, updated_at) VALUES (?, ?, ?, ?)
+            ON CONFLICT(tenant_id, resource) DO UPDATE SET
+                delta_link = excluded.delta_link,
+                updated_at = excluded.updated_at
+            """,
+            (tenant_id, resource, delta_link, _utc_now()),
+        )
+
+
+def load_directory(store: StateStore, tenant_id: str, resource: str) -> list[sqlite3.Row]:
+    return store.query_all(
+        "SELECT object_id, name FROM directory_objects WHERE tenant_id = ? AND resource = ? AND name IS NOT NULL",
+        [tenant_id, resource],
+    )
+
+
+def load_notion_users(store: StateStore) -> dict[str, str]:
+    """Cached Notion directory as lower-cased email -> Notion user id."""
+    return {row["email"]: row["notion_user_id"] for row in store.query_all("SELECT * FROM notion_users")}
+
+
+def save_notion_users(store: StateStore, users: Iterable[tuple[str, str]], *, replace: bool = False) -> None:
+    store.flush()
+    with store.connection:
+        if replace:
+            store.connection.execute("DELETE FROM notion_users")
+        store.connection.executemany(
+            """
+            INSERT INTO notion_users (notion_user_id, email) VALUES (?, ?)
+            ON CONFLICT(notion_user_id) DO UPDATE SET email = excluded.email
+            """,
+            [(notion_user_id, email.lower()) for notion_user_id, email in users],
+        )
+
+
+def get_cache_meta(store: StateStore, name: str) -> dict[str, Any] | None:
+    row = store.query_one("SELECT value FROM cache_meta WHERE name = ?", [name])
+    return cast(dict[str, Any], json.loads(row["value"])) if row else None
+
+
+def set_cache_meta(store: StateStore, name: str, value: dict[str, Any]) -> None:
+    store.execute(
+        """
+        INSERT INTO cache_meta (name, value, updated_at) VALUES (?, ?, ?)
+        ON CONFLICT(name) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at
+        """,
+        [name, json.dumps(value, sort_keys=True), _utc_now()],
+    )
+
+
 def _utc_now() -> str:
     return datetime.now(UTC).isoformat()
@@ -2,12 +2,42 @@ from __future__ import annotations
 
 import hashlib
 import json
+import os
 import uuid
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import UTC, datetime
-from typing import Any
+from typing import Any, TypeVar
 
 _NAMESPACE = uuid.UUID("3b6d8b5a-1b3b-4ed1-9c4b-1b0e6c2f4b2a")
 
+C = TypeVar("C")
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def env_int(name: str, default: int) -> int:
+    """Integer environment setting; unset, blank or malformed values fall back to `default`."""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return int(raw)
+    except ValueError:
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    """Float counterpart of `env_int`."""
+    raw = os.getenv(name, "").strip()
+    if not raw:
+        return default
+    try:
+        return float(raw)
+    except ValueError:
+        return default
+
 
 def utc_now() -> str:
     return datetime.now(UTC).isoformat()
@@ -20,3 +50,43 @@ def stable_uuid(name: str) -> str:
 def stable_hash(payload: Any) -> str:
     encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
     return hashlib.sha256(encoded).hexdigest()
+
+
+# Per-process context for `ordered_map` workers, installed once by the pool initializer.
+_worker_context: Any = None
+
+
+def _init_worker(context: Any) -> None:
+    global _worker_context  # noqa: PLW0603
+    _worker_context = context
+
+
+def _run_in_worker(fn: Callable[[Any, Any], Any], item: Any) -> Any:
+    return fn(_worker_context, item)
+
+
+def ordered_map(
+    fn: Callable[[C, T], R], context: C, items: Iterable[T], *, workers: int = 1
+) -> Iterator[R]:
+    """
+    Yield `fn(context, item)` for each item, in input order, across `workers` processes.
+
+    `context` is shipped to each worker once (not per task), and at most `2 * workers` tasks are
+    in flight, so a slow consumer bounds memory. `fn` must be a module-level function. With
+    `workers <= 1` everything runs inline.
+    """
+    if workers <= 1:
+        for item in items:
+            yield fn(context, item)
+        return
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(context,))
+    try:
+        pending: deque[Future[R]] = deque()
+        for item in items:
+            pending.append(pool.submit(_run_in_worker, fn, item))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)
@@ -1,3 +1,5 @@
+import json
+
 from fastapi.testclient import TestClient
 
 from notion_synth.main import create_app
@@ -248,12 +250,80 @@ def test_list_pages_pagination_headers() -> None:
     assert len(last_page.json()) == 1
 
 
+def test_list_users_cursor_pagination_walks_collection() -> None:
+    client = _client()
+
+    seen: list[str] = []
+    url = "/users?limit=2&cursor="
+    while True:
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers.get("x-offset") is None
+        seen.extend(user["id"] for user in response.json())
+        if response.headers.get("x-has-more") == "false":
+            assert response.headers.get("link") is None
+            break
+        next_cursor = response.headers["x-next-cursor"]
+        link = response.headers["link"]
+        assert "cursor=" in link
+        assert "offset=" not in link
+        url = f"/users?limit=2&cursor={next_cursor}"
+
+    assert seen == ["user_alex", "user_bianca", "user_cheng"]
+
+
+def test_offset_pagination_offers_cursor_to_switch_modes() -> None:
+    client = _client()
+
+    first = client.get("/comments?limit=1&include_pagination=true")
+    assert first.headers.get("x-next-offset") == "1"
+    next_cursor = first.headers["x-next-cursor"]
+
+    second = client.get(f"/comments?limit=1&cursor={next_cursor}")
+    assert second.status_code == 200
+    assert [c["id"] for c in second.json()] == ["comment_2"]
+    assert second.headers.get("x-has-more") == "false"
+
+
+def test_cursor_rejects_invalid_values_and_offset() -> None:
+    client = _client()
+    assert client.get("/pages?cursor=not-a-cursor").status_code == 400
+    assert client.get("/pages?cursor=&offset=1").status_code == 400
+
+
+def test_search_pages_cursor_pagination() -> None:
+    client = _client()
+    created = client.post(
+        "/pages",
+        json={
+            "workspace_id": "ws_demo",
+            "title": "Welcome notes",
+            "content": {"blocks": ["Welcome again"]},
+            "parent_type": "workspace",
+            "parent_id": "ws_demo",
+        },
+    )
+    assert created.status_code == 201
+
+    first = client.get("/search/pages?q=Welcome&limit=1&cursor=")
+    assert first.status_code == 200
+    assert first.headers.get("x-has-more") == "true"
+    second = client.get(f"/search/pages?q=Welcome&limit=1&cursor={first.headers['x-next-cursor']}")
+    assert second.status_code == 200
+    assert second.headers.get("x-has-more") == "false"
+    ids = {first.json()[0]["id"], second.json()[0]["id"]}
+    assert ids == {"page_home", created.json()["id"]}
+
+
 def test_search_pages() -> None:
     client = _client()
     response = client.get("/search/pages?q=Welcome")
     assert response.status_code == 200
     pages = response.json()
     assert [page["id"] for page in pages] == ["page_home"]
+    # Terms are quoted like on the other search endpoints, so FTS syntax in input cannot break the query.
+    assert client.get("/search/pages?q=welcome-home").status_code == 200
+    assert client.get('/search/pages?q="Welc').json()[0]["id"] == "page_home"
 
 
 def test_search_comments_and_rows() -> None:
@@ -284,6 +354,133 @@ def test_search_comments_and_rows() -> None:
     assert paged.headers.get("x-offset") == "0"
 
 
+def test_search_comments_and_rows_use_fts_indexes() -> None:
+    app = create_app(":memory:")
+    client = TestClient(app)
+    db = app.state.db
+
+    created = client.post(
+        "/comments",
+        json={"page_id": "page_home", "author_id": "user_cheng", "body": "Latency latency regression"},
+    )
+    comment_id = created.json()["id"]
+    client.post(
+        "/comments",
+        json={"page_id": "page_home", "author_id": "user_cheng", "body": "Minor latency blip"},
+    )
+
+    ranked = client.get("/search/comments?q=latency")
+    assert ranked.status_code == 200
+    # bm25 ranks the comment that mentions the term twice first.
+    assert ranked.json()[0]["id"] == comment_id
+
+    prefix = client.get("/search/comments?q=regress")
+    assert [comment["id"] for comment in prefix.json()] == [comment_id]
+
+    client.delete(f"/comments/{comment_id}")
+    assert client.get("/search/comments?q=regression").json() == []
+
+    row_search = client.get("/search/rows?q=seed demo")
+    assert [row["id"] for row in row_search.json()] == ["row_2"]
+
+    # Without the FTS tables the endpoints fall back to LIKE scans.
+    for name in ("comments_fts", "rows_fts"):
+        for suffix in ("ai", "ad", "au"):
+            db.execute(f"DROP TRIGGER {name}_{suffix}")
+        db.execute(f"DROP TABLE {name}")
+    assert [c["id"] for c in client.get("/search/comments?q=Kickoff").json()] == ["comment_1"]
+    assert [r["id"] for r in client.get("/search/rows?q=Prototype").json()] == ["row_1"]
+
+
+def test_unified_search_merges_types_by_score() -> None:
+    app = create_app(":memory:")
+    client = TestClient(app)
+    db = app.state.db
+
+    page = client.post(
+        "/pages",
+        json={
+            "workspace_id": "ws_demo",
+            "title": "Zephyr rollout",
+            "content": {"text": "zephyr zephyr zephyr"},
+            "parent_type": "workspace",
+            "parent_id": "ws_demo",
+        },
+    ).json()
+    comment = client.post(
+        "/comments",
+        json={"page_id": "page_home", "author_id": "user_cheng", "body": "Is zephyr blocked on review?"},
+    ).json()
+
+    response = client.get("/search?q=zephyr")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["query"] == "zephyr"
+    assert [(hit["type"], hit["id"]) for hit in body["hits"]] == [
+        ("page", page["id"]),
+        ("comment", comment["id"]),
+    ]
+    assert body["counts"] == {"page": 1, "comment": 1, "row": 0}
+    # Scores share one scale: only the overall best hit scores 1.0.
+    assert body["hits"][0]["score"] == 1.0 > body["hits"][1]["score"] > 0
+    assert body["hits"][0]["page"]["title"] == "Zephyr rollout"
+    assert body["hits"][1]["comment"]["body"] == "Is zephyr blocked on review?"
+    assert "<mark>zephyr</mark>" in body["hits"][1]["snippet"]
+
+    only_rows = client.get("/search?q=prototype&types=row").json()
+    assert [hit["row"]["id"] for hit in only_rows["hits"]] == ["row_1"]
+    assert only_rows["counts"] == {"row": 1}
+
+    client.post(
+        "/comments",
+        json={"page_id": "page_home", "author_id": "user_cheng", "body": "zephyr again"},
+    )
+    comments = client.get("/search?q=zephyr&types=comment").json()["hits"]
+    assert comments[0]["score"] == 1.0 > comments[1]["score"] > 0
+    capped = client.get("/search?q=zephyr&types=comment&per_type_limit=1").json()
+    assert capped["counts"] == {"comment": 1}
+    assert client.get("/search?q=zephyr&limit=1").json()["counts"]["page"] == 1
+
+    # Without FTS tables hits fall back to LIKE matching with a computed snippet.
+    for name in ("pages_fts", "comments_fts", "rows_fts"):
+        for suffix in ("ai", "ad", "au"):
+            db.execute(f"DROP TRIGGER {name}_{suffix}")
+        db.execute(f"DROP TABLE {name}")
+    fallback = client.get("/search?q=Welcome").json()
+    assert [(hit["type"], hit["id"], hit["score"]) for hit in fallback["hits"]] == [("page", "page_home", 0.0)]
+    assert fallback["hits"][0]["snippet"].startswith("<mark>Welcome</mark>")
+
+
+def test_unified_search_ranks_a_strong_hit_above_weaker_types() -> None:
+    client = TestClient(create_app(":memory:"))
+    client.post(
+        "/pages",
+        json={
+            "workspace_id": "ws_demo",
+            "title": "Launch notes",
+            "content": {"text": "Staffing, budget and vendors, plus a brief quasar mention."},
+            "parent_type": "workspace",
+            "parent_id": "ws_demo",
+        },
+    )
+    comment = client.post(
+        "/comments",
+        json={"page_id": "page_home", "author_id": "user_cheng", "body": "Quasar quasar: quasar is done."},
+    ).json()
+    for index in range(5):
+        client.post(
+            "/comments", json={"page_id": "page_home", "author_id": "user_cheng", "body": f"Note {index}"}
+        )
+
+    hits = client.get("/search?q=quasar").json()["hits"]
+    assert [hit["type"] for hit in hits] == ["comment", "page"]
+    assert hits[0]["score"] == 1.0 and hits[1]["score"] < 0.5
+    # The weaker page hit no longer ties with the comment, so it loses the single slot.
+    top = client.get("/search?q=quasar&limit=1").json()
+    assert [hit["id"] for hit in top["hits"]] == [comment["id"]]
+    assert top["counts"] == {"page": 0, "comment": 1, "row": 0}
+
+
 def test_admin_reset_requires_env_guard(monkeypatch) -> None:
     monkeypatch.delenv("NOTION_SYNTH_ADMIN", raising=False)
     client = _client()
@@ -382,6 +579,52 @@ def test_fixtures_export_import_roundtrip() -> None:
     assert len(extra_pages) == 1
 
 
+def test_fixtures_export_ndjson_streams_tagged_records() -> None:
+    client = _client()
+    fixture = client.get("/fixtures/export").json()
+
+    response = client.get("/fixtures/export?format=ndjson")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    records = [json.loads(line) for line in response.text.splitlines()]
+
+    header = records[0]
+    assert header["type"] == "fixture"
+    assert header["format_version"] == 1
+    by_type: dict[str, list[dict]] = {}
+    for record in records[1:]:
+        by_type.setdefault(record["type"], []).append(record["data"])
+    assert list(by_type) == ["workspace", "user", "page", "database", "database_row", "comment"]
+    # Each record matches the model shape of the JSON export.
+    assert by_type["page"] == fixture["pages"]
+    assert by_type["database"] == fixture["databases"]
+    assert by_type["database_row"] == fixture["database_rows"]
+    assert by_type["comment"] == fixture["comments"]
+
+
+def test_fixtures_import_stream_roundtrips_ndjson() -> None:
+    source = _client()
+    body = source.get("/fixtures/export?format=ndjson").content
+
+    target = _client()
+    target.post("/workspaces", json={"name": "Scratch"})
+    imported = target.post(
+        "/fixtures/import/stream?mode=replace&chunk_size=1",
+        content=body,
+        headers={"content-type": "application/x-ndjson"},
+    )
+    assert imported.status_code == 200
+    assert imported.json()["inserted"]["database_rows"] == 2
+    assert imported.json()["batches"] == sum(imported.json()["inserted"].values())
+    assert target.get("/stats").json() == source.get("/stats").json()
+
+    invalid = target.post("/fixtures/import/stream", content=b'{"type": "page", "data": {}}\n')
+    assert invalid.status_code == 400
+    assert "page record" in invalid.json()["detail"]
+    # The failed import rolled back; the previous data is intact.
+    assert target.get("/stats").json() == source.get("/stats").json()
+
+
 def test_delete_page_also_deletes_comments() -> None:
     client = _client()
     seeded_comments = client.get("/comments?page_id=page_home").json()
@@ -521,6 +764,79 @@ def test_database_rows_filtering_and_total_header() -> None:
     assert rejected.status_code == 400
 
 
+def test_row_property_index_tracks_row_and_schema_changes() -> None:
+    app = create_app(":memory:")
+    client = TestClient(app)
+    db = app.state.db
+
+    created_db = client.post(
+        "/databases",
+        json={
+            "workspace_id": "ws_demo",
+            "name": "Tickets",
+            "schema": {
+                "properties": {
+                    "Title": {"type": "title"},
+                    "Status": {"type": "select"},
+                    "Team": {"type": "rich_text"},
+                }
+            },
+        },
+    )
+    database_id = created_db.json()["id"]
+    row_ids = []
+    for title, status, team in [("A", "Open", "Core"), ("B", "Done", "Core"), ("C", "Done", "Edge")]:
+        created = client.post(
+            f"/databases/{database_id}/rows",
+            json={"properties": {"Title": title, "Status": status, "Team": team}},
+        )
+        row_ids.append(created.json()["id"])
+
+    def indexed_values(name: str) -> set[str]:
+        rows = db.query_all(
+            "SELECT value_text FROM row_property_values WHERE database_id = ? AND name = ?",
+            [database_id, name],
+        )
+        return {row["value_text"] for row in rows}
+
+    assert indexed_values("Status") == {"Open", "Done"}
+    assert indexed_values("Team") == set()
+
+    filtered = client.get(
+        f"/databases/{database_id}/rows?property_equals=Status:Done&property_equals=Team:Core"
+    )
+    assert [row["id"] for row in filtered.json()] == [row_ids[1]]
+
+    client.patch(
+        f"/databases/{database_id}/rows/{row_ids[0]}",
+        json={"properties": {"Title": "A", "Status": "Done", "Team": "Core"}},
+    )
+    assert indexed_values("Status") == {"Done"}
+
+    # Opting a property in via the schema reindexes existing rows.
+    client.patch(
+        f"/databases/{database_id}",
+        json={
+            "schema": {
+                "properties": {
+                    "Title": {"type": "title"},
+                    "Status": {"type": "select"},
+                    "Team": {"type": "rich_text", "indexed": True},
+                }
+            }
+        },
+    )
+    assert indexed_values("Team") == {"Core", "Edge"}
+    both = client.get(
+        f"/databases/{database_id}/rows?property_equals=Status:Done&property_equals=Team:Core&include_total=true"
+    )
+    assert both.headers.get("x-total-count") == "2"
+    assert {row["id"] for row in both.json()} == {row_ids[0], row_ids[1]}
+
+    client.delete(f"/databases/{database_id}/rows/{row_ids[2]}")
+    assert indexed_values("Team") == {"Core"}
+
+
 def test_create_database_rejects_invalid_workspace() -> None:
     client = _client()
     created_db = client.post(
@@ -541,3 +857,13 @@ def test_create_database_row_rejects_invalid_database() -> None:
         json={"properties": {"Title": "X"}},
     )
     assert created_row.status_code == 400
+
+
+def test_pool_stats_for_memory_db() -> None:
+    client = _client()
+    response = client.get("/stats/pool")
+    assert response.status_code == 200
+    body = response.json()
+    assert body["db_path"] == ":memory:"
+    assert body["pooled"] is False
+    assert body["readers"] is None
@@ -1,5 +1,6 @@
+from notion_synth.blueprint_diff import diff_blueprints
 from notion_synth.blueprint_generator import BlueprintConfig, generate_blueprint
-from notion_synth.blueprint_models import IdentityUser
+from notion_synth.blueprint_models import BlockSpec, IdentityUser, PageSpec
 
 
 def _roster() -> list[IdentityUser]:
@@ -46,3 +47,36 @@ def test_blueprint_is_deterministic() -> None:
     assert blueprint_a.company == blueprint_b.company
     assert blueprint_a.notion_plan.pages[0].title == blueprint_b.notion_plan.pages[0].title
     assert blueprint_a.notion_plan.rows[0].properties[0].value == blueprint_b.notion_plan.rows[0].properties[0].value
+
+
+def test_sharded_blueprint_rows_match_across_worker_counts() -> None:
+    config = BlueprintConfig(company="Acme", seed=7, org_profile="engineering", scale="small")
+    default = generate_blueprint(config, roster=_roster())
+    inline = generate_blueprint(config, roster=_roster(), workers=1)
+    pooled = generate_blueprint(config, roster=_roster(), workers=2)
+    assert default.notion_plan == inline.notion_plan == pooled.notion_plan
+    assert default.activity_stream == inline.activity_stream == pooled.activity_stream
+    assert len(inline.notion_plan.rows) == 20 + 120 + 18
+
+
+def test_diff_blueprints_reports_spec_level_changes() -> None:
+    config = BlueprintConfig(company="Acme", seed=7, org_profile="engineering", scale="small")
+    old = generate_blueprint(config, roster=_roster())
+    new = old.model_copy(deep=True)
+    plan = new.notion_plan
+    plan.pages[0].title = "Renamed"
+    removed_row = plan.rows.pop()
+    mentioning = plan.pages[1]
+    plan.pages.append(
+        PageSpec(synth_id="page_new", parent_synth_id=mentioning.parent_synth_id, title="New", blocks=[])
+    )
+    mentioning.blocks.append(BlockSpec(type="paragraph", text="See [[synth:page:page_new]]"))
+    old.notion_plan.pages[1] = mentioning.model_copy(deep=True)
+
+    diff = diff_blueprints(old, new)
+    assert diff.creates == ["page_new"]
+    assert diff.updates == [plan.pages[0].synth_id, mentioning.synth_id]
+    assert diff.archives == [removed_row.synth_id]
+    total = len(plan.roots) + len(plan.databases) + len(plan.pages) + len(plan.rows) + len(plan.comments)
+    assert diff.unchanged == total - 3
+    assert diff_blueprints(new, new).summary() == {"creates": 0, "updates": 0, "archives": 0, "unchanged": total}
@@ -58,3 +58,44 @@ def test_cli_packs_apply_preview_and_apply(tmp_path, capsys) -> None:
     assert applied["after"]["workspaces"] == 1
     assert applied["after"]["users"] == applied["pack"]["counts"]["users"]
 
+
+def test_cli_export_ndjson(tmp_path) -> None:
+    db_path = tmp_path / "export.db"
+    output = tmp_path / "fixture.ndjson"
+    rc = main(["export", "--db", str(db_path), "--format", "ndjson", "--output", str(output)])
+    assert rc == 0
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert records[0]["type"] == "fixture"
+    assert sum(1 for record in records if record["type"] == "user") == 3
+
+
+def test_cli_import_ndjson_in_chunks_with_progress(tmp_path, capsys) -> None:
+    source = tmp_path / "source.db"
+    fixture = tmp_path / "fixture.ndjson"
+    assert main(["export", "--db", str(source), "--format", "ndjson", "--output", str(fixture)]) == 0
+
+    target = tmp_path / "target.db"
+    rc = main(["import", str(fixture), "--db", str(target), "--chunk-size", "2", "--progress"])
+    assert rc == 0
+    captured = capsys.readouterr()
+    result = json.loads(captured.out)
+    assert result["inserted"]["users"] == 3
+    assert result["inserted"]["comments"] == 2
+    # users (3 rows) arrive as a 2-row and a 1-row batch.
+    progress_lines = captured.err.splitlines()
+    assert any("users=2" in line for line in progress_lines)
+    assert progress_lines[-1].startswith(f"imported {sum(result['inserted'].values())} records")
+
+
+def test_cli_seed_and_generate_with_columnar_engine(tmp_path, capsys) -> None:
+    args = ["--company", "Acme", "--users", "30", "--projects", "12", "--engine", "columnar"]
+    rc = main(["seed", *args, "--db", str(tmp_path / "seed.db")])
+    assert rc == 0
+    result = json.loads(capsys.readouterr().out)
+    assert result["inserted"]["users"] == 30
+
+    output = tmp_path / "fixture.ndjson"
+    assert main(["generate", *args, "--output", str(output)]) == 0
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert records[0]["type"] == "fixture"
+    assert sum(1 for record in records if record["type"] == "user") == 30
@@ -32,4 +32,5 @@ def test_cors_enabled_exposes_paging_headers(monkeypatch) -> None:
     assert "x-offset" in exposed
     assert "x-has-more" in exposed
     assert "x-next-offset" in exposed
+    assert "x-next-cursor" in exposed
     assert "link" in exposed
@@ -0,0 +1,210 @@
+import sqlite3
+import threading
+
+from notion_synth.db import ConnectionPool, bulk_load, connect
+
+
+def test_file_db_uses_wal_and_reader_pool(tmp_path) -> None:
+    db = connect(str(tmp_path / "pool.db"))
+    try:
+        assert db.journal_mode == "wal"
+        assert db.readers is not None
+
+        row = db.query_one("SELECT COUNT(*) AS count FROM users")
+        assert row is not None
+        assert row["count"] == 3
+
+        stats = db.pool_stats()
+        assert stats["pooled"] is True
+        assert stats["readers"]["checkouts"] >= 1
+        assert stats["readers"]["in_use"] == 0
+    finally:
+        db.close()
+
+
+def test_memory_db_shares_writer_connection() -> None:
+    db = connect(":memory:")
+    assert db.readers is None
+    assert db.pool_stats()["pooled"] is False
+    db.execute("INSERT INTO workspaces (id, name, created_at) VALUES ('ws_x', 'X', 'now')")
+    assert db.query_one("SELECT id FROM workspaces WHERE id = 'ws_x'") is not None
+
+
+def test_wal_can_be_disabled(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("NOTION_SYNTH_SQLITE_WAL", "0")
+    db = connect(str(tmp_path / "nowal.db"))
+    try:
+        assert db.journal_mode == "delete"
+    finally:
+        db.close()
+
+
+def test_pool_reuses_connections_across_threads(tmp_path) -> None:
+    db = connect(str(tmp_path / "threads.db"))
+    errors: list[Exception] = []
+
+    def worker() -> None:
+        try:
+            for _ in range(20):
+                assert db.query_all("SELECT id FROM pages ORDER BY created_at")
+        except Exception as exc:  # pragma: no cover - surfaced via assertion below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    try:
+        assert not errors
+        stats = db.readers.stats() if db.readers else {}
+        assert stats["opened"] <= stats["size"]
+        assert stats["checkouts"] >= 160
+    finally:
+        db.close()
+
+
+def test_pool_records_wait_when_exhausted() -> None:
+    opened: list[int] = []
+
+    def factory() -> sqlite3.Connection:
+        opened.append(1)
+        return sqlite3.connect(":memory:", check_same_thread=False)
+
+    pool = ConnectionPool(factory, size=1, timeout_s=1.0)
+    released = threading.Event()
+
+    with pool.checkout():
+
+        def waiter() -> None:
+            with pool.checkout():
+                released.set()
+
+        thread = threading.Thread(target=waiter)
+        thread.start()
+        thread.join(timeout=0.05)
+    thread.join()
+    assert released.is_set()
+    stats = pool.stats()
+    assert len(opened) == 1
+    assert stats["waits"] == 1
+    assert stats["checkouts"] == 2
+    pool.close()
+
+
+def test_transaction_commits_once_and_nested_savepoint_rolls_back(tmp_path) -> None:
+    db = connect(str(tmp_path / "tx.db"))
+    try:
+        with db.transaction():
+            db.execute("INSERT INTO workspaces (id, name, created_at) VALUES ('ws_a', 'A', 'now')")
+            # Uncommitted writes are visible on this thread, not to pooled readers elsewhere.
+            assert db.query_one("SELECT id FROM workspaces WHERE id = 'ws_a'") is not None
+            seen_elsewhere: list[bool] = []
+            thread = threading.Thread(
+                target=lambda: seen_elsewhere.append(
+                    db.query_one("SELECT id FROM workspaces WHERE id = 'ws_a'") is not None
+                )
+            )
+            thread.start()
+            thread.join()
+            assert seen_elsewhere == [False]
+
+            try:
+                with db.transaction():
+                    db.execute(
+                        "INSERT INTO workspaces (id, name, created_at) VALUES ('ws_b', 'B', 'now')"
+                    )
+                    raise RuntimeError("boom")
+            except RuntimeError:
+                pass
+
+        assert db.query_one("SELECT id FROM workspaces WHERE id = 'ws_a'") is not None
+        assert db.query_one("SELECT id FROM workspaces WHERE id = 'ws_b'") is None
+        assert not db.in_transaction()
+    finally:
+        db.close()
+
+
+def test_transaction_rolls_back_on_error() -> None:
+    db = connect(":memory:")
+    try:
+        with db.transaction():
+            db.execute("DELETE FROM comments")
+            raise ValueError("abort")
+    except ValueError:
+        pass
+    row = db.query_one("SELECT COUNT(*) AS count FROM comments")
+    assert row is not None
+    assert row["count"] == 2
+
+
+def test_stream_fetches_in_batches_from_pinned_reader(tmp_path) -> None:
+    db = connect(str(tmp_path / "stream.db"))
+    try:
+        rows = db.stream("SELECT id FROM users ORDER BY created_at, id", batch_size=2)
+        first = next(rows)
+        assert db.pool_stats()["readers"]["in_use"] == 1
+        rest = [row["id"] for row in rows]
+        assert [first["id"], *rest] == ["user_alex", "user_bianca", "user_cheng"]
+        assert db.pool_stats()["readers"]["in_use"] == 0
+    finally:
+        db.close()
+
+
+def test_stream_on_memory_db_releases_writer_between_batches() -> None:
+    db = connect(":memory:")
+    rows = db.stream("SELECT id FROM users ORDER BY created_at, id", batch_size=1)
+    assert next(rows)["id"] == "user_alex"
+
+    errors: list[BaseException] = []
+
+    def write() -> None:
+        try:
+            db.execute("INSERT INTO workspaces (id, name, created_at) VALUES ('ws_t', 'T', 'now')")
+        except BaseException as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    worker = threading.Thread(target=write)
+    worker.start()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+    assert errors == []
+    assert len(list(rows)) == 2
+
+
+def test_bulk_load_restores_schema_and_rebuilds_derived_indexes(tmp_path) -> None:
+    db = connect(str(tmp_path / "bulk.db"))
+    schema_sql = "SELECT type, name FROM sqlite_master WHERE type IN ('index', 'trigger') ORDER BY 1, 2"
+    try:
+        before = [tuple(row) for row in db.query_all(schema_sql)]
+        with bulk_load(db) as cursor:
+            assert cursor.execute("PRAGMA synchronous").fetchone()[0] == 0
+            assert cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='trigger'").fetchone()[0] == 0
+            cursor.execute(
+                "INSERT INTO pages (id, workspace_id, title, content, parent_type, parent_id, created_at, updated_at) "
+                "VALUES ('page_bulk', 'ws_demo', 'Bulkloaded', 'zeppelin', 'workspace', 'ws_demo', 'now', 'now')"
+            )
+
+        assert [tuple(row) for row in db.query_all(schema_sql)] == before
+        assert db.query_one("PRAGMA synchronous")[0] != 0
+        if db.query_one("SELECT 1 FROM sqlite_master WHERE name = 'pages_fts'"):
+            hit = db.query_one("SELECT rowid FROM pages_fts WHERE pages_fts MATCH 'zeppelin'")
+            assert hit is not None
+    finally:
+        db.close()
+
+
+def test_bulk_load_rejects_dangling_foreign_keys() -> None:
+    db = connect(":memory:")
+    try:
+        with bulk_load(db) as cursor:
+            cursor.execute(
+                "INSERT INTO users (id, workspace_id, name, email, created_at) "
+                "VALUES ('user_orphan', 'ws_missing', 'O', 'o@example.com', 'now')"
+            )
+    except sqlite3.IntegrityError:
+        pass
+    else:  # pragma: no cover - assertion below
+        raise AssertionError("expected IntegrityError")
+    assert db.query_one("SELECT id FROM users WHERE id = 'user_orphan'") is None
+    assert db.query_one("PRAGMA foreign_keys")[0] == 1
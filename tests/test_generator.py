@@ -1,6 +1,18 @@
 from notion_synth.db import connect
-from notion_synth.fixtures import import_fixture
-from notion_synth.generator import SyntheticWorkspaceConfig, generate_fixture
+from notion_synth.fixtures import (
+    FIXTURE_COLUMNS,
+    import_fixture,
+    import_fixture_batches,
+    import_fixture_records,
+    iter_batches_ndjson,
+    iter_ndjson_records,
+)
+from notion_synth.generator import (
+    SyntheticWorkspaceConfig,
+    fixture_exported_at,
+    generate_fixture,
+    iter_fixture_batches,
+)
 
 
 def test_generate_fixture_is_deterministic() -> None:
@@ -28,3 +40,41 @@ def test_import_generated_fixture_replaces_seed_data() -> None:
     stats = db.query_one("SELECT COUNT(*) AS count FROM users")
     assert stats is not None
     assert stats["count"] == 8
+
+
+def test_columnar_engine_is_deterministic_and_loads() -> None:
+    config = SyntheticWorkspaceConfig(
+        company_name="Acme", seed=5, user_count=40, team_count=14, project_count=25
+    )
+    batches = list(iter_fixture_batches(config, batch_size=7))
+    assert batches == list(iter_fixture_batches(config, batch_size=7))
+    for record_type, rows in batches:
+        assert all(len(row) == len(FIXTURE_COLUMNS[record_type]) for row in rows)
+    user_rows = [row for record_type, rows in batches if record_type == "user" for row in rows]
+    assert any(row[2].endswith("(Platform 2)") for row in user_rows)
+
+    # The NDJSON rendering validates through the regular record importer.
+    lines = "".join(
+        iter_batches_ndjson(iter(batches), exported_at=fixture_exported_at(config))
+    ).splitlines()
+    db = connect(":memory:")
+    result = import_fixture_records(db, iter_ndjson_records(lines), mode="replace")
+    assert result.inserted["users"] == 40
+    assert result.inserted["database_rows"] == 25 + 10 + 12
+
+    direct = connect(":memory:")
+    assert import_fixture_batches(direct, batches).inserted == result.inserted
+    row = direct.query_one(
+        "SELECT COUNT(*) AS count FROM row_property_values WHERE name = 'Team' AND value_text = 'Platform'"
+    )
+    assert row is not None
+    assert row["count"] > 0
+
+
+def test_columnar_engine_output_does_not_depend_on_workers() -> None:
+    config = SyntheticWorkspaceConfig(
+        company_name="Acme", seed=11, user_count=30, project_count=20, incident_count=9
+    )
+    serial = list(iter_fixture_batches(config, batch_size=8))
+    assert list(iter_fixture_batches(config, batch_size=8, workers=2)) == serial
+    assert [record_type for record_type, _ in serial].count("user") == 4
@@ -1,87 +1,879 @@
+import asyncio
 import json
+import sqlite3
 import time
+from urllib.parse import unquote
 
 import httpx
+import pytest
 
+from notion_synth.audit import AuditLog
+from notion_synth.blueprint_diff import diff_blueprints
+from notion_synth.blueprint_generator import BlueprintConfig, generate_blueprint
+from notion_synth.blueprint_models import BlockSpec, IdentityUser, NotionPlan, PageSpec
 from notion_synth.cli import main
-from notion_synth.providers.entra.graph import GraphClient
-from notion_synth.providers.notion.client import NotionClient
+from notion_synth.providers.entra.apply import EntraApplyError, apply_entra
+from notion_synth.providers.entra.graph import GraphClient, sync_directory
+from notion_synth.providers.notion.apply import (
+    apply_blueprint,
+    apply_blueprint_async,
+    destroy_blueprint,
+    destroy_blueprint_async,
+)
+from notion_synth.providers.notion.client import AsyncNotionClient, NotionClient
+from notion_synth.providers.notion.ratelimit import RateLimiter
+from notion_synth.state import (
+    connect_state,
+    get_object,
+    latest_applied_blueprint,
+    save_applied_blueprint,
+)
 
 
 def test_notion_client_retries_on_429(monkeypatch) -> None:
-    calls: list[tuple[str, str, dict[str, str] | None, object | None]] = []
+    calls: list[tuple[str, str, httpx.Headers]] = []
     slept: list[float] = []
 
     def fake_sleep(seconds: float) -> None:
         slept.append(seconds)
 
-    def fake_request(
-        method: str,
-        url: str,
-        *,
-        headers: dict[str, str] | None = None,
-        json: object | None = None,
-        timeout: float | None = None,
-    ) -> httpx.Response:
-        _ = timeout
-        calls.append((method, url, headers, json))
-        req = httpx.Request(method, url)
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append((request.method, str(request.url), request.headers))
         if len(calls) == 1:
-            return httpx.Response(
-                429,
-                headers={"retry-after": "0"},
-                json={"error": "rate limited"},
-                request=req,
-            )
-        return httpx.Response(200, json={"ok": True}, request=req)
+            return httpx.Response(429, headers={"retry-after": "0"}, json={"error": "rate limited"})
+        return httpx.Response(200, json={"ok": True})
 
     monkeypatch.setattr(time, "sleep", fake_sleep)
-    monkeypatch.setattr(httpx, "request", fake_request)
 
-    client = NotionClient(token="tok", max_retries=2, timeout=1)
+    client = NotionClient(
+        token="tok", max_retries=2, timeout=1, transport=httpx.MockTransport(handler)
+    )
     payload = client.request("GET", "/pages/page_123")
     assert payload["ok"] is True
     assert len(calls) == 2
     assert slept == [0.0]
-    assert calls[0][2] is not None
+    assert calls[0][1] == "https://api.notion.com/v1/pages/page_123"
     assert calls[0][2]["Authorization"] == "Bearer tok"
     assert calls[0][2]["Notion-Version"]
+    assert client.stats()["retries"] == 1
+
+
+def test_notion_client_reuses_one_pooled_client(monkeypatch) -> None:
+    monkeypatch.setenv("NOTION_SYNTH_HTTP_MAX_CONNECTIONS", "4")
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, json={"id": "p"}))
+    with NotionClient.from_env("tok") as client:
+        client.transport = transport
+        assert client.max_connections == 4
+        for _ in range(3):
+            client.get_page("p")
+        pooled = client._http
+        assert pooled is not None
+        stats = client.stats()
+        assert stats["requests"] == 3
+        assert stats["http_versions"] == {"HTTP/1.1": 3}
+        assert stats["reused"] == 3
+    assert client._http is None
+    assert pooled.is_closed
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_rate_limiter_bursts_then_paces_and_backs_off() -> None:
+    clock = _FakeClock()
+    limiter = RateLimiter(rate=2.0, burst=2, recovery=0.5, clock=clock)
+    assert [limiter.reserve() for _ in range(3)] == [0.0, 0.0, 0.5]
+    clock.sleep(1.0)
+    assert limiter.reserve() == 0.0
+
+    limiter.on_rate_limited(retry_after=2.0)
+    assert limiter.stats()["rate"] == 1.0
+    assert limiter.reserve() == 2.0
+    limiter.on_success()
+    limiter.on_success()
+    limiter.on_success()
+    stats = limiter.stats()
+    assert stats["rate"] == 2.0
+    assert stats["rate_limited"] == 1
+    assert stats["throttled_requests"] == 2
+    assert stats["throttled_seconds"] == 2.5
+
+
+def test_notion_client_waits_out_429_in_shared_limiter(monkeypatch) -> None:
+    clock = _FakeClock()
+    monkeypatch.setattr(time, "sleep", clock.sleep)
+    responses = iter([httpx.Response(429, headers={"retry-after": "1.5"}), httpx.Response(200, json={"id": "p"})])
+    sent_at: list[float] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent_at.append(clock.now)
+        return next(responses, httpx.Response(200, json={"id": "p"}))
+
+    limiter = RateLimiter(rate=3.0, burst=5, clock=clock)
+    client = NotionClient(token="tok", transport=httpx.MockTransport(handler), rate_limiter=limiter)
+    assert client.get_page("p") == {"id": "p"}
+    client.get_page("p")
+    assert sent_at[:2] == [0.0, 1.5]
+    stats = client.stats()
+    assert stats["retries"] == 1
+    assert stats["rate_limit"]["rate_limited"] == 1
+    assert stats["rate_limit"]["throttled_seconds"] >= 1.5
+
+
+class _FakeNotion:
+    """
+    Assigns remote ids, rejects creates whose parent does not exist yet and lists what was created
+    (and the blocks appended under it).
+    """
+
+    def __init__(self) -> None:
+        self.known = {"root-page"}
+        self.children: dict[str, list[dict]] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content or b"{}")
+        if request.method == "GET" or request.url.path.endswith("/query"):
+            parent_id = request.url.params.get("block_id") or request.url.path.split("/")[3]
+            return httpx.Response(200, json={"results": self.children.get(parent_id, []), "has_more": False})
+        if request.method == "PATCH" and request.url.path.endswith("/children"):
+            self.children.setdefault(request.url.path.split("/")[3], []).extend(body["children"])
+            return httpx.Response(200, json={"results": body["children"]})
+        parent = body.get("parent") or {}
+        parent_id = parent.get("page_id") or parent.get("database_id")
+        if request.method == "POST" and parent_id not in self.known:
+            return httpx.Response(400, json={"message": f"unknown parent {parent_id}"})
+        remote_id = f"remote-{len(self.known)}"
+        self.known.add(remote_id)
+        if request.method == "POST":
+            title = body.get("title") or (body.get("properties") or {}).get("title", {}).get("title")
+            kind = {"/v1/databases": "child_database", "/v1/comments": "comment"}.get(request.url.path, "child_page")
+            child = {"id": remote_id, kind: {"title": "".join(part["text"]["content"] for part in title or [])}}
+            self.children.setdefault(parent_id, []).append(
+                {**child, "type": kind, "rich_text": body.get("rich_text", [])}
+            )
+            self.children[remote_id] = list(body.get("children", []))
+        return httpx.Response(200, json={"id": remote_id})
+
+    async def handle_async(self, request: httpx.Request) -> httpx.Response:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.001)
+        self.in_flight -= 1
+        return self.handle(request)
+
+
+def _apply_blueprint_fixture():
+    roster = [
+        IdentityUser(
+            synth_user_id="user_1",
+            display_name="Alex Rivers",
+            given_name="Alex",
+            surname="Rivers",
+            upn="alex@example.com",
+            email="alex@example.com",
+            department="Engineering",
+            job_title="Engineer",
+            office_location="Remote",
+            manager_synth_user_id=None,
+            team="Platform",
+        )
+    ]
+    return generate_blueprint(
+        BlueprintConfig(company="Acme", seed=7, org_profile="engineering", scale="small"), roster=roster
+    )
+
+
+def test_apply_blueprint_async_matches_sequential_apply(tmp_path) -> None:
+    blueprint = _apply_blueprint_fixture()
+
+    sequential_store = connect_state(":memory:")
+    sequential = apply_blueprint(
+        blueprint,
+        root_page_id="root-page",
+        store=sequential_store,
+        client=NotionClient(token="tok", transport=httpx.MockTransport(_FakeNotion().handle)),
+        audit=AuditLog(tmp_path / "sequential.jsonl"),
+    )
+
+    fake = _FakeNotion()
+    store = connect_state(":memory:")
+    audit = AuditLog(tmp_path / "concurrent.jsonl")
+
+    async def run_concurrently():
+        async with AsyncNotionClient(token="tok", transport=httpx.MockTransport(fake.handle_async)) as client:
+            first = await apply_blueprint_async(
+                blueprint, root_page_id="root-page", store=store, client=client, audit=audit, concurrency=6
+            )
+            again = await apply_blueprint_async(
+                blueprint, root_page_id="root-page", store=store, client=client, audit=audit, concurrency=6
+            )
+            return first, again
+
+    concurrent, rerun = asyncio.run(run_concurrently())
+    assert concurrent.created == sequential.created > 0
+    assert 1 < fake.max_in_flight <= 6
+    assert rerun.created == rerun.updated == 0
+    assert rerun.skipped == concurrent.created
+
+    def objects(state) -> list[tuple[str, str, str | None]]:
+        rows = state.query_all("SELECT synth_id, kind, parent_synth_id FROM objects ORDER BY synth_id")
+        return [tuple(row) for row in rows]
+
+    assert objects(store) == objects(sequential_store)
+    audit_lines = (tmp_path / "concurrent.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(audit_lines) == concurrent.created
+
+
+def test_apply_blueprint_resumes_after_last_checkpoint(tmp_path) -> None:
+    blueprint = _apply_blueprint_fixture()
+    reference = _FakeNotion()
+    full = apply_blueprint(
+        blueprint,
+        root_page_id="root-page",
+        store=connect_state(":memory:"),
+        client=NotionClient(token="tok", transport=httpx.MockTransport(reference.handle)),
+        audit=AuditLog(tmp_path / "reference.jsonl"),
+    )
+
+    fake = _FakeNotion()
+    sent: list[str] = []
+
+    def crash_after_five(request: httpx.Request) -> httpx.Response:
+        if len(sent) == 5:
+            raise RuntimeError("connection lost")
+        sent.append(request.url.path)
+        return fake.handle(request)
+
+    store = connect_state(str(tmp_path / "state.db"))
+    audit = AuditLog(tmp_path / "run.jsonl")
+    with pytest.raises(RuntimeError):
+        apply_blueprint(
+            blueprint,
+            root_page_id="root-page",
+            store=store,
+            client=NotionClient(token="tok", transport=httpx.MockTransport(crash_after_five)),
+            audit=audit,
+            run_id="run-1",
+        )
+
+    store = connect_state(str(tmp_path / "state.db"))
+    resumed_requests: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        resumed_requests.append(request.url.path)
+        return fake.handle(request)
+
+    resumed = apply_blueprint(
+        blueprint,
+        root_page_id="root-page",
+        store=store,
+        client=NotionClient(token="tok", transport=httpx.MockTransport(handle)),
+        audit=audit,
+        run_id="run-1",
+        resume=True,
+    )
+    assert resumed.resumed == 5
+    assert resumed.skipped == 0
+    assert resumed.created == full.created - 5
+    # The unanswered create is looked up first (it never reached Notion, so it is sent again).
+    lookup, *creates = resumed_requests
+    assert lookup == "/v1/blocks/root-page/children"
+    assert len(sent) + len(creates) == len(fake.known) - 1
+    in_flight = [json.loads(line) for line in audit.path.read_text(encoding="utf-8").splitlines()]
+    assert [event["action"] for event in in_flight].count("resume_in_flight") == 1
+    assert store.query_one("SELECT COUNT(*) FROM run_requests")[0] == 0
+    assert store.query_one("SELECT COUNT(*) FROM objects")[0] == full.created
+
+
+def test_apply_blueprint_applies_only_the_diff(tmp_path) -> None:
+    old = _apply_blueprint_fixture()
+    fake = _FakeNotion()
+    requests: list[tuple[str, str]] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        requests.append((request.method, request.url.path))
+        if request.method == "PATCH":  # like Notion, updates keep the object's id
+            return httpx.Response(200, json={"id": request.url.path.split("/")[3]})
+        return fake.handle(request)
+
+    store = connect_state(":memory:")
+    client = NotionClient(token="tok", transport=httpx.MockTransport(handle))
+    audit = AuditLog(tmp_path / "audit.jsonl")
+    apply_blueprint(old, root_page_id="root-page", store=store, client=client, audit=audit)
+
+    new = old.model_copy(deep=True)
+    plan = new.notion_plan
+    plan.pages[0].title = "Renamed"
+    dropped = plan.rows[-1].database_synth_id
+    plan.databases = [db for db in plan.databases if db.synth_id != dropped]
+    plan.rows = [row for row in plan.rows if row.database_synth_id != dropped]
+    page_id = get_object(store, plan.pages[0].synth_id)["remote_id"]
+    database_id = get_object(store, dropped)["remote_id"]
+    requests.clear()
+    changes = diff_blueprints(old, new)
+    result = apply_blueprint(
+        new, root_page_id="root-page", store=store, client=client, audit=audit, run_id="run-2", changes=changes
+    )
+
+    assert (result.created, result.updated, result.skipped) == (0, 1, 0)
+    assert result.archived == len(changes.archives) > 1
+    # The renamed page is patched (title, then blocks); dropping the database archives its rows with it.
+    assert requests == [
+        ("PATCH", f"/v1/pages/{page_id}"),
+        ("PATCH", f"/v1/blocks/{page_id}/children"),
+        ("PATCH", f"/v1/pages/{database_id}"),
+    ]
+    assert all(get_object(store, synth_id) is None for synth_id in changes.archives)
+
+    requests.clear()
+    rerun = apply_blueprint(new, root_page_id="root-page", store=store, client=client, audit=audit)
+    assert requests == [] and rerun.created == rerun.updated == 0
+
+
+def test_destroy_blueprint_archives_only_top_level_objects(tmp_path) -> None:
+    blueprint = _apply_blueprint_fixture()
+    archives: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.method == "PATCH":
+            archives.append(request.url.path)
+        return _FakeNotion().handle(request) if request.method == "POST" else httpx.Response(200, json={})
+
+    def applied_store():
+        store = connect_state(":memory:")
+        client = NotionClient(token="tok", transport=httpx.MockTransport(_FakeNotion().handle))
+        apply_blueprint(blueprint, root_page_id="root-page", store=store, client=client, audit=AuditLog(tmp_path / "a"))
+        save_applied_blueprint(store, "bp", "root-page", blueprint.model_dump_json())
+        return store
+
+    plan = blueprint.notion_plan
+    # Only the blueprint's root page and the pages/databases placed directly under the workspace root.
+    top_level = len(plan.roots) + sum(spec.parent_type == "root" for spec in [*plan.pages, *plan.databases])
+    store = applied_store()
+    tracked = store.query_one("SELECT COUNT(*) FROM objects WHERE kind != 'comment'")[0]
+    client = NotionClient(token="tok", transport=httpx.MockTransport(handle))
+    assert destroy_blueprint(store, client, AuditLog(tmp_path / "destroy.jsonl")) == tracked
+    assert len(archives) == top_level < tracked // 4
+    assert store.query_one("SELECT COUNT(*) FROM objects")[0] == 0
+    # A later `--incremental` apply must not diff against what was just destroyed.
+    assert latest_applied_blueprint(store, "root-page") is None
+    audit_lines = (tmp_path / "destroy.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(audit_lines) == len(plan.comments) + tracked
+
+    async def handle_async(request: httpx.Request) -> httpx.Response:
+        return handle(request)
+
+    async def destroy_concurrently(store) -> int:
+        async with AsyncNotionClient(token="tok", transport=httpx.MockTransport(handle_async)) as client:
+            return await destroy_blueprint_async(store, client, AuditLog(tmp_path / "async.jsonl"), concurrency=4)
+
+    archives.clear()
+    store = applied_store()
+    assert asyncio.run(destroy_concurrently(store)) == tracked
+    assert sorted(archives) == sorted(set(archives)) and len(archives) == top_level
+
+
+def test_apply_blueprint_resume_adopts_creates_sent_before_a_crash(tmp_path) -> None:
+    blueprint = _apply_blueprint_fixture()
+    fake = _FakeNotion()
+    sent: list[str] = []
 
+    def crash_after_response(request: httpx.Request) -> httpx.Response:
+        response = fake.handle(request)
+        sent.append(request.method)
+        if sent.count("POST") == 6:
+            raise RuntimeError("connection lost")  # Notion made the object, the response is lost
+        return response
 
-def test_graph_client_returns_empty_dict_on_204(monkeypatch) -> None:
+    store = connect_state(str(tmp_path / "state.db"))
+    audit = AuditLog(tmp_path / "run.jsonl")
+    with pytest.raises(RuntimeError):
+        apply_blueprint(
+            blueprint,
+            root_page_id="root-page",
+            store=store,
+            client=NotionClient(token="tok", transport=httpx.MockTransport(crash_after_response)),
+            audit=audit,
+            run_id="run-1",
+        )
+    # The sixth create was journaled as sent, but its response never was.
+    store = connect_state(str(tmp_path / "state.db"))
+    resumed = apply_blueprint(
+        blueprint,
+        root_page_id="root-page",
+        store=store,
+        client=NotionClient(token="tok", transport=httpx.MockTransport(fake.handle)),
+        audit=audit,
+        run_id="run-1",
+        resume=True,
+    )
+    tracked = store.query_one("SELECT COUNT(*) FROM objects")[0]
+    assert len(fake.known) - 1 == tracked  # nothing was created twice
+    events = [json.loads(line)["action"] for line in audit.path.read_text(encoding="utf-8").splitlines()]
+    assert events.count("resume_adopted") == 1
+    assert resumed.created == tracked - 5
+
+
+@pytest.mark.parametrize("killed_at", [2, 6, 12])
+def test_apply_blueprint_resumes_a_killed_run_without_duplicate_creates(tmp_path, killed_at) -> None:
+    blueprint = _apply_blueprint_fixture()
+    fake = _FakeNotion()
+    path = str(tmp_path / "state.db")
+    killed = str(tmp_path / "killed.db")
+    posts: list[str] = []
+
+    def kill_during_post(request: httpx.Request) -> httpx.Response:
+        response = fake.handle(request)
+        if request.method == "POST":
+            posts.append(request.url.path)
+        if len(posts) == killed_at:
+            # A hard kill keeps only what was committed: buffered writes never reach the file.
+            with sqlite3.connect(path) as source, sqlite3.connect(killed) as target:
+                source.backup(target)
+            raise SystemExit("killed")
+        return response
+
+    with pytest.raises(SystemExit):
+        apply_blueprint(
+            blueprint,
+            root_page_id="root-page",
+            store=connect_state(path),
+            client=NotionClient(token="tok", transport=httpx.MockTransport(kill_during_post)),
+            audit=AuditLog(tmp_path / "run.jsonl"),
+            run_id="run-1",
+        )
+    store = connect_state(killed)
+    apply_blueprint(
+        blueprint,
+        root_page_id="root-page",
+        store=store,
+        client=NotionClient(token="tok", transport=httpx.MockTransport(fake.handle)),
+        audit=AuditLog(tmp_path / "resumed.jsonl"),
+        run_id="run-1",
+        resume=True,
+    )
+    assert store.query_one("SELECT COUNT(*) FROM objects")[0] == len(fake.known) - 1
+
+
+def test_cli_incremental_apply_after_destroy_recreates_everything(tmp_path, monkeypatch, capsys) -> None:
+    blueprint = _apply_blueprint_fixture()
+    blueprint_path = tmp_path / "blueprint.json"
+    blueprint_path.write_text(blueprint.model_dump_json(), encoding="utf-8")
+    fake = _FakeNotion()
+    posts: list[str] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        if request.method == "POST":
+            posts.append(request.url.path)
+            return fake.handle(request)
+        return httpx.Response(200, json={"id": request.url.path.split("/")[3]})
+
+    def from_env(cls, token: str) -> NotionClient:
+        return cls(token=token, transport=httpx.MockTransport(handle))
+
+    monkeypatch.setattr(NotionClient, "from_env", classmethod(from_env))
+    common = ["--token", "tok", "--state", str(tmp_path / "state.db"), "--audit-dir", str(tmp_path / "audit")]
+    apply = ["notion", "apply", str(blueprint_path), "--root-page-id", "root-page", "--incremental", *common]
+    assert main(apply) == 0
+    created = len(posts)
+    assert main(apply) == 0 and len(posts) == created
+    assert main(["notion", "destroy", *common]) == 0
+    capsys.readouterr()
+    posts.clear()
+    assert main(apply) == 0
+    assert len(posts) == created > 0
+
+
+def test_apply_blueprint_chunks_large_page_bodies(tmp_path) -> None:
+    blueprint = _apply_blueprint_fixture()
+    blocks = [BlockSpec(type="paragraph", text=f"Paragraph {index}") for index in range(230)]
+    blocks[150].text = "x" * 150_000
+    blocks[151].text = "y" * 300_000
+    page = PageSpec(synth_id="page_long", parent_synth_id="root", title="Long read", blocks=blocks)
+    blueprint.notion_plan = NotionPlan(pages=[page])
+    fake = _FakeNotion()
+    sent: list[tuple[str, str, int]] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        assert len(request.content) < 500_000
+        children = json.loads(request.content or b"{}").get("children", [])
+        sent.append((request.method, request.url.path, len(children)))
+        return fake.handle(request)
+
+    client = NotionClient(token="tok", transport=httpx.MockTransport(handle))
+    store = connect_state(":memory:")
+    apply_blueprint(blueprint, root_page_id="root-page", store=store, client=client, audit=AuditLog(tmp_path / "a"))
+
+    remote_id = get_object(store, "page_long")["remote_id"]
+    assert sent == [
+        ("POST", "/v1/pages", 100),
+        ("PATCH", f"/v1/blocks/{remote_id}/children", 51),
+        ("PATCH", f"/v1/blocks/{remote_id}/children", 79),
+    ]
+
+    # A run that dies before the last append: the next apply only appends the missing chunk.
+    def crash_on_last_append(request: httpx.Request) -> httpx.Response:
+        if len(sent) == 2:
+            raise RuntimeError("connection lost")
+        return handle(request)
+
+    sent.clear()
+    store = connect_state(str(tmp_path / "state.db"))
+    with pytest.raises(RuntimeError):
+        apply_blueprint(
+            blueprint,
+            root_page_id="root-page",
+            store=store,
+            client=NotionClient(token="tok", transport=httpx.MockTransport(crash_on_last_append)),
+            audit=AuditLog(tmp_path / "b"),
+        )
+    store = connect_state(str(tmp_path / "state.db"))
+    audit = AuditLog(tmp_path / "c")
+    result = apply_blueprint(blueprint, root_page_id="root-page", store=store, client=client, audit=audit)
+    remote_id = get_object(store, "page_long")["remote_id"]
+    assert sent == [
+        ("POST", "/v1/pages", 100),
+        ("PATCH", f"/v1/blocks/{remote_id}/children", 51),
+        ("GET", f"/v1/blocks/{remote_id}/children", 0),
+        ("PATCH", f"/v1/blocks/{remote_id}/children", 79),
+    ]
+    assert (result.created, result.updated) == (1, 0)
+    assert len(fake.children[remote_id]) == len(blocks)
+
+
+def test_apply_blueprint_resume_skips_block_chunks_that_already_landed(tmp_path) -> None:
+    blueprint = _apply_blueprint_fixture()
+    blocks = [BlockSpec(type="paragraph", text=f"Paragraph {index}") for index in range(230)]
+    page = PageSpec(synth_id="page_long", parent_synth_id="root", title="Long read", blocks=blocks)
+    blueprint.notion_plan = NotionPlan(pages=[page])
+    fake = _FakeNotion()
+    path = str(tmp_path / "state.db")
+    killed = str(tmp_path / "killed.db")
+
+    def kill_after_first_append(request: httpx.Request) -> httpx.Response:
+        response = fake.handle(request)
+        if request.method == "PATCH":
+            # Notion kept the chunk, but the run is killed before its buffered state is committed.
+            with sqlite3.connect(path) as source, sqlite3.connect(killed) as target:
+                source.backup(target)
+            raise SystemExit("killed")
+        return response
+
+    with pytest.raises(SystemExit):
+        apply_blueprint(
+            blueprint,
+            root_page_id="root-page",
+            store=connect_state(path),
+            client=NotionClient(token="tok", transport=httpx.MockTransport(kill_after_first_append)),
+            audit=AuditLog(tmp_path / "run.jsonl"),
+            run_id="run-1",
+        )
+    sent: list[tuple[str, str, int]] = []
+
+    def handle(request: httpx.Request) -> httpx.Response:
+        children = json.loads(request.content or b"{}").get("children", [])
+        sent.append((request.method, request.url.path, len(children)))
+        return fake.handle(request)
+
+    store = connect_state(killed)
+    resumed = apply_blueprint(
+        blueprint,
+        root_page_id="root-page",
+        store=store,
+        client=NotionClient(token="tok", transport=httpx.MockTransport(handle)),
+        audit=AuditLog(tmp_path / "run.jsonl"),
+        run_id="run-1",
+        resume=True,
+    )
+    remote_id = get_object(store, "page_long")["remote_id"]
+    # The unanswered create is adopted, then its listed blocks show the first append already landed.
+    assert sent == [
+        ("GET", "/v1/blocks/root-page/children", 0),
+        ("GET", f"/v1/blocks/{remote_id}/children", 0),
+        ("PATCH", f"/v1/blocks/{remote_id}/children", 30),
+    ]
+    assert len(fake.children[remote_id]) == len(blocks)
+    assert resumed.created == 1
+
+
+def test_graph_client_returns_empty_dict_on_204() -> None:
     token_calls: list[str] = []
-    req_calls: list[tuple[str, str, dict[str, str] | None]] = []
-
-    def fake_post(url: str, *, data: dict[str, str], timeout: float) -> httpx.Response:
-        _ = timeout
-        token_calls.append(url)
-        req = httpx.Request("POST", url)
-        return httpx.Response(200, json={"access_token": "graph_token"}, request=req)
-
-    def fake_request(
-        method: str,
-        url: str,
-        *,
-        headers: dict[str, str] | None = None,
-        json: object | None = None,
-        timeout: float | None = None,
-    ) -> httpx.Response:
-        _ = (json, timeout)
-        req_calls.append((method, url, headers))
-        req = httpx.Request(method, url)
-        return httpx.Response(204, request=req)
-
-    monkeypatch.setattr(httpx, "post", fake_post)
-    monkeypatch.setattr(httpx, "request", fake_request)
-
-    client = GraphClient(tenant_id="t", client_id="c", client_secret="s", max_retries=0, timeout=1)
+    req_calls: list[tuple[str, str, httpx.Headers]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "login.microsoftonline.com":
+            token_calls.append(str(request.url))
+            return httpx.Response(200, json={"access_token": "graph_token", "expires_in": 3600})
+        req_calls.append((request.method, str(request.url), request.headers))
+        return httpx.Response(204)
+
+    client = GraphClient(
+        tenant_id="t",
+        client_id="c",
+        client_secret="s",
+        max_retries=0,
+        timeout=1,
+        transport=httpx.MockTransport(handler),
+    )
     assert client.request("DELETE", "/users/user_123") == {}
     assert token_calls
     assert req_calls
-    assert req_calls[0][2] is not None
+    assert req_calls[0][1] == "https://graph.microsoft.com/v1.0/users/user_123"
     assert req_calls[0][2]["Authorization"] == "Bearer graph_token"
 
 
+def test_graph_client_caches_token_until_expiry_or_401(monkeypatch) -> None:
+    clock = _FakeClock()
+    monkeypatch.setattr(time, "monotonic", clock)
+    tokens: list[str] = []
+    statuses = iter([200, 200, 401, 200, 200, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "login.microsoftonline.com":
+            tokens.append(f"token-{len(tokens)}")
+            return httpx.Response(200, json={"access_token": tokens[-1], "expires_in": 600})
+        return httpx.Response(next(statuses), json={"auth": request.headers["Authorization"]})
+
+    with GraphClient(
+        tenant_id="t",
+        client_id="c",
+        client_secret="s",
+        token_refresh_margin=60,
+        transport=httpx.MockTransport(handler),
+    ) as client:
+        assert client.request("GET", "/users")["auth"] == "Bearer token-0"
+        assert client.request("GET", "/users")["auth"] == "Bearer token-0"
+        # 401 drops the cached token and retries once with a fresh one.
+        assert client.request("GET", "/users")["auth"] == "Bearer token-1"
+        clock.sleep(539)
+        assert client.request("GET", "/users")["auth"] == "Bearer token-1"
+        clock.sleep(2)
+        assert client.request("GET", "/users")["auth"] == "Bearer token-2"
+    assert len(tokens) == 3
+
+
+class _FakeGraph:
+    """Graph tenant behind `$batch`; the first sub-request of the first batch is throttled once."""
+
+    def __init__(self, users: set[str], groups: set[str]) -> None:
+        self.users = {upn: f"id-{upn}" for upn in users}
+        self.groups = {name: f"gid-{name}" for name in groups}
+        self.members: set[tuple[str, str]] = set()
+        self.calls: list[str] = []
+        self.throttled = False
+        self.rejected: set[str] = set()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        if request.url.host == "login.microsoftonline.com":
+            return httpx.Response(200, json={"access_token": "graph_token", "expires_in": 3600})
+        self.calls.append(request.url.path)
+        if request.method == "GET":
+            return self._list(request)
+        assert request.url.path == "/v1.0/$batch"
+        responses = []
+        for item in json.loads(request.content)["requests"]:
+            if not self.throttled:
+                self.throttled = True
+                responses.append({"id": item["id"], "status": 429, "headers": {"Retry-After": "0"}})
+                continue
+            status, body = self._item(item["method"], unquote(item["url"]), item.get("body"))
+            responses.append({"id": item["id"], "status": status, "body": body})
+        return httpx.Response(200, json={"responses": responses[::-1]})
+
+    def _list(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/v1.0/users/$count":
+            assert request.headers["ConsistencyLevel"] == "eventual"
+            return httpx.Response(200, text=str(len(self.users)))
+        if request.url.path == "/v1.0/groups":
+            prefix = request.url.params["$filter"].split("'")[1]
+            values = [{"id": gid, "displayName": name} for name, gid in self.groups.items() if name.startswith(prefix)]
+            return httpx.Response(200, json={"value": values})
+        # Users: two per page, linked through `@odata.nextLink`.
+        skip = int(request.url.params.get("$skiptoken", "0"))
+        users = sorted(self.users.items())
+        page = {"value": [{"id": uid, "userPrincipalName": upn.upper()} for upn, uid in users[skip : skip + 2]]}
+        if skip + 2 < len(users):
+            page["@odata.nextLink"] = f"https://graph.microsoft.com/v1.0/users?$skiptoken={skip + 2}"
+        return httpx.Response(200, json=page)
+
+    def _item(self, method: str, url: str, body):
+        if method == "GET" and url.startswith("/users?$filter=userPrincipalName eq "):
+            upn = url.split("'")[1]
+            return 200, {"value": [{"id": self.users[upn]}] if upn in self.users else []}
+        if method == "GET" and url.startswith("/groups?$filter=displayName eq "):
+            name = url.split("'")[1]
+            return 200, {"value": [{"id": self.groups[name]}] if name in self.groups else []}
+        if method == "POST" and url == "/users" and body["userPrincipalName"] in self.rejected:
+            return 400, {"error": {"message": "Property netId is invalid."}}
+        if method == "POST" and url == "/users":
+            self.users[body["userPrincipalName"]] = f"id-{body['userPrincipalName']}"
+            return 201, {"id": self.users[body["userPrincipalName"]]}
+        if method == "POST" and url == "/groups":
+            self.groups[body["displayName"]] = f"gid-{body['displayName']}"
+            return 201, {"id": self.groups[body["displayName"]]}
+        if method == "POST" and url.endswith("/members/$ref"):
+            pair = (url.split("/")[2], body["@odata.id"].rsplit("/", 1)[1])
+            if pair in self.members:
+                return 400, {"error": {"message": "One or more added object references already exist"}}
+            self.members.add(pair)
+            return 204, None
+        return 404, {"error": {"message": url}}
+
+
+def _entra_roster(count: int) -> list[IdentityUser]:
+    return [
+        IdentityUser(
+            synth_user_id=f"user_{index}",
+            display_name=f"User {index}",
+            given_name="User",
+            surname=str(index),
+            upn=f"user{index}@example.com",
+            email=f"user{index}@example.com",
+            department="Engineering",
+            job_title="Engineer",
+            office_location="Remote",
+            manager_synth_user_id=None,
+            team="Platform" if index % 2 else "SRE",
+        )
+        for index in range(count)
+    ]
+
+
+def test_apply_entra_batches_lookups_creates_and_memberships(monkeypatch) -> None:
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    roster = _entra_roster(50)
+    groups: dict[str, list[IdentityUser]] = {}
+    for user in roster:
+        groups.setdefault(f"SYNTH-Acme-{user.team}", []).append(user)
+    fake = _FakeGraph(users={"user0@example.com", "user1@example.com"}, groups={"SYNTH-Acme-SRE"})
+    fake.members.add(("gid-SYNTH-Acme-SRE", "id-user0@example.com"))
+    client = GraphClient(tenant_id="t", client_id="c", client_secret="s", transport=httpx.MockTransport(fake.handle))
+    store = connect_state(":memory:")
+
+    result = apply_entra(client=client, roster=roster, groups=groups, store=store, prefetch="never")
+
+    assert result.existing_groups == 1
+    assert result.created_groups == 1
+    assert result.existing_users == 2
+    assert result.created_users == 48
+    assert result.memberships_added == 49
+    assert len(fake.members) == 50
+    # groups: 1 lookup + 1 create; users: 3 lookups + 3 creates; members: 3 adds; +1 throttled retry
+    assert len(fake.calls) == 12
+    identity = store.query_one("SELECT entra_object_id FROM identity_map WHERE synth_user_id = ?", ["user_7"])
+    assert identity["entra_object_id"] == "id-user7@example.com"
+
+
+def test_apply_entra_records_successes_before_raising_create_failures(monkeypatch) -> None:
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    roster = _entra_roster(6)
+    groups = {"SYNTH-Acme-Platform": roster}
+    fake = _FakeGraph(users=set(), groups=set())
+    fake.rejected = {"user2@example.com", "user4@example.com"}
+    client = GraphClient(tenant_id="t", client_id="c", client_secret="s", transport=httpx.MockTransport(fake.handle))
+    store = connect_state(":memory:")
+
+    with pytest.raises(EntraApplyError) as raised:
+        apply_entra(client=client, roster=roster, groups=groups, store=store, prefetch="never")
+
+    assert raised.value.failures == [
+        "user user2@example.com: HTTP 400 Property netId is invalid.",
+        "user user4@example.com: HTTP 400 Property netId is invalid.",
+    ]
+    result = raised.value.result
+    assert (result.created_groups, result.created_users, result.memberships_added) == (1, 4, 4)
+    recorded = store.query_all("SELECT synth_user_id FROM identity_map WHERE entra_object_id IS NOT NULL")
+    assert sorted(row[0] for row in recorded) == ["user_0", "user_1", "user_3", "user_5"]
+    assert len(fake.members) == 4
+
+
+def test_apply_entra_prefetches_small_tenant_snapshot(monkeypatch) -> None:
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    roster = _entra_roster(50)
+    groups = {"SYNTH-Acme-SRE": roster[::2], "SYNTH-Acme-Platform": roster[1::2]}
+    fake = _FakeGraph(
+        users={f"user{index}@example.com" for index in range(5)},
+        groups={"SYNTH-Acme-SRE", "Unrelated"},
+    )
+    client = GraphClient(tenant_id="t", client_id="c", client_secret="s", transport=httpx.MockTransport(fake.handle))
+
+    result = apply_entra(client=client, roster=roster, groups=groups, store=connect_state(":memory:"), mode="sync")
+
+    assert result.existing_users == 5
+    assert result.existing_groups == 1
+    assert result.created_users == result.created_groups == 0
+    # $count, three user pages, one prefix-filtered group page, then one membership batch (+1 throttled retry)
+    assert fake.calls == ["/v1.0/users/$count"] + ["/v1.0/users"] * 3 + ["/v1.0/groups"] + ["/v1.0/$batch"] * 2
+
+
+def test_sync_directory_applies_graph_deltas_from_stored_link() -> None:
+    base = "https://graph.microsoft.com/v1.0"
+    users = {"u1": "alex@example.com", "u2": "bianca@example.com", "u3": "casey@example.com"}
+    rounds: dict[str, dict] = {
+        # Initial users round spans two pages.
+        "/users/delta": {
+            "value": [{"id": "u1", "userPrincipalName": users["u1"]}],
+            "@odata.nextLink": f"{base}/users/delta?$skiptoken=p2",
+        },
+        "/users/delta?$skiptoken=p2": {
+            "value": [{"id": "u2", "userPrincipalName": users["u2"]}],
+            "@odata.deltaLink": f"{base}/users/delta?$deltatoken=d1",
+        },
+        "/groups/delta": {
+            "value": [{"id": "g1", "displayName": "SYNTH-Acme-SRE"}],
+            "@odata.deltaLink": f"{base}/groups/delta?$deltatoken=g1",
+        },
+        "/users/delta?$deltatoken=d1": {
+            "value": [{"id": "u3", "userPrincipalName": users["u3"]}, {"id": "u1", "@removed": {"reason": "deleted"}}],
+            "@odata.deltaLink": f"{base}/users/delta?$deltatoken=d2",
+        },
+        "/groups/delta?$deltatoken=g1": {"value": [], "@odata.deltaLink": f"{base}/groups/delta?$deltatoken=g2"},
+    }
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.host == "login.microsoftonline.com":
+            return httpx.Response(200, json={"access_token": "graph_token", "expires_in": 3600})
+        key = unquote(request.url.raw_path.decode()).removeprefix("/v1.0").replace("?$select=id,userPrincipalName", "")
+        key = key.replace("?$select=id,displayName", "")
+        calls.append(key)
+        if key in rounds:
+            return httpx.Response(200, json=rounds[key])
+        return httpx.Response(410, json={"error": {"code": "syncStateNotFound"}})
+
+    client = GraphClient(tenant_id="t", client_id="c", client_secret="s", transport=httpx.MockTransport(handler))
+    store = connect_state(":memory:")
+
+    first = sync_directory(client, store)
+    assert first.find_users_by_upn(["ALEX@example.com", "casey@example.com"]) == {
+        "ALEX@example.com": {"id": "u1", "userPrincipalName": "alex@example.com"},
+        "casey@example.com": None,
+    }
+    assert first.groups["SYNTH-Acme-SRE"] == {"id": "g1", "displayName": "SYNTH-Acme-SRE"}
+
+    calls.clear()
+    second = sync_directory(client, store)
+    assert calls == ["/users/delta?$deltatoken=d1", "/groups/delta?$deltatoken=g1"]
+    assert sorted(second.users) == ["bianca@example.com", "casey@example.com"]
+    assert "SYNTH-Acme-SRE" in second.groups
+
+    # d2 is unknown to the fake tenant (expired): fall back to a full round.
+    calls.clear()
+    third = sync_directory(client, store)
+    assert calls[:2] == ["/users/delta?$deltatoken=d2", "/users/delta"]
+    assert sorted(third.users) == ["alex@example.com", "bianca@example.com"]
+
+
 def test_cli_generate_smoke(capsys) -> None:
     rc = main(
         [
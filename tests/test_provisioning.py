@@ -2,6 +2,7 @@ from dataclasses import dataclass
 
 from notion_synth.blueprint_models import IdentityUser
 from notion_synth.providers.entra.verify import verify_provisioning
+from notion_synth.providers.notion.users import user_directory
 from notion_synth.state import connect_state
 
 
@@ -16,6 +17,15 @@ class FakeGraph:
     def find_group_by_name(self, name: str):
         return {"id": name} if name in self.groups else None
 
+    def count_users(self) -> int:
+        return 100_000
+
+    def find_users_by_upn(self, upns: list[str]):
+        return {upn: self.find_user_by_upn(upn) for upn in upns}
+
+    def find_groups_by_name(self, names: list[str]):
+        return {name: self.find_group_by_name(name) for name in names}
+
 
 @dataclass
 class FakeNotion:
@@ -24,6 +34,9 @@ class FakeNotion:
     def list_users(self):
         return [{"person": {"email": email}, "id": email} for email in self.emails]
 
+    def list_users_page(self, cursor=None):
+        return {"results": self.list_users(), "has_more": False, "next_cursor": None}
+
 
 def test_verify_provisioning_reports_missing() -> None:
     roster = [
@@ -69,3 +82,47 @@ def test_verify_provisioning_reports_missing() -> None:
     assert report.missing_in_entra == ["bianca@example.com"]
     assert report.missing_in_notion == ["bianca@example.com"]
     assert report.missing_groups == ["SYNTH-Acme-SRE"]
+
+
+@dataclass
+class PagedNotion:
+    emails: list[str]
+    calls: int = 0
+
+    def list_users_page(self, cursor=None):
+        self.calls += 1
+        start = int(cursor or 0)
+        users = [{"person": {"email": email}, "id": f"n-{email}"} for email in self.emails[start : start + 100]]
+        more = start + 100 < len(self.emails)
+        return {"results": users, "has_more": more, "next_cursor": str(start + 100) if more else None}
+
+
+def test_user_directory_reuses_cache_and_stops_early() -> None:
+    notion = PagedNotion(emails=[f"user{index}@example.com" for index in range(250)])
+    store = connect_state(":memory:")
+
+    # A roster email that is not provisioned yet forces one full listing (3 pages).
+    directory = user_directory(notion, store, emails=["User5@example.com", "late@example.com"])
+    assert notion.calls == 3
+    assert directory["user5@example.com"] == "n-user5@example.com"
+    assert len(directory) == 250
+
+    # Every wanted email is cached: no requests at all.
+    user_directory(notion, store, emails=["user5@example.com", "user249@example.com"])
+    assert notion.calls == 3
+
+    # Polling for a missing user pages on, within the TTL, until it shows up on a later page.
+    notion.emails.append("late@example.com")
+    polled = user_directory(notion, store, emails=["user5@example.com", "late@example.com"])
+    assert polled["late@example.com"] == "n-late@example.com"
+    assert notion.calls == 6
+
+    # Once the TTL lapses the whole directory is re-listed.
+    assert len(user_directory(notion, store, ttl=0)) == 251
+    assert notion.calls == 9
+
+    # Incremental mode on a cold cache stops as soon as the roster is matched.
+    cold = PagedNotion(emails=notion.emails)
+    partial = user_directory(cold, connect_state(":memory:"), emails=["user7@example.com"])
+    assert cold.calls == 1
+    assert "user7@example.com" in partial
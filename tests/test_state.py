@@ -0,0 +1,77 @@
+import sqlite3
+
+import pytest
+
+from notion_synth.state import (
+    connect_state,
+    get_identity,
+    get_object,
+    preloaded,
+    upsert_identity,
+    upsert_object,
+)
+
+
+def _upsert(store, synth_id: str, remote_id: str) -> None:
+    upsert_object(
+        store,
+        synth_id,
+        kind="page",
+        provider="notion",
+        remote_id=remote_id,
+        parent_synth_id=None,
+        spec_hash="hash",
+    )
+
+
+def test_preloaded_serves_lookups_from_memory_and_writes_through() -> None:
+    store = connect_state(":memory:")
+    _upsert(store, "page_a", "remote-a")
+    upsert_identity(store, "user_a", notion_user_id="notion-a")
+    queries: list[str] = []
+    store.connection.set_trace_callback(queries.append)
+
+    with preloaded(store, [f"page_{index}" for index in range(1200)] + ["page_a"]):
+        queries.clear()
+        assert get_object(store, "page_a")["remote_id"] == "remote-a"
+        assert get_object(store, "page_7") is None
+        assert get_identity(store, "user_a")["notion_user_id"] == "notion-a"
+        assert not queries
+
+        _upsert(store, "page_7", "remote-7")
+        upsert_identity(store, "user_a", entra_object_id="entra-a")
+        queries.clear()
+        assert get_object(store, "page_7")["remote_id"] == "remote-7"
+        cached = get_identity(store, "user_a")
+        assert (cached["notion_user_id"], cached["entra_object_id"]) == ("notion-a", "entra-a")
+        assert not queries
+
+    on_disk = get_identity(store, "user_a")
+    assert (on_disk["notion_user_id"], on_disk["entra_object_id"]) == ("notion-a", "entra-a")
+    assert get_object(store, "page_7")["remote_id"] == "remote-7"
+
+
+def test_batched_writes_commit_in_groups_and_flush_on_error(tmp_path) -> None:
+    path = str(tmp_path / "state.db")
+    store = connect_state(path)
+    assert store.query_one("PRAGMA journal_mode")[0] == "wal"
+    reader = sqlite3.connect(path)
+
+    def committed() -> int:
+        return reader.execute("SELECT COUNT(*) FROM objects").fetchone()[0]
+
+    with store.batched(max_items=3, max_delay=60):
+        _upsert(store, "page_1", "remote-1")
+        _upsert(store, "page_2", "remote-2")
+        assert committed() == 0
+        _upsert(store, "page_3", "remote-3")
+        assert committed() == 3
+        _upsert(store, "page_4", "remote-4")
+        # Reads through the store see buffered writes.
+        assert get_object(store, "page_4")["remote_id"] == "remote-4"
+        assert committed() == 4
+
+    with pytest.raises(RuntimeError), store.batched(max_items=100, max_delay=60):
+        _upsert(store, "page_5", "remote-5")
+        raise RuntimeError("remote call failed")
+    assert committed() == 5